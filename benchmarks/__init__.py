@@ -0,0 +1,20 @@
+# Benchmarks del sistema e-learning.
+#
+#   python -m benchmarks.ejecutar   escenarios de carga, guardado, inscripción y búsqueda
+#   python -m benchmarks.memoria    memoria de las representaciones de entidades
+#   python -m benchmarks.instantanea  arranque en frío desde el JSON y desde la instantánea binaria
+#   python -m benchmarks.concurrencia varios procesos escribiendo en la misma carpeta de datos
+#   python -m benchmarks.servidor   peticiones por segundo y latencia de la API HTTP
+
+import importlib
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Importa el paquete `elearning` (el núcleo, sin interfaz gráfica) desde la raíz del proyecto.
+def cargar_modulo():
+    if RAIZ not in sys.path:
+        sys.path.insert(0, RAIZ)
+    return importlib.import_module("elearning")
@@ -0,0 +1,92 @@
+# Varios procesos escribiendo a la vez en la misma carpeta de datos con compartido=True. Cada proceso
+# registra estudiantes propios, les agrega materiales e intenta inscribirlos; al final se recarga la
+# carpeta y se comprueba que no se perdió ninguna escritura. Informa operaciones por segundo, latencia
+# y cuántas veces un proceso tuvo que recargar todo por haber quedado atrás de dos checkpoints.
+#
+# Uso: python -m benchmarks.concurrencia [--procesos 1 4 8] [--operaciones 300] [--tamano 10000]
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks import cargar_modulo
+from benchmarks.escenarios import preparar_archivos
+from benchmarks.generador import generar_datos
+
+# Los ids propios de cada proceso empiezan aquí, lejos de los del generador.
+BASE_IDS = 10 ** 8
+
+
+def trabajador(numero, operaciones, formato, cola):
+    modulo = cargar_modulo()
+    sistema = modulo.SistemaELearning(formato=formato, compartido=True)
+    azar = random.Random(numero)
+    cursos = list(sistema.cursos)
+    latencias = []
+    exitos = 0
+    for i in range(operaciones):
+        id = BASE_IDS * (numero + 1) + i
+        inicio = time.perf_counter()
+        sistema.registrar_estudiante(id, f"Concurrente {numero}-{i}", f"c{numero}-{i}@example.com")
+        sistema.agregar_material(azar.choice(cursos), modulo.Material(id, f"Material {id}", "PDF", "https://example.com"))
+        exitos += sistema.inscribir_estudiante(id, azar.choice(cursos), capacidad_maxima=float("inf")) is True
+        latencias.append(time.perf_counter() - inicio)
+    recargas = sistema.metricas()["carga.reconstruir"]["llamadas"] - 1
+    cola.put((latencias, exitos, recargas))
+
+
+def corrida(modulo, procesos, operaciones, formato):
+    cola = multiprocessing.Queue()
+    hijos = [
+        multiprocessing.Process(target=trabajador, args=(n, operaciones, formato, cola)) for n in range(procesos)
+    ]
+    inicio = time.perf_counter()
+    for hijo in hijos:
+        hijo.start()
+    resultados = [cola.get() for _ in hijos]
+    for hijo in hijos:
+        hijo.join()
+    duracion = time.perf_counter() - inicio
+
+    final = modulo.SistemaELearning(formato=formato, compartido=True)
+    registrados = sum(1 for id in final.estudiantes if id >= BASE_IDS)
+    materiales = sum(1 for id in final.indice_materiales if id >= BASE_IDS)
+    inscritos = sum(len(final.estudiantes[id].cursos) for id in final.estudiantes if id >= BASE_IDS)
+    esperados = procesos * operaciones
+    latencias = sorted(l for resultado in resultados for l in resultado[0])
+    perdidas = (esperados - registrados) + (esperados - materiales) + (sum(r[1] for r in resultados) - inscritos)
+    print(f"  {procesos:2d} procesos  {3 * esperados / duracion:9.0f} ops/s   "
+          f"p50 {statistics.median(latencias) * 1e3:7.2f} ms   p99 {latencias[int(len(latencias) * 0.99)] * 1e3:8.2f} ms   "
+          f"recargas {sum(r[2] for r in resultados):3d}   escrituras perdidas {perdidas}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escrituras concurrentes de varios procesos sobre la misma carpeta.")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--operaciones", type=int, default=300, help="iteraciones por proceso (3 escrituras cada una)")
+    parser.add_argument("--tamano", type=int, default=10000, help="número de estudiantes del conjunto inicial")
+    parser.add_argument("--formato", choices=["json", "binario", "fragmentado"], default="json")
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    modulo = cargar_modulo()
+    datos = generar_datos(args.tamano, semilla=args.semilla)
+    print(f"{args.tamano} estudiantes, formato {args.formato}")
+    for procesos in args.procesos:
+        with tempfile.TemporaryDirectory(prefix="elearning_bench_") as directorio:
+            anterior = os.getcwd()
+            os.chdir(directorio)
+            try:
+                os.makedirs(modulo.data_folder, exist_ok=True)
+                preparar_archivos(modulo, datos)
+                corrida(modulo, procesos, args.operaciones, args.formato)
+            finally:
+                os.chdir(anterior)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# Ejecuta los escenarios de benchmark a varios tamaños y guarda los resultados en JSON.
+#
+# Uso: python -m benchmarks.ejecutar [--tamanos 1000 100000 1000000] [--salida resultados.json]
+#                                    [--comparar resultados_anteriores.json]
+#
+# Cada tamaño corre en un directorio temporal propio, así que no toca la carpeta data/ del proyecto.
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+
+from benchmarks import RAIZ, cargar_modulo
+from benchmarks.escenarios import ESCENARIOS, preparar_archivos
+from benchmarks.generador import cursos_para, generar_datos
+
+
+def percentil(valores_ordenados, p):
+    indice = min(len(valores_ordenados) - 1, max(0, round(p / 100 * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+
+def resumir(latencias):
+    ordenadas = sorted(latencias)
+    total = sum(ordenadas)
+    return {
+        "operaciones": len(ordenadas),
+        "total_s": total,
+        "ops_por_s": len(ordenadas) / total if total else None,
+        "p50_ms": percentil(ordenadas, 50) * 1e3,
+        "p95_ms": percentil(ordenadas, 95) * 1e3,
+        "p99_ms": percentil(ordenadas, 99) * 1e3,
+        "max_ms": ordenadas[-1] * 1e3
+    }
+
+
+def ejecutar_tamano(modulo, tamano, semilla, operaciones):
+    datos = generar_datos(tamano, semilla=semilla)
+    with tempfile.TemporaryDirectory(prefix="elearning_bench_") as directorio:
+        anterior = os.getcwd()
+        os.chdir(directorio)
+        try:
+            os.makedirs(modulo.data_folder, exist_ok=True)
+            preparar_archivos(modulo, datos)
+            del datos
+            contexto = {"modulo": modulo, "sistema": None, "azar": random.Random(semilla), "operaciones": operaciones}
+            resultados = {}
+            for nombre, escenario in ESCENARIOS:
+                resultados[nombre] = resumir(escenario(contexto))
+                print(f"  {nombre:<26} p50 {resultados[nombre]['p50_ms']:10.3f} ms   "
+                      f"p99 {resultados[nombre]['p99_ms']:10.3f} ms")
+            return resultados
+        finally:
+            os.chdir(anterior)
+
+
+def version_actual():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Imprime cuánto cambió el p50 de cada escenario respecto de una corrida anterior.
+def comparar(actual, ruta_anterior):
+    with open(ruta_anterior, "r", encoding="utf-8") as f:
+        anterior = json.load(f)
+    print(f"Comparación con {ruta_anterior} ({anterior.get('version')}):")
+    for tamano, escenarios in actual["resultados"].items():
+        previos = anterior["resultados"].get(tamano, {})
+        for nombre, resumen in escenarios.items():
+            if nombre in previos and previos[nombre]["p50_ms"]:
+                razon = resumen["p50_ms"] / previos[nombre]["p50_ms"]
+                print(f"  {tamano:>8} {nombre:<26} p50 x{razon:6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks del sistema e-learning.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[1000, 100000],
+                        help="número de estudiantes por corrida (1000000 para la corrida grande)")
+    parser.add_argument("--operaciones", type=int, default=1000)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--salida", default="resultados_benchmark.json")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    args = parser.parse_args()
+
+    salida = os.path.abspath(args.salida)
+    anterior = os.path.abspath(args.comparar) if args.comparar else None
+
+    modulo = cargar_modulo()
+
+    resultado = {
+        "version": version_actual(),
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "semilla": args.semilla,
+        "operaciones": args.operaciones,
+        "resultados": {}
+    }
+    for tamano in args.tamanos:
+        print(f"{tamano} estudiantes, {cursos_para(tamano)} cursos")
+        resultado["resultados"][str(tamano)] = ejecutar_tamano(modulo, tamano, args.semilla, args.operaciones)
+
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(resultado, f, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en {salida}")
+
+    if anterior:
+        comparar(resultado, anterior)
+
+
+if __name__ == "__main__":
+    main()
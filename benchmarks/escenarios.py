@@ -0,0 +1,105 @@
+# Escenarios de benchmark. Cada escenario recibe el contexto de la corrida (módulo, sistema,
+# generador aleatorio y número de operaciones) y retorna la latencia en segundos de cada operación.
+
+import json
+import os
+import time
+
+from benchmarks.generador import NIVELES, TEMAS
+
+
+def _cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+
+# Escribe los datos generados como el JSON del sistema y borra diario e historial de corridas previas.
+def preparar_archivos(modulo, datos):
+    for ruta in (modulo.ruta_diario, modulo.ruta_historial):
+        if os.path.exists(ruta):
+            os.remove(ruta)
+    with open(modulo.ruta_json, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False)
+
+
+# Construye el sistema desde el JSON (cargar_desde_json) y lo deja en el contexto para los demás escenarios.
+def carga_fria(contexto):
+    inicio = time.perf_counter()
+    contexto["sistema"] = contexto["modulo"].SistemaELearning()
+    return [time.perf_counter() - inicio]
+
+
+def guardado(contexto):
+    sistema = contexto["sistema"]
+    return [_cronometrar(sistema.guardar_en_json) for _ in range(3)]
+
+
+# Cambios de URL de materiales con el formato fragmentado y sin diario: cada uno se guarda al momento,
+# pero solo reescribe el archivo de su curso. Usa un sistema aparte, creado desde el mismo JSON.
+def guardado_fragmentado(contexto):
+    modulo, azar = contexto["modulo"], contexto["azar"]
+    sistema = modulo.SistemaELearning(usar_diario=False, formato="fragmentado")
+    sistema.guardar_en_json()
+    materiales = list(sistema.indice_materiales)
+    return [
+        _cronometrar(sistema.actualizar_material, azar.choice(materiales), None, None, f"https://example.com/v{i}")
+        for i in range(contexto["operaciones"])
+    ]
+
+
+# Inscripciones sueltas como las haría la interfaz: cada una pasa por el diario.
+def inscripciones(contexto):
+    sistema, azar = contexto["sistema"], contexto["azar"]
+    estudiantes, cursos = list(sistema.estudiantes), list(sistema.cursos)
+    return [
+        _cronometrar(sistema.inscribir_estudiante, azar.choice(estudiantes), azar.choice(cursos))
+        for _ in range(contexto["operaciones"])
+    ]
+
+
+# Llena la lista de espera del curso sin prerequisitos más popular y cancela inscritos,
+# de modo que cada cancelación promueve a alguien de la cola.
+def cancelaciones_con_espera(contexto):
+    sistema, azar = contexto["sistema"], contexto["azar"]
+    libres = [c for c in sistema.cursos.values() if not c.prerequisitos]
+    curso = max(libres, key=lambda c: len(c.estudiantes))
+    inscritos = list(curso.estudiantes)
+    azar.shuffle(inscritos)
+    inscritos = inscritos[:contexto["operaciones"]]
+    candidatos = [e for e in sistema.estudiantes.values() if curso not in e.cursos]
+    with sistema.transaccion(reversible=False):
+        for estudiante in azar.sample(candidatos, min(len(inscritos), len(candidatos))):
+            sistema.inscribir_estudiante(estudiante.id, curso.id, capacidad_maxima=0)
+    return [_cronometrar(sistema.cancelar_inscripcion, e.id, curso.id) for e in inscritos]
+
+
+def buscar_cursos(contexto):
+    sistema, azar = contexto["sistema"], contexto["azar"]
+    terminos = [t.lower() for t in TEMAS] + [t[:4].lower() for t in TEMAS]
+    niveles = ["Todos"] + NIVELES
+    return [
+        _cronometrar(sistema.buscar_cursos, azar.choice(terminos), azar.choice(niveles))
+        for _ in range(contexto["operaciones"])
+    ]
+
+
+def recomendar_cursos(contexto):
+    sistema, azar = contexto["sistema"], contexto["azar"]
+    cursos = list(sistema.cursos)
+    return [
+        _cronometrar(sistema.recomendar_cursos, azar.choice(cursos))
+        for _ in range(contexto["operaciones"])
+    ]
+
+
+# En orden: la carga fría crea el sistema que usan los siguientes.
+ESCENARIOS = [
+    ("carga_fria", carga_fria),
+    ("guardado", guardado),
+    ("guardado_fragmentado", guardado_fragmentado),
+    ("inscripciones", inscripciones),
+    ("cancelaciones_con_espera", cancelaciones_con_espera),
+    ("buscar_cursos", buscar_cursos),
+    ("recomendar_cursos", recomendar_cursos),
+]
@@ -0,0 +1,90 @@
+# Generador de datos sintéticos para los benchmarks, con semilla fija para que las corridas
+# sean comparables. Produce el mismo formato que guarda SistemaELearning.guardar_en_json:
+# los cursos se reparten en capas y cada curso toma sus prerequisitos de capas anteriores
+# (un grafo sin ciclos), y la popularidad de los cursos sigue una ley de potencias.
+
+import bisect
+import itertools
+import random
+
+TEMAS = [
+    "Python", "Java", "Bases de Datos", "Redes", "Algoritmos", "Estadística", "Machine Learning",
+    "Desarrollo Web", "Seguridad", "Sistemas Operativos", "Cálculo", "Diseño UX"
+]
+NIVELES = ["Básico", "Intermedio", "Avanzado"]
+TIPOS = ["PDF", "Video", "Enlace", "Presentación"]
+
+
+# Cantidad de cursos por defecto para un número de estudiantes.
+def cursos_para(estudiantes):
+    return max(30, estudiantes // 100)
+
+
+def generar_datos(estudiantes, cursos=None, semilla=42, capas=6, materiales_por_curso=4,
+                  inscripciones_por_estudiante=3, sesgo=1.1):
+    azar = random.Random(semilla)
+    cursos = cursos or cursos_para(estudiantes)
+    capas = max(1, min(capas, cursos))
+
+    ids_por_capa = [[] for _ in range(capas)]
+    lista_cursos = []
+    id_material = itertools.count(1)
+    for i in range(cursos):
+        curso_id = i + 1
+        capa = i * capas // cursos
+        tema = TEMAS[i % len(TEMAS)]
+        nivel = NIVELES[min(len(NIVELES) - 1, capa * len(NIVELES) // capas)]
+        prerequisitos = []
+        if capa > 0:
+            anteriores = ids_por_capa[capa - 1]
+            if azar.random() < 0.2:
+                anteriores = ids_por_capa[azar.randrange(capa)]
+            prerequisitos = azar.sample(anteriores, min(azar.choice([1, 1, 2, 2, 3]), len(anteriores)))
+        ids_por_capa[capa].append(curso_id)
+        lista_cursos.append({
+            "id": curso_id,
+            "nombre": f"{tema} {nivel} {curso_id}",
+            "descripcion": f"Curso {curso_id} de {tema.lower()}",
+            "nivel": nivel,
+            "materiales": [
+                {
+                    "id": material_id,
+                    "nombre": f"Material {material_id}",
+                    "tipo": azar.choice(TIPOS),
+                    "url": f"https://example.com/materiales/{material_id}"
+                }
+                for material_id in itertools.islice(id_material, azar.randint(0, 2 * materiales_por_curso))
+            ],
+            "estudiantes": [],
+            "prerequisitos": prerequisitos
+        })
+
+    # Popularidad Zipf: el curso de rango r recibe un peso 1 / r^sesgo, con los rangos mezclados.
+    rangos = list(range(1, cursos + 1))
+    azar.shuffle(rangos)
+    acumulados = list(itertools.accumulate(1 / rango ** sesgo for rango in rangos))
+    total = acumulados[-1]
+
+    lista_estudiantes = []
+    for estudiante_id in range(1, estudiantes + 1):
+        elegidos = set()
+        for _ in range(azar.randint(1, 2 * inscripciones_por_estudiante - 1)):
+            elegidos.add(min(bisect.bisect_left(acumulados, azar.random() * total), cursos - 1))
+        for indice in sorted(elegidos):
+            lista_cursos[indice]["estudiantes"].append(estudiante_id)
+        lista_estudiantes.append({
+            "id": estudiante_id,
+            "nombre": f"Estudiante {estudiante_id}",
+            "email": f"estudiante{estudiante_id}@example.com",
+            "cursos": [lista_cursos[indice]["id"] for indice in sorted(elegidos)]
+        })
+
+    return {
+        "estudiantes": lista_estudiantes,
+        "cursos": lista_cursos,
+        "cursos_eliminados": [],
+        "materiales_eliminados": [],
+        "prerequisitos_eliminados": {},
+        "listas_espera": {},
+        "secuencia_diario": 0
+    }
@@ -0,0 +1,55 @@
+# Compara el arranque en frío con el JSON y con la instantánea binaria, sobre los mismos datos
+# generados con semilla fija. Cada carga se repite y se informa la mejor y la mediana.
+#
+# Uso: python -m benchmarks.instantanea [--tamanos 10000 100000] [--repeticiones 5]
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks import cargar_modulo
+from benchmarks.escenarios import preparar_archivos
+from benchmarks.generador import cursos_para, generar_datos
+
+
+def cronometrar_carga(modulo, directorio, formato, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        modulo.SistemaELearning(directorio_datos=directorio, formato=formato)
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arranque en frío: JSON contra instantánea binaria.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10000, 100000],
+                        help="número de estudiantes por corrida")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    modulo = cargar_modulo()
+    for tamano in args.tamanos:
+        print(f"{tamano} estudiantes, {cursos_para(tamano)} cursos")
+        with tempfile.TemporaryDirectory(prefix="elearning_bench_") as directorio:
+            anterior = os.getcwd()
+            os.chdir(directorio)
+            try:
+                os.makedirs(modulo.data_folder, exist_ok=True)
+                preparar_archivos(modulo, generar_datos(tamano, semilla=args.semilla))
+                # El JSON de preparar_archivos no tiene sangría; se reescribe como lo deja guardar_en_json.
+                modulo.SistemaELearning(directorio_datos=modulo.data_folder).guardar_en_json()
+                modulo.json_a_instantanea(modulo.ruta_json, modulo.ruta_instantanea)
+                for formato, ruta in (("json", modulo.ruta_json), ("binario", modulo.ruta_instantanea)):
+                    tiempos = cronometrar_carga(modulo, modulo.data_folder, formato, args.repeticiones)
+                    print(f"  {formato:<8} {os.path.getsize(ruta) / 2 ** 20:8.1f} MiB   "
+                          f"mejor {min(tiempos) * 1e3:9.1f} ms   mediana {statistics.median(tiempos) * 1e3:9.1f} ms")
+            finally:
+                os.chdir(anterior)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Reporte de memoria de las entidades del sistema e-learning.
+# Compara objetos con __dict__ (la representación anterior) con las clases con __slots__, sobre un
+# conjunto de datos generado con semilla fija.
+#
+# Uso: python -m benchmarks.memoria [--estudiantes N] [--cursos N] [--materiales N]
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from benchmarks import cargar_modulo
+
+NIVELES = ["Básico", "Intermedio", "Avanzado"]
+TIPOS = ["PDF", "Video", "Enlace", "Presentación"]
+
+
+# Versiones con __dict__ de las entidades, tal como estaban antes de usar __slots__.
+class CursoDict:
+    def __init__(self, id, nombre, descripcion, nivel):
+        self.id = id
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.nivel = nivel
+        self.materiales = []
+        self.estudiantes = []
+        self.prerequisitos = []
+
+    def agregar_material(self, material):
+        self.materiales.append(material)
+
+
+class MaterialDict:
+    def __init__(self, id, nombre, tipo, url):
+        self.id = id
+        self.nombre = nombre
+        self.tipo = tipo
+        self.url = url
+
+
+class EstudianteDict:
+    def __init__(self, id, nombre, email):
+        self.id = id
+        self.nombre = nombre
+        self.email = email
+        self.cursos = []
+        self.mascara_cursos = 0
+
+
+# Genera las filas crudas una sola vez para que todas las variantes midan los mismos datos.
+# Pasan por JSON para que cada texto sea un objeto distinto, como al cargar el archivo de datos.
+def generar(estudiantes, cursos, materiales, semilla=42):
+    azar = random.Random(semilla)
+    filas_estudiantes = [(i, f"Estudiante {i}", f"estudiante{i}@example.com") for i in range(1, estudiantes + 1)]
+    filas_cursos = [
+        (i, f"Curso {i}", f"Descripción del curso {i}", azar.choice(NIVELES))
+        for i in range(1, cursos + 1)
+    ]
+    filas_materiales = [
+        (i, f"Material {i}", azar.choice(TIPOS), f"https://example.com/m/{i}", azar.randint(1, cursos))
+        for i in range(1, materiales + 1)
+    ]
+    filas = json.loads(json.dumps([filas_estudiantes, filas_cursos, filas_materiales]))
+    return [[tuple(f) for f in grupo] for grupo in filas]
+
+
+# Retorna los bytes que quedan vivos después de construir lo que devuelva `construir`.
+def medir(construir):
+    gc.collect()
+    tracemalloc.start()
+    resultado = construir()
+    gc.collect()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return actual
+
+
+def construir_objetos(clases, filas):
+    clase_estudiante, clase_curso, clase_material = clases
+    filas_estudiantes, filas_cursos, filas_materiales = filas
+    estudiantes = [clase_estudiante(*f) for f in filas_estudiantes]
+    cursos = {f[0]: clase_curso(*f) for f in filas_cursos}
+    for id, nombre, tipo, url, curso_id in filas_materiales:
+        cursos[curso_id].agregar_material(clase_material(id, nombre, tipo, url))
+    return estudiantes, cursos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara la memoria de las representaciones de entidades.")
+    parser.add_argument("--estudiantes", type=int, default=100_000)
+    parser.add_argument("--cursos", type=int, default=5_000)
+    parser.add_argument("--materiales", type=int, default=500_000)
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    modulo = cargar_modulo()
+    filas = generar(args.estudiantes, args.cursos, args.materiales, args.semilla)
+
+    variantes = [
+        ("objetos con __dict__", lambda: construir_objetos((EstudianteDict, CursoDict, MaterialDict), filas)),
+        ("__slots__", lambda: construir_objetos((modulo.Estudiante, modulo.Curso, modulo.Material), filas)),
+    ]
+
+    print(f"{args.estudiantes} estudiantes, {args.cursos} cursos, {args.materiales} materiales")
+    base = None
+    for nombre, construir in variantes:
+        total = medir(construir)
+        base = base or total
+        print(f"  {nombre:<30} {total / 2 ** 20:10.1f} MiB  ({total / base:6.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Rendimiento de la API HTTP (elearning.servidor): el servidor corre en su propio proceso sobre datos
+# generados con semilla fija y K procesos cliente le mandan peticiones por conexiones keep-alive durante
+# un tiempo fijo. La mezcla es mayormente de lecturas (curso, estudiante, búsqueda, ruta) con una
+# fracción de escrituras (alta de estudiante, cambio de URL de un material). Informa peticiones por
+# segundo y latencias de lectura y de escritura vistas desde el cliente.
+#
+# Uso: python -m benchmarks.servidor [--clientes 1 4 16] [--duracion 5] [--escrituras 0.1] [--sin-confirmar]
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+from urllib.parse import quote
+
+from benchmarks import cargar_modulo
+from benchmarks.escenarios import preparar_archivos
+from benchmarks.generador import TEMAS, generar_datos
+
+# Los estudiantes que dan de alta los clientes empiezan aquí, lejos de los del generador.
+BASE_IDS = 10 ** 8
+
+
+def proceso_servidor(directorio, confirmar, cola):
+    modulo = cargar_modulo()
+    from elearning.servidor import ServidorAPI
+    sistema = modulo.SistemaELearning(directorio_datos=directorio, guardado_asincrono=True)
+    servidor = ServidorAPI(("127.0.0.1", 0), sistema, confirmar)
+    cola.put(servidor.server_address[1])
+    servidor.serve_forever()
+
+
+def proceso_cliente(numero, puerto, duracion, escrituras, estudiantes, cursos, materiales, cola):
+    azar = random.Random(numero)
+    conexion = http.client.HTTPConnection("127.0.0.1", puerto)
+    lecturas, escritas, errores = [], [], 0
+    fin = time.perf_counter() + duracion
+    i = 0
+    while time.perf_counter() < fin:
+        if azar.random() < escrituras:
+            i += 1
+            if i % 2:
+                id = BASE_IDS + numero * 10 ** 6 + i
+                peticion = ("POST", "/estudiantes", {"id": id, "nombre": f"Cliente {id}", "email": f"c{id}@example.com"})
+            else:
+                peticion = ("PATCH", f"/materiales/{azar.randint(1, materiales)}", {"url": f"https://example.com/{numero}/{i}"})
+            tiempos = escritas
+        else:
+            eleccion = azar.random()
+            if eleccion < 0.4:
+                peticion = ("GET", f"/cursos/{azar.randint(1, cursos)}", None)
+            elif eleccion < 0.8:
+                peticion = ("GET", f"/estudiantes/{azar.randint(1, estudiantes)}", None)
+            elif eleccion < 0.9:
+                peticion = ("GET", f"/buscar?tema={quote(azar.choice(TEMAS)[:4])}&cantidad=20", None)
+            else:
+                peticion = ("GET", f"/ruta?objetivos={azar.randint(1, cursos)}", None)
+            tiempos = lecturas
+        metodo, camino, cuerpo = peticion
+        inicio = time.perf_counter()
+        conexion.request(metodo, camino, body=None if cuerpo is None else json.dumps(cuerpo),
+                         headers={"Content-Type": "application/json"})
+        respuesta = conexion.getresponse()
+        respuesta.read()
+        tiempos.append(time.perf_counter() - inicio)
+        errores += respuesta.status >= 400
+    conexion.close()
+    cola.put((lecturas, escritas, errores))
+
+
+def percentiles(tiempos):
+    if not tiempos:
+        return "        -"
+    tiempos = sorted(tiempos)
+    return (f"p50 {statistics.median(tiempos) * 1e3:6.2f} ms  "
+            f"p99 {tiempos[min(len(tiempos) - 1, int(len(tiempos) * 0.99))] * 1e3:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peticiones por segundo y latencia de la API HTTP.")
+    parser.add_argument("--clientes", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--duracion", type=float, default=5.0, help="segundos por corrida")
+    parser.add_argument("--escrituras", type=float, default=0.1, help="fracción de peticiones que escriben")
+    parser.add_argument("--tamano", type=int, default=10000, help="número de estudiantes del conjunto inicial")
+    parser.add_argument("--sin-confirmar", action="store_true",
+                        help="el servidor responde las escrituras sin esperar a que estén en disco")
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    modulo = cargar_modulo()
+    datos = generar_datos(args.tamano, semilla=args.semilla)
+    cursos = len(datos["cursos"])
+    materiales = max(m["id"] for c in datos["cursos"] for m in c["materiales"])
+    print(f"{args.tamano} estudiantes, {cursos} cursos, {args.escrituras:.0%} escrituras, "
+          f"{'sin' if args.sin_confirmar else 'con'} confirmación en disco")
+    with tempfile.TemporaryDirectory(prefix="elearning_bench_") as directorio:
+        anterior = os.getcwd()
+        os.chdir(directorio)
+        servidor = None
+        try:
+            os.makedirs(modulo.data_folder, exist_ok=True)
+            preparar_archivos(modulo, datos)
+            cola = multiprocessing.Queue()
+            servidor = multiprocessing.Process(
+                target=proceso_servidor, args=(os.path.abspath(modulo.data_folder), not args.sin_confirmar, cola)
+            )
+            servidor.start()
+            puerto = cola.get(timeout=300)
+            numero = 0
+            for cantidad in args.clientes:
+                clientes = []
+                for _ in range(cantidad):
+                    clientes.append(multiprocessing.Process(target=proceso_cliente, args=(
+                        numero, puerto, args.duracion, args.escrituras, args.tamano, cursos, materiales, cola
+                    )))
+                    numero += 1
+                for cliente in clientes:
+                    cliente.start()
+                resultados = [cola.get(timeout=args.duracion + 300) for _ in clientes]
+                for cliente in clientes:
+                    cliente.join()
+                lecturas = [t for r in resultados for t in r[0]]
+                escritas = [t for r in resultados for t in r[1]]
+                print(f"  {cantidad:3d} clientes  {(len(lecturas) + len(escritas)) / args.duracion:8.0f} pet/s   "
+                      f"lectura {percentiles(lecturas)}   escritura {percentiles(escritas)}   "
+                      f"errores {sum(r[2] for r in resultados)}")
+        finally:
+            if servidor is not None:
+                servidor.terminate()
+                servidor.join()
+            os.chdir(anterior)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# Núcleo del sistema de gestión e-learning: estructuras, grafo de prerequisitos, entidades,
+# persistencia y SistemaELearning. No depende de tkinter ni escribe en disco al importarse.
+# La API HTTP (elearning.servidor) no se importa aquí: arrastra http.server y solo la usa `servir`.
+
+from .entidades import Curso, Estudiante, Material
+from .estructuras import (
+    ArbolBusqueda, Cola, ConjuntoOrdenado, IndiceTrigramas, ListaEspera, Pila, TramoOrdenado, TramosConcatenados
+)
+from .fragmentos import CambiosPendientes, DirectorioFragmentado
+from .grafo import Grafo
+from .historial import HistorialCambios
+from .instantanea import FilasJSON, LectorInstantanea, escribir_instantanea, instantanea_a_json, json_a_instantanea
+from .importacion import COLUMNAS, ResultadoImportacion, exportar_csv, importar_csv
+from .metricas import HistogramaLatencias, Metricas
+from .persistencia import (
+    ARCHIVO_CERROJO, ARCHIVO_DIARIO, ARCHIVO_FRAGMENTOS, ARCHIVO_HISTORIAL, ARCHIVO_INSTANTANEA, ARCHIVO_JSON,
+    ARCHIVO_SQLITE, AlmacenSQLite, CerrojoArchivo, DiarioCambios, data_folder, ruta_diario, ruta_fragmentos, ruta_historial, ruta_instantanea,
+    ruta_json, ruta_sqlite
+)
+from .sistema import SistemaELearning
+
+__all__ = [
+    "AlmacenSQLite", "ArbolBusqueda", "ARCHIVO_CERROJO", "ARCHIVO_DIARIO", "ARCHIVO_FRAGMENTOS", "ARCHIVO_HISTORIAL",
+    "ARCHIVO_INSTANTANEA", "ARCHIVO_JSON", "ARCHIVO_SQLITE", "COLUMNAS", "CambiosPendientes", "CerrojoArchivo",
+    "Cola", "ConjuntoOrdenado", "Curso", "DiarioCambios", "DirectorioFragmentado", "Estudiante", "FilasJSON", "Grafo",
+    "HistogramaLatencias", "HistorialCambios", "IndiceTrigramas", "LectorInstantanea", "ListaEspera", "Material",
+    "Metricas", "Pila", "ResultadoImportacion", "SistemaELearning", "TramoOrdenado", "TramosConcatenados",
+    "data_folder", "escribir_instantanea", "exportar_csv", "importar_csv", "instantanea_a_json", "json_a_instantanea",
+    "ruta_diario", "ruta_fragmentos", "ruta_historial", "ruta_instantanea", "ruta_json", "ruta_sqlite"
+]
@@ -0,0 +1,7 @@
+# Permite ejecutar la línea de comandos con `python -m elearning`.
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
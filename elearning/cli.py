@@ -0,0 +1,269 @@
+# Línea de comandos del sistema e-learning, sin interfaz gráfica.
+#
+#   python -m elearning inscribir 1 101
+#   python -m elearning cohorte 101 1 2 3 --capacidad 40
+#   python -m elearning buscar python --nivel Básico
+#   python -m elearning ruta 301 --estudiante 1
+#   python -m elearning desbloquea 101
+#   python -m elearning script operaciones.txt     (un comando por línea, "-" para stdin)
+#   python -m elearning importar estudiantes alumnos.csv --reporte errores.csv
+#   python -m elearning exportar inscripciones inscripciones.csv
+#   python -m elearning convertir binario                   (JSON de --datos a instantánea binaria, o "json")
+#   python -m elearning --formato binario buscar python      (carga y guarda con la instantánea binaria)
+#   python -m elearning --formato fragmentado inscribir 1 101 (un archivo por curso; guarda solo lo que cambió)
+#   python -m elearning --compartido inscribir 1 101         (con otros procesos usando la misma carpeta)
+#   python -m elearning servir --puerto 8000                 (API HTTP con JSON, ver elearning.servidor)
+#
+# En un script todas las líneas se guardan juntas al final, como una sola transacción.
+
+import argparse
+import logging
+import os
+import shlex
+import sys
+
+from .importacion import COLUMNAS, TAMANO_LOTE, exportar_csv, importar_csv
+from .instantanea import instantanea_a_json, json_a_instantanea
+from .persistencia import ARCHIVO_INSTANTANEA, ARCHIVO_JSON, ARCHIVO_SQLITE, AlmacenSQLite, data_folder
+from .sistema import SistemaELearning
+
+MENSAJES_INSCRIPCION = {
+    "ya_inscrito": "ya estaba inscrito",
+    "prerequisitos_faltantes": "faltan prerequisitos",
+    False: "estudiante o curso inexistente"
+}
+
+
+def _agregar_comandos(parser):
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    inscribir = comandos.add_parser("inscribir", help="inscribe a un estudiante en un curso")
+    inscribir.add_argument("estudiante", type=int)
+    inscribir.add_argument("curso", type=int)
+    inscribir.add_argument("--prioridad", type=int, default=0, help="prioridad en la lista de espera (menor primero)")
+    inscribir.add_argument("--capacidad", type=int, default=30)
+
+    cohorte = comandos.add_parser("cohorte", help="inscribe a varios estudiantes en un curso de una vez")
+    cohorte.add_argument("curso", type=int)
+    cohorte.add_argument("estudiantes", type=int, nargs="+")
+    cohorte.add_argument("--prioridad", type=int, default=0, help="prioridad en la lista de espera (menor primero)")
+    cohorte.add_argument("--capacidad", type=int, default=30)
+
+    cancelar = comandos.add_parser("cancelar", help="cancela una inscripción")
+    cancelar.add_argument("estudiante", type=int)
+    cancelar.add_argument("curso", type=int)
+
+    buscar = comandos.add_parser("buscar", help="busca cursos por tema")
+    buscar.add_argument("tema")
+    buscar.add_argument("--nivel", default="Todos")
+
+    ruta = comandos.add_parser("ruta", help="planifica la ruta de aprendizaje hacia uno o más cursos")
+    ruta.add_argument("objetivos", type=int, nargs="+")
+    ruta.add_argument("--estudiante", type=int)
+
+    desbloquea = comandos.add_parser("desbloquea", help="lista los cursos que tienen a este como prerequisito")
+    desbloquea.add_argument("curso", type=int)
+
+    espera = comandos.add_parser("espera", help="muestra la posición de un estudiante en la lista de espera")
+    espera.add_argument("estudiante", type=int)
+    espera.add_argument("curso", type=int)
+
+    importar = comandos.add_parser("importar", help="importa filas desde un CSV con encabezado")
+    importar.add_argument("tipo", choices=list(COLUMNAS))
+    importar.add_argument("archivo")
+    importar.add_argument("--reporte", help="CSV donde escribir las filas con errores")
+    importar.add_argument("--lote", type=int, default=TAMANO_LOTE, help="filas por lote (cada lote se guarda una vez)")
+
+    exportar = comandos.add_parser("exportar", help="exporta a un CSV con encabezado")
+    exportar.add_argument("tipo", choices=list(COLUMNAS))
+    exportar.add_argument("archivo")
+
+    convertir = comandos.add_parser("convertir", help="convierte los datos entre el JSON y la instantánea binaria")
+    convertir.add_argument("destino", choices=["binario", "json"])
+
+    script = comandos.add_parser("script", help="ejecuta los comandos de un archivo, uno por línea")
+    script.add_argument("archivo")
+
+    servidor = comandos.add_parser("servir", help="atiende la API HTTP con JSON hasta Ctrl+C")
+    servidor.add_argument("--host", default="127.0.0.1")
+    servidor.add_argument("--puerto", type=int, default=8000)
+    servidor.add_argument("--sin-confirmar", action="store_true",
+                          help="responder las escrituras sin esperar a que su lote esté en disco")
+
+
+def construir_parser():
+    parser = argparse.ArgumentParser(prog="python -m elearning", description="Sistema de gestión e-learning.")
+    parser.add_argument("--datos", default=data_folder, help="carpeta de datos (por defecto: data)")
+    parser.add_argument("--sqlite", action="store_true", help="guardar cada cambio en una base SQLite en vez del JSON (igual se carga todo en memoria)")
+    parser.add_argument("--formato", choices=["json", "binario", "fragmentado"], default="json",
+                        help="formato de los checkpoints: JSON, instantánea binaria o fragmentos por curso")
+    parser.add_argument("--compartido", action="store_true",
+                        help="coordinar con otros procesos que usan la misma carpeta de datos (requiere fcntl)")
+    _agregar_comandos(parser)
+    return parser
+
+
+# Ejecuta un comando ya interpretado. Retorna True si tuvo éxito.
+def ejecutar(sistema, args, salida=sys.stdout):
+    if args.comando == "inscribir":
+        resultado = sistema.inscribir_estudiante(args.estudiante, args.curso, args.capacidad, args.prioridad)
+        if resultado is True:
+            print(f"{args.estudiante} inscrito en {args.curso}", file=salida)
+        elif resultado == "lista_espera":
+            posicion = sistema.posicion_en_espera(args.estudiante, args.curso)
+            print(f"{args.estudiante} en lista de espera de {args.curso} (posición {posicion})", file=salida)
+        else:
+            print(f"{args.estudiante} no inscrito en {args.curso}: {MENSAJES_INSCRIPCION[resultado]}", file=salida)
+            return False
+        return True
+
+    if args.comando == "cohorte":
+        resultados = sistema.inscribir_cohorte(args.curso, args.estudiantes, args.capacidad, args.prioridad)
+        inscritos = [e for e, resultado in resultados.items() if resultado is True]
+        en_espera = [e for e, resultado in resultados.items() if resultado == "lista_espera"]
+        print(f"{len(inscritos)} inscritos en {args.curso}, {len(en_espera)} en lista de espera", file=salida)
+        for estudiante_id, resultado in resultados.items():
+            if resultado is not True and resultado != "lista_espera":
+                print(f"{estudiante_id} no inscrito: {MENSAJES_INSCRIPCION[resultado]}", file=salida)
+        return len(inscritos) + len(en_espera) == len(resultados)
+
+    if args.comando == "cancelar":
+        if sistema.cancelar_inscripcion(args.estudiante, args.curso):
+            print(f"inscripción de {args.estudiante} en {args.curso} cancelada", file=salida)
+            return True
+        print(f"{args.estudiante} no estaba inscrito en {args.curso}", file=salida)
+        return False
+
+    if args.comando == "buscar":
+        for curso in sistema.buscar_cursos(args.tema, args.nivel):
+            print(f"{curso.id}\t{curso.nombre}\t{curso.nivel}", file=salida)
+        return True
+
+    if args.comando == "ruta":
+        if any(objetivo not in sistema.cursos for objetivo in args.objetivos):
+            print("curso objetivo inexistente", file=salida)
+            return False
+        for numero, semestre in enumerate(sistema.planificar_ruta(args.objetivos, args.estudiante), 1):
+            print(f"Semestre {numero}: " + ", ".join(f"{c.id} {c.nombre}" for c in semestre), file=salida)
+        return True
+
+    if args.comando == "desbloquea":
+        if args.curso not in sistema.cursos:
+            print("curso inexistente", file=salida)
+            return False
+        for curso in sistema.desbloquea(args.curso):
+            print(f"{curso.id}\t{curso.nombre}\t{curso.nivel}", file=salida)
+        return True
+
+    if args.comando == "espera":
+        posicion = sistema.posicion_en_espera(args.estudiante, args.curso)
+        print("no está en la lista de espera" if posicion is None else f"posición {posicion}", file=salida)
+        return posicion is not None
+
+    if args.comando == "importar":
+        try:
+            resultado = importar_csv(sistema, args.tipo, args.archivo, args.reporte, args.lote)
+        except (OSError, ValueError) as e:
+            print(f"no se pudo importar {args.archivo}: {e}", file=salida)
+            return False
+        print(resultado, file=salida)
+        if args.reporte is None:
+            for linea, mensaje in resultado.primeros_errores[:10]:
+                print(f"  línea {linea}: {mensaje}", file=salida)
+            if resultado.errores > 10:
+                print(f"  ... {resultado.errores - 10} errores más (use --reporte para verlos todos)", file=salida)
+        return resultado.errores == 0
+
+    if args.comando == "exportar":
+        try:
+            escritas = exportar_csv(sistema, args.tipo, args.archivo)
+        except OSError as e:
+            print(f"no se pudo exportar {args.archivo}: {e}", file=salida)
+            return False
+        print(f"{escritas} filas de {args.tipo} exportadas a {args.archivo}", file=salida)
+        return True
+
+    raise ValueError(f"Comando desconocido: {args.comando}")
+
+
+# Ejecuta un archivo de comandos dentro de una transacción, que se persiste una sola vez al terminar.
+# Las líneas vacías y las que empiezan con # se ignoran; una línea inválida se informa y se salta.
+def ejecutar_script(sistema, archivo, salida=sys.stdout):
+    parser = argparse.ArgumentParser(prog="script", add_help=False)
+    _agregar_comandos(parser)
+    exito = True
+    lineas = sys.stdin if archivo == "-" else open(archivo, "r", encoding="utf-8")
+    try:
+        with sistema.transaccion(reversible=False):
+            for numero, linea in enumerate(lineas, 1):
+                palabras = shlex.split(linea, comments=True)
+                if not palabras:
+                    continue
+                try:
+                    args = parser.parse_args(palabras)
+                except SystemExit:
+                    print(f"línea {numero}: comando inválido: {linea.strip()}", file=salida)
+                    exito = False
+                    continue
+                if args.comando in ("script", "convertir", "servir"):
+                    print(f"línea {numero}: {args.comando} no se puede usar dentro de un script", file=salida)
+                    exito = False
+                    continue
+                exito = ejecutar(sistema, args, salida) and exito
+    finally:
+        if lineas is not sys.stdin:
+            lineas.close()
+    return exito
+
+
+# Convierte los datos de una carpeta entre el JSON y la instantánea binaria. El diario no se toca:
+# las dos versiones guardan la misma secuencia, así que sigue valiendo para cualquiera de ellas.
+def convertir(directorio, destino, salida=sys.stdout):
+    ruta_json = os.path.join(directorio, ARCHIVO_JSON)
+    ruta_instantanea = os.path.join(directorio, ARCHIVO_INSTANTANEA)
+    origen = ruta_json if destino == "binario" else ruta_instantanea
+    if not os.path.exists(origen):
+        print(f"no existe {origen}", file=salida)
+        return 1
+    if destino == "binario":
+        json_a_instantanea(ruta_json, ruta_instantanea)
+    else:
+        instantanea_a_json(ruta_instantanea, ruta_json)
+    print(f"{origen} convertido a {destino}", file=salida)
+    return 0
+
+
+def main(argv=None):
+    parser = construir_parser()
+    args = parser.parse_args(argv)
+    if args.sqlite and args.compartido:
+        parser.error("--compartido no se combina con --sqlite: la base SQLite ya coordina a los procesos")
+    if args.comando == "servir" and args.compartido:
+        parser.error("servir no se combina con --compartido: el servidor atiende a todos desde un solo proceso")
+    logging.basicConfig(level=os.environ.get("ELEARNING_LOG", "WARNING").upper(), format="%(levelname)s %(name)s: %(message)s")
+
+    if args.comando == "convertir":
+        return convertir(args.datos, args.destino)
+
+    almacen = AlmacenSQLite(os.path.join(args.datos, ARCHIVO_SQLITE)) if args.sqlite else None
+    try:
+        try:
+            sistema = SistemaELearning(almacen=almacen, directorio_datos=args.datos, formato=args.formato,
+                                       compartido=args.compartido)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 1
+        if args.comando == "servir":
+            # Se importa recién aquí para que los demás comandos no carguen http.server al arrancar.
+            from .servidor import servir
+            print(f"Escuchando en http://{args.host}:{args.puerto} (Ctrl+C para terminar)", flush=True)
+            servir(sistema, args.host, args.puerto, confirmar=not args.sin_confirmar)
+            exito = True
+        elif args.comando == "script":
+            exito = ejecutar_script(sistema, args.archivo)
+        else:
+            exito = ejecutar(sistema, args)
+    finally:
+        if almacen is not None:
+            almacen.cerrar()
+    return 0 if exito else 1
@@ -0,0 +1,57 @@
+# Entidades del sistema e-learning: cursos, materiales y estudiantes.
+
+import sys
+
+from .estructuras import ConjuntoOrdenado
+
+# Clase que representa un curso con sus atributos, materiales y prerequisitos.
+class Curso:
+    __slots__ = ("id", "nombre", "descripcion", "nivel", "materiales", "estudiantes", "prerequisitos")
+
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, id, nombre, descripcion, nivel):
+        self.id = id
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.nivel = sys.intern(nivel)
+        self.materiales = ConjuntoOrdenado()
+        self.estudiantes = ConjuntoOrdenado()
+        self.prerequisitos = []
+
+# Agrega material a un curso específico.
+    def agregar_material(self, material):
+        self.materiales.agregar(material)
+
+    def __str__(self):
+        return f"Curso: {self.nombre} (Nivel: {self.nivel})"
+
+
+# Clase que representa un material educativo asociado a un curso.
+class Material:
+    __slots__ = ("id", "nombre", "tipo", "url")
+
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, id, nombre, tipo, url):
+        self.id = id
+        self.nombre = nombre
+        self.tipo = sys.intern(tipo)
+        self.url = url
+
+    def __str__(self):
+        return f"Material: {self.nombre} ({self.tipo})"
+
+
+# Clase que representa un estudiante con sus datos y cursos inscritos.
+class Estudiante:
+    __slots__ = ("id", "nombre", "email", "cursos", "mascara_cursos")
+
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, id, nombre, email):
+        self.id = id
+        self.nombre = nombre
+        self.email = email
+        self.cursos = ConjuntoOrdenado()
+        self.mascara_cursos = 0
+
+    def __str__(self):
+        return f"Estudiante: {self.nombre} ({self.email})"
@@ -0,0 +1,426 @@
+# Estructuras de datos del sistema e-learning: pila, cola, lista de espera con prioridades,
+# conjunto ordenado e índices de cursos (árbol ordenado y trigramas).
+
+import bisect
+import itertools
+from collections import deque
+from operator import itemgetter
+
+# Clase que implementa una estructura de datos tipo pila (LIFO).
+class Pila:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.items = []
+
+# Verifica si la estructura está vacía.
+    def esta_vacia(self):
+        return len(self.items) == 0
+
+# Agrega un elemento al tope de la pila.
+    def apilar(self, item):
+        self.items.append(item)
+
+# Elimina y retorna el elemento del tope de la pila.
+    def desapilar(self):
+        if not self.esta_vacia():
+            return self.items.pop()
+        return None
+
+    def ver_tope(self):
+        if not self.esta_vacia():
+            return self.items[-1]
+        return None
+
+    def tamaño(self):
+        return len(self.items)
+
+
+# Clase que implementa una estructura de datos tipo cola (FIFO).
+class Cola:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.items = deque()
+
+# Verifica si la estructura está vacía.
+    def esta_vacia(self):
+        return len(self.items) == 0
+
+# Agrega un elemento al final de la cola.
+    def encolar(self, item):
+        self.items.append(item)
+
+# Elimina y retorna el primer elemento de la cola.
+    def desencolar(self):
+        if not self.esta_vacia():
+            return self.items.popleft()
+        return None
+
+    def ver_frente(self):
+        if not self.esta_vacia():
+            return self.items[0]
+        return None
+
+    def tamaño(self):
+        return len(self.items)
+
+
+# Lista de espera de un curso con niveles de prioridad (menor número = más prioridad, por ejemplo
+# por antigüedad). Cada nivel es una cola FIFO sobre deque, así encolar y desencolar cuestan O(1),
+# y la posición de un estudiante sale de su turno sin recorrer la cola.
+class ListaEspera:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.niveles = {}
+        self.atendidos = {}
+        self.turnos = {}
+        self._prioridades = []
+
+    def __len__(self):
+        return len(self.turnos)
+
+    def __contains__(self, estudiante_id):
+        return estudiante_id in self.turnos
+
+    def esta_vacia(self):
+        return not self.turnos
+
+# Agrega un estudiante al final de su nivel de prioridad. Retorna False si ya estaba esperando.
+    def encolar(self, estudiante_id, prioridad=0):
+        if estudiante_id in self.turnos:
+            return False
+        if prioridad not in self.niveles:
+            self.niveles[prioridad] = deque()
+            self.atendidos[prioridad] = 0
+            bisect.insort(self._prioridades, prioridad)
+        cola = self.niveles[prioridad]
+        self.turnos[estudiante_id] = (prioridad, self.atendidos[prioridad] + len(cola))
+        cola.append(estudiante_id)
+        return True
+
+# Retira y retorna el id del primer estudiante del nivel de mayor prioridad.
+    def desencolar(self):
+        if not self._prioridades:
+            return None
+        prioridad = self._prioridades[0]
+        cola = self.niveles[prioridad]
+        estudiante_id = cola.popleft()
+        self.atendidos[prioridad] += 1
+        del self.turnos[estudiante_id]
+        if not cola:
+            self._quitar_nivel(prioridad)
+        return estudiante_id
+
+    def ver_frente(self):
+        if not self._prioridades:
+            return None
+        return self.niveles[self._prioridades[0]][0]
+
+# Retorna la posición (desde 1) de un estudiante en la lista, o None si no está esperando.
+# Cuesta O(número de niveles de prioridad).
+    def posicion(self, estudiante_id):
+        if estudiante_id not in self.turnos:
+            return None
+        prioridad, turno = self.turnos[estudiante_id]
+        posicion = turno - self.atendidos[prioridad] + 1
+        for otra in self._prioridades:
+            if otra >= prioridad:
+                break
+            posicion += len(self.niveles[otra])
+        return posicion
+
+# Saca a un estudiante de la lista aunque no esté al frente. Es O(n) en su nivel, pero solo se usa
+# cuando alguien abandona la espera, no en el flujo normal de inscripción.
+    def retirar(self, estudiante_id):
+        if estudiante_id not in self.turnos:
+            return False
+        prioridad, _ = self.turnos.pop(estudiante_id)
+        cola = self.niveles[prioridad]
+        cola.remove(estudiante_id)
+        if not cola:
+            self._quitar_nivel(prioridad)
+        else:
+            base = self.atendidos[prioridad]
+            for indice, otro_id in enumerate(cola):
+                self.turnos[otro_id] = (prioridad, base + indice)
+        return True
+
+# Vuelve a poner a un estudiante en el turno que tenía, con el contador de atendidos de su nivel como
+# estaba antes; deshace un desencolar o un retirar al revertir una transacción. Es O(n) en su nivel.
+    def reponer(self, estudiante_id, prioridad, turno, atendidos):
+        if prioridad not in self.niveles:
+            self.niveles[prioridad] = deque()
+            bisect.insort(self._prioridades, prioridad)
+        self.atendidos[prioridad] = atendidos
+        cola = self.niveles[prioridad]
+        cola.insert(turno - atendidos, estudiante_id)
+        for indice, otro_id in enumerate(cola):
+            self.turnos[otro_id] = (prioridad, atendidos + indice)
+
+    def _quitar_nivel(self, prioridad):
+        del self.niveles[prioridad]
+        del self.atendidos[prioridad]
+        self._prioridades.remove(prioridad)
+
+# Retorna las entradas en orden de atención como pares [estudiante_id, prioridad].
+    def a_lista(self):
+        return [[estudiante_id, prioridad] for prioridad in self._prioridades for estudiante_id in self.niveles[prioridad]]
+
+
+# Conjunto que conserva el orden de inserción, respaldado por un dict: pertenencia, alta y baja
+# cuestan O(1). Se usa para los dos lados de la relación de inscripciones y para los materiales.
+class ConjuntoOrdenado:
+    __slots__ = ("_elementos",)
+
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, elementos=()):
+        self._elementos = dict.fromkeys(elementos)
+
+    def agregar(self, elemento):
+        self._elementos[elemento] = None
+
+# Quita un elemento; lanza KeyError si no estaba.
+    def quitar(self, elemento):
+        del self._elementos[elemento]
+
+    def descartar(self, elemento):
+        self._elementos.pop(elemento, None)
+
+# Posición de un elemento, e inserción en una posición dada: sirven para devolver un elemento quitado
+# a su lugar al revertir una transacción. Cuestan O(n).
+    def indice(self, elemento):
+        return list(self._elementos).index(elemento)
+
+    def insertar(self, posicion, elemento):
+        elementos = list(self._elementos)
+        elementos.insert(posicion, elemento)
+        self._elementos = dict.fromkeys(elementos)
+
+    def __contains__(self, elemento):
+        return elemento in self._elementos
+
+    def __iter__(self):
+        return iter(self._elementos)
+
+    def __len__(self):
+        return len(self._elementos)
+
+# Acceso por posición o por rebanada, para paginar: recorre desde el principio, O(posición + k).
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            desde, hasta, paso = indice.indices(len(self._elementos))
+            if paso < 0:
+                return list(self._elementos)[indice]
+            return list(itertools.islice(self._elementos, desde, hasta, paso))
+        if indice < 0:
+            indice += len(self._elementos)
+        if 0 <= indice < len(self._elementos):
+            return next(itertools.islice(self._elementos, indice, None))
+        raise IndexError(indice)
+
+    def __repr__(self):
+        return f"ConjuntoOrdenado({list(self._elementos)!r})"
+
+
+# Índice ordenado de cursos, usado en búsquedas por tema, nivel, prefijo y rango.
+# Se guarda como dos arreglos paralelos ordenados por clave (bisect), así nunca se desbalancea
+# y ninguna operación es recursiva: buscar es O(log n) y un prefijo o rango es O(log n + k).
+class ArbolBusqueda:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.claves = []
+        self.valores = []
+
+    def __len__(self):
+        return len(self.claves)
+
+# Inserta un valor manteniendo el orden; las claves repetidas quedan en orden de llegada.
+    def insertar(self, clave, valor):
+        posicion = bisect.bisect_right(self.claves, clave)
+        self.claves.insert(posicion, clave)
+        self.valores.insert(posicion, valor)
+
+# Quita un valor con la clave dada. Retorna True si lo encontró.
+    def eliminar(self, clave, valor):
+        posicion = bisect.bisect_left(self.claves, clave)
+        while posicion < len(self.claves) and self.claves[posicion] == clave:
+            if self.valores[posicion] is valor:
+                del self.claves[posicion]
+                del self.valores[posicion]
+                return True
+            posicion += 1
+        return False
+
+# Retorna los valores cuya clave es exactamente la dada.
+    def buscar(self, clave):
+        inicio = bisect.bisect_left(self.claves, clave)
+        fin = bisect.bisect_right(self.claves, clave, inicio)
+        return self.valores[inicio:fin]
+
+# Retorna, en orden, los valores cuya clave empieza con el prefijo.
+    def buscar_prefijo(self, prefijo):
+        resultados = []
+        posicion = bisect.bisect_left(self.claves, prefijo)
+        while posicion < len(self.claves) and self.claves[posicion].startswith(prefijo):
+            resultados.append(self.valores[posicion])
+            posicion += 1
+        return resultados
+
+# Retorna, en orden, los valores con desde <= clave < hasta. Un límite en None no acota.
+    def rango(self, desde=None, hasta=None):
+        inicio, fin = self.posiciones(desde, hasta)
+        return self.valores[inicio:fin]
+
+# Inserta muchos pares (clave, valor) de una vez: un solo ordenamiento en vez de un insert por par.
+    def cargar(self, pares):
+        combinados = list(zip(self.claves, self.valores))
+        combinados.extend(pares)
+        combinados.sort(key=itemgetter(0))
+        self.claves = [clave for clave, _ in combinados]
+        self.valores = [valor for _, valor in combinados]
+
+# Retorna las posiciones [inicio, fin) de las claves con desde <= clave < hasta.
+    def posiciones(self, desde=None, hasta=None):
+        inicio = 0 if desde is None else bisect.bisect_left(self.claves, desde)
+        fin = len(self.claves) if hasta is None else bisect.bisect_left(self.claves, hasta, inicio)
+        return inicio, fin
+
+# Retorna las posiciones [inicio, fin) de las claves que empiezan con el prefijo.
+    def posiciones_prefijo(self, prefijo):
+        return self.posiciones(prefijo, prefijo + chr(0x10FFFF))
+
+# Vista sin copia de los valores en orden, opcionalmente acotada por posiciones o por prefijo.
+    def tramo(self, inicio=0, fin=None, descendente=False):
+        return TramoOrdenado(self.valores, inicio, len(self.valores) if fin is None else fin, descendente)
+
+# Busca cursos en el árbol que coincidan con un tema y nivel específico.
+    def buscar_por_tema_nivel(self, tema, nivel):
+        tema = tema.lower()
+        return [
+            curso for curso in self.valores
+            if tema in curso.nombre.lower() and (nivel == "Todos" or curso.nivel == nivel)
+        ]
+
+
+# Vista de solo lectura sobre el tramo [inicio, fin) de una lista, sin copiarla. Permite paginar un
+# índice ordenado (len y rebanadas) en tiempo proporcional a la página, no al total.
+class TramoOrdenado:
+    __slots__ = ("valores", "inicio", "fin", "descendente")
+
+    def __init__(self, valores, inicio=0, fin=None, descendente=False):
+        self.valores = valores
+        self.inicio = inicio
+        self.fin = len(valores) if fin is None else fin
+        self.descendente = descendente
+
+    def __len__(self):
+        return max(0, self.fin - self.inicio)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            desde, hasta, _ = indice.indices(len(self))
+            if hasta <= desde:
+                return []
+            if self.descendente:
+                return self.valores[self.fin - hasta:self.fin - desde][::-1]
+            return self.valores[self.inicio + desde:self.inicio + hasta]
+        if not -len(self) <= indice < len(self):
+            raise IndexError(indice)
+        if indice < 0:
+            indice += len(self)
+        return self.valores[self.fin - 1 - indice] if self.descendente else self.valores[self.inicio + indice]
+
+    def __iter__(self):
+        for posicion in range(len(self)):
+            yield self[posicion]
+
+
+# Concatena varias secuencias como una sola para paginar, por ejemplo los materiales de todos los
+# cursos. Cada elemento sale como (dueño, elemento); ubicar una página cuesta O(log grupos).
+class TramosConcatenados:
+    def __init__(self, grupos):
+        self.duenos = []
+        self.secuencias = []
+        self.acumulados = [0]
+        for dueno, secuencia in grupos:
+            if len(secuencia):
+                self.duenos.append(dueno)
+                self.secuencias.append(secuencia)
+                self.acumulados.append(self.acumulados[-1] + len(secuencia))
+
+    def __len__(self):
+        return self.acumulados[-1]
+
+    def __getitem__(self, indice):
+        if not isinstance(indice, slice):
+            elementos = self[indice:indice + 1] if indice >= 0 else self[len(self) + indice:len(self) + indice + 1]
+            if not elementos:
+                raise IndexError(indice)
+            return elementos[0]
+        desde, hasta, _ = indice.indices(len(self))
+        resultado = []
+        grupo = bisect.bisect_right(self.acumulados, desde) - 1
+        while desde < hasta and grupo < len(self.secuencias):
+            base = self.acumulados[grupo]
+            fin_grupo = min(hasta, self.acumulados[grupo + 1])
+            dueno = self.duenos[grupo]
+            resultado.extend((dueno, elemento) for elemento in self.secuencias[grupo][desde - base:fin_grupo - base])
+            desde = fin_grupo
+            grupo += 1
+        return resultado
+
+
+# Índice invertido de trigramas sobre los nombres de los cursos, con postings por nivel.
+# Una búsqueda por subcadena solo recorre los cursos que comparten todos los trigramas del tema.
+class IndiceTrigramas:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.postings = {}
+        self.por_nivel = {}
+        self.nombres = {}
+        self.cursos = {}
+
+    @staticmethod
+    def _trigramas(texto):
+        return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+# Agrega un curso al índice.
+    def agregar(self, curso):
+        if curso.id in self.cursos:
+            self.eliminar(curso.id)
+        nombre = curso.nombre.lower()
+        self.cursos[curso.id] = curso
+        self.nombres[curso.id] = nombre
+        for trigrama in self._trigramas(nombre):
+            self.postings.setdefault(trigrama, set()).add(curso.id)
+        self.por_nivel.setdefault(curso.nivel, set()).add(curso.id)
+
+# Quita un curso del índice.
+    def eliminar(self, curso_id):
+        curso = self.cursos.pop(curso_id, None)
+        if curso is None:
+            return
+        nombre = self.nombres.pop(curso_id)
+        for trigrama in self._trigramas(nombre):
+            posting = self.postings[trigrama]
+            posting.discard(curso_id)
+            if not posting:
+                del self.postings[trigrama]
+        nivel = self.por_nivel[curso.nivel]
+        nivel.discard(curso_id)
+        if not nivel:
+            del self.por_nivel[curso.nivel]
+
+# Busca cursos cuyo nombre contenga el tema, opcionalmente filtrando por nivel.
+    def buscar(self, tema, nivel="Todos"):
+        tema = tema.lower()
+        listas = [self.postings.get(trigrama, set()) for trigrama in self._trigramas(tema)]
+        if nivel != "Todos":
+            listas.append(self.por_nivel.get(nivel, set()))
+        if listas:
+            listas.sort(key=len)
+            candidatos = listas[0].intersection(*listas[1:])
+        else:
+            candidatos = self.cursos.keys()
+        resultados = [self.cursos[i] for i in candidatos if tema in self.nombres[i]]
+        resultados.sort(key=lambda curso: (self.nombres[curso.id], curso.nivel))
+        return resultados
@@ -0,0 +1,173 @@
+# Almacenamiento fragmentado del estado del sistema: en vez de un solo JSON con todo, una carpeta con
+# un archivo por curso y uno por bloque de estudiantes, para que cada guardado escriba solo lo que
+# cambió desde el anterior:
+#
+#   cursos/<id>.json            el curso (activo o eliminado) con sus materiales, materiales eliminados,
+#                               inscritos, prerequisitos y lista de espera
+#   estudiantes/<bloque>.json   los estudiantes con id entre bloque * 1000 y bloque * 1000 + 999
+#   indice.json                 secuencia del diario, prerequisitos eliminados y materiales sin curso
+#   pendiente.json              solo mientras se guarda: los cambios completos que se están aplicando
+#
+# Las inscripciones se guardan solo del lado del curso, así que inscribir o cancelar reescribe un
+# único archivo. Un guardado escribe primero todos sus cambios en pendiente.json y recién después los
+# reparte en los fragmentos; si se corta a la mitad, la próxima carga vuelve a aplicar pendiente.json,
+# así nunca queda una mezcla de fragmentos viejos y nuevos.
+
+import json
+import os
+
+from .persistencia import escribir_json_atomico
+
+ESTUDIANTES_POR_BLOQUE = 1000
+
+
+def bloque_de(estudiante_id):
+    return estudiante_id // ESTUDIANTES_POR_BLOQUE
+
+
+# Entidades modificadas desde el último guardado: ids de estudiantes y de cursos, activos o eliminados
+# (el fragmento de un curso también guarda sus materiales eliminados). Con `todo` se reescriben todos
+# los fragmentos, por ejemplo la primera vez que se guarda en este formato.
+class CambiosPendientes:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.estudiantes = set()
+        self.cursos = set()
+        self.todo = False
+
+    def estudiante(self, estudiante_id):
+        self.estudiantes.add(estudiante_id)
+
+    def curso(self, curso_id):
+        self.cursos.add(curso_id)
+
+    def marcar_todo(self):
+        self.todo = True
+
+    def limpiar(self):
+        self.estudiantes = set()
+        self.cursos = set()
+        self.todo = False
+
+# Retorna (todo, estudiantes, cursos) y deja todo limpio.
+    def tomar(self):
+        cambios = (self.todo, self.estudiantes, self.cursos)
+        self.limpiar()
+        return cambios
+
+# Vuelve a marcar lo que se tomó con tomar(), cuando no se pudo escribir.
+    def devolver(self, todo, estudiantes, cursos):
+        self.todo = self.todo or todo
+        self.estudiantes |= estudiantes
+        self.cursos |= cursos
+
+    def __bool__(self):
+        return self.todo or bool(self.estudiantes) or bool(self.cursos)
+
+
+# Junta dos conjuntos de cambios todavía no escritos; los fragmentos del segundo reemplazan a los del primero.
+def combinar_cambios(anterior, nuevo):
+    cursos = dict(anterior["cursos"])
+    cursos.update(nuevo["cursos"])
+    estudiantes = dict(anterior["estudiantes"])
+    estudiantes.update(nuevo["estudiantes"])
+    return {
+        "cursos": cursos,
+        "estudiantes": estudiantes,
+        "indice": nuevo["indice"],
+        "completo": anterior["completo"] or nuevo["completo"]
+    }
+
+
+# Carpeta de fragmentos. `escribir` recibe los cambios como los arma el sistema:
+#   {"cursos": {id: fragmento o None}, "estudiantes": {bloque: [estudiantes] o None},
+#    "indice": {...}, "completo": bool}
+# None borra el archivo; con "completo" también se borran los fragmentos que no vienen en los cambios.
+class DirectorioFragmentado:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.ruta_cursos = os.path.join(ruta, "cursos")
+        self.ruta_estudiantes = os.path.join(ruta, "estudiantes")
+        self.ruta_indice = os.path.join(ruta, "indice.json")
+        self.ruta_pendiente = os.path.join(ruta, "pendiente.json")
+
+    def existe(self):
+        return os.path.exists(self.ruta_indice) or os.path.exists(self.ruta_pendiente)
+
+    def escribir(self, cambios):
+        os.makedirs(self.ruta_cursos, exist_ok=True)
+        os.makedirs(self.ruta_estudiantes, exist_ok=True)
+        # Las claves son enteros: van como pares para que el JSON no las convierta en texto.
+        escribir_json_atomico(self.ruta_pendiente, {
+            "cursos": list(cambios["cursos"].items()),
+            "estudiantes": list(cambios["estudiantes"].items()),
+            "indice": cambios["indice"],
+            "completo": cambios["completo"]
+        })
+        self._aplicar(cambios)
+        os.remove(self.ruta_pendiente)
+
+# Termina un guardado que se cortó a la mitad, si lo hay.
+    def _recuperar(self):
+        if not os.path.exists(self.ruta_pendiente):
+            return
+        with open(self.ruta_pendiente, "r", encoding="utf-8") as f:
+            pendiente = json.load(f)
+        os.makedirs(self.ruta_cursos, exist_ok=True)
+        os.makedirs(self.ruta_estudiantes, exist_ok=True)
+        self._aplicar({
+            "cursos": dict(pendiente["cursos"]),
+            "estudiantes": dict(pendiente["estudiantes"]),
+            "indice": pendiente["indice"],
+            "completo": pendiente["completo"]
+        })
+        os.remove(self.ruta_pendiente)
+
+    def _aplicar(self, cambios):
+        for carpeta, fragmentos in ((self.ruta_cursos, cambios["cursos"]), (self.ruta_estudiantes, cambios["estudiantes"])):
+            for clave, contenido in fragmentos.items():
+                ruta = os.path.join(carpeta, f"{clave}.json")
+                if contenido is not None:
+                    escribir_json_atomico(ruta, contenido)
+                elif os.path.exists(ruta):
+                    os.remove(ruta)
+            if cambios["completo"]:
+                for clave in set(self._claves(carpeta)) - set(fragmentos):
+                    os.remove(os.path.join(carpeta, f"{clave}.json"))
+        escribir_json_atomico(self.ruta_indice, cambios["indice"])
+
+    def _claves(self, carpeta):
+        if not os.path.isdir(carpeta):
+            return []
+        return [int(nombre[:-5]) for nombre in os.listdir(carpeta) if nombre.endswith(".json")]
+
+    def _leer_carpeta(self, carpeta):
+        for clave in sorted(self._claves(carpeta)):
+            with open(os.path.join(carpeta, f"{clave}.json"), "r", encoding="utf-8") as f:
+                yield json.load(f)
+
+# Lee todos los fragmentos y arma el diccionario de datos en el formato del archivo JSON.
+    def leer(self):
+        self._recuperar()
+        with open(self.ruta_indice, "r", encoding="utf-8") as f:
+            indice = json.load(f)
+        datos = {
+            "estudiantes": [],
+            "cursos": [],
+            "cursos_eliminados": [],
+            "materiales_eliminados": list(indice.get("materiales_sin_curso", [])),
+            "prerequisitos_eliminados": indice.get("prerequisitos_eliminados", {}),
+            "listas_espera": {},
+            "secuencia_diario": indice.get("secuencia_diario", 0)
+        }
+        for curso in self._leer_carpeta(self.ruta_cursos):
+            espera = curso.pop("lista_espera", [])
+            if espera:
+                datos["listas_espera"][str(curso["id"])] = espera
+            for material in curso.pop("materiales_eliminados", []):
+                datos["materiales_eliminados"].append(dict(material, curso_id=curso["id"]))
+            datos["cursos_eliminados" if curso.pop("eliminado", False) else "cursos"].append(curso)
+        for estudiantes in self._leer_carpeta(self.ruta_estudiantes):
+            datos["estudiantes"].extend(estudiantes)
+        return datos
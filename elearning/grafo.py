@@ -0,0 +1,360 @@
+# Grafo de prerequisitos entre cursos, con el cierre transitivo guardado como máscaras de bits.
+
+import heapq
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Clase que representa un grafo dirigido para modelar cursos y sus prerequisitos.
+# Además de las aristas guarda, para cada curso, el cierre transitivo de sus prerequisitos como
+# una máscara de bits sobre un índice denso de cursos, y lo mantiene al día en cada cambio.
+class Grafo:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.vertices = {}
+        self.aristas = {}
+        self.cierre = {}
+        self.bits = {}
+        self._ids_por_bit = []
+        self._dependientes = {}
+
+# Retorna la máscara de un solo bit que representa a un curso, asignándole posición si no tenía.
+    def bit(self, curso_id):
+        if curso_id not in self.bits:
+            self.bits[curso_id] = len(self._ids_por_bit)
+            self._ids_por_bit.append(curso_id)
+        return 1 << self.bits[curso_id]
+
+# Convierte una máscara en la lista de ids de curso que representa.
+    def ids_de_mascara(self, mascara):
+        ids = []
+        while mascara:
+            menor = mascara & -mascara
+            ids.append(self._ids_por_bit[menor.bit_length() - 1])
+            mascara ^= menor
+        return ids
+
+# Agrega un curso como vértice al grafo.
+    def agregar_vertice(self, curso):
+        self.vertices[curso.id] = curso
+        if curso.id not in self.aristas:
+            self.aristas[curso.id] = []
+        self.bit(curso.id)
+        self.cierre.setdefault(curso.id, 0)
+
+# Establece una relación de prerequisito entre dos cursos en el grafo.
+# Se rechaza (retorna False) si la arista formaría un ciclo.
+    def agregar_arista(self, curso_id, prerequisito_id):
+        if curso_id in self.aristas and prerequisito_id in self.vertices:
+            if prerequisito_id in self.aristas[curso_id]:
+                return True
+            if self.forma_ciclo(curso_id, prerequisito_id):
+                return False
+            self.aristas[curso_id].append(prerequisito_id)
+            self._dependientes.setdefault(prerequisito_id, set()).add(curso_id)
+            self._propagar(curso_id, self.cierre[prerequisito_id] | self.bit(prerequisito_id))
+            return True
+        return False
+
+# Agrega muchas aristas de una vez y calcula el cierre con un solo recorrido topológico,
+# en vez de propagar arista por arista. Retorna las aristas rechazadas por formar ciclos.
+    def agregar_aristas(self, pares):
+        nuevas = []
+        rechazadas = []
+        for curso_id, prerequisito_id in pares:
+            if curso_id == prerequisito_id:
+                rechazadas.append((curso_id, prerequisito_id))
+            elif curso_id in self.aristas and prerequisito_id in self.vertices:
+                if prerequisito_id not in self.aristas[curso_id]:
+                    self.aristas[curso_id].append(prerequisito_id)
+                    self._dependientes.setdefault(prerequisito_id, set()).add(curso_id)
+                    nuevas.append((curso_id, prerequisito_id))
+        sin_resolver = self._recalcular({curso_id for curso_id, _ in nuevas})
+        if sin_resolver:
+            # Solo las aristas nuevas dentro de una componente fuertemente conexa pueden cerrar un ciclo.
+            # Se quitan, y se vuelven a agregar en orden con Pearce-Kelly sobre esas componentes, que
+            # mantiene un orden topológico en línea y solo reordena la región afectada por cada arista.
+            componente = {}
+            for numero, nodos in enumerate(self._componentes_fuertes(sin_resolver)):
+                for nodo in nodos:
+                    componente[nodo] = numero
+            reintentar = [
+                (c, p) for c, p in nuevas
+                if c in componente and componente[c] == componente.get(p)
+            ]
+            for curso_id, prerequisito_id in reintentar:
+                self.aristas[curso_id].remove(prerequisito_id)
+                self._dependientes[prerequisito_id].discard(curso_id)
+            rechazadas.extend(self._agregar_pearce_kelly(set(componente), reintentar))
+            self._recalcular(sin_resolver)
+        return rechazadas
+
+# Agrega aristas entre un conjunto de cursos (sin ciclos al empezar) manteniendo un orden
+# topológico con el algoritmo de Pearce-Kelly. Retorna las aristas rechazadas por formar ciclos.
+    def _agregar_pearce_kelly(self, nodos, pares):
+        # El orden inicial sigue un postorden DFS que ya incluye las aristas por agregar, así la mayoría
+        # de ellas respeta el orden desde el principio y solo las que cierran ciclos provocan búsquedas.
+        pendientes_por_curso = {}
+        for curso_id, prerequisito_id in pares:
+            pendientes_por_curso.setdefault(curso_id, []).append(prerequisito_id)
+        prioridad = {}
+        terminados = 0
+        for raiz in nodos:
+            if raiz in prioridad:
+                continue
+            prioridad[raiz] = None
+            recorrido = [(raiz, iter(self.aristas[raiz] + pendientes_por_curso.get(raiz, [])))]
+            while recorrido:
+                nodo, previos = recorrido[-1]
+                for previo_id in previos:
+                    if previo_id in nodos and previo_id not in prioridad:
+                        prioridad[previo_id] = None
+                        recorrido.append((previo_id, iter(self.aristas[previo_id] + pendientes_por_curso.get(previo_id, []))))
+                        break
+                else:
+                    recorrido.pop()
+                    prioridad[nodo] = terminados
+                    terminados += 1
+        orden = {}
+        grados = {c: sum(1 for p in self.aristas[c] if p in nodos) for c in nodos}
+        listos = [(prioridad[c], c) for c, grado in grados.items() if grado == 0]
+        heapq.heapify(listos)
+        while listos:
+            _, actual = heapq.heappop(listos)
+            orden[actual] = len(orden)
+            for dependiente_id in self._dependientes.get(actual, ()):
+                if dependiente_id in grados:
+                    grados[dependiente_id] -= 1
+                    if grados[dependiente_id] == 0:
+                        heapq.heappush(listos, (prioridad[dependiente_id], dependiente_id))
+
+        rechazadas = []
+        for curso_id, prerequisito_id in pares:
+            inferior = orden[curso_id]
+            superior = orden[prerequisito_id]
+            if superior > inferior:
+                adelante = []
+                visitados = {curso_id}
+                pendientes = [curso_id]
+                ciclo = False
+                while pendientes and not ciclo:
+                    actual = pendientes.pop()
+                    adelante.append(actual)
+                    for dependiente_id in self._dependientes.get(actual, ()):
+                        if dependiente_id == prerequisito_id:
+                            ciclo = True
+                            break
+                        if dependiente_id in nodos and dependiente_id not in visitados and orden[dependiente_id] < superior:
+                            visitados.add(dependiente_id)
+                            pendientes.append(dependiente_id)
+                if ciclo:
+                    rechazadas.append((curso_id, prerequisito_id))
+                    continue
+                atras = []
+                visitados = {prerequisito_id}
+                pendientes = [prerequisito_id]
+                while pendientes:
+                    actual = pendientes.pop()
+                    atras.append(actual)
+                    for previo_id in self.aristas[actual]:
+                        if previo_id in nodos and previo_id not in visitados and orden[previo_id] > inferior:
+                            visitados.add(previo_id)
+                            pendientes.append(previo_id)
+                atras.sort(key=orden.__getitem__)
+                adelante.sort(key=orden.__getitem__)
+                posiciones = sorted(orden[c] for c in atras + adelante)
+                for nodo, posicion in zip(atras + adelante, posiciones):
+                    orden[nodo] = posicion
+            self.aristas[curso_id].append(prerequisito_id)
+            self._dependientes.setdefault(prerequisito_id, set()).add(curso_id)
+        return rechazadas
+
+# Retorna las componentes fuertemente conexas con más de un curso dentro de un conjunto de
+# cursos (algoritmo de Tarjan, iterativo para no depender del límite de recursión).
+    def _componentes_fuertes(self, nodos):
+        indices = {}
+        bajos = {}
+        pila = []
+        en_pila = set()
+        componentes = []
+        for raiz in nodos:
+            if raiz in indices:
+                continue
+            indices[raiz] = bajos[raiz] = len(indices)
+            pila.append(raiz)
+            en_pila.add(raiz)
+            recorrido = [(raiz, iter(self.aristas[raiz]))]
+            while recorrido:
+                nodo, vecinos = recorrido[-1]
+                avanzo = False
+                for vecino in vecinos:
+                    if vecino not in nodos:
+                        continue
+                    if vecino not in indices:
+                        indices[vecino] = bajos[vecino] = len(indices)
+                        pila.append(vecino)
+                        en_pila.add(vecino)
+                        recorrido.append((vecino, iter(self.aristas[vecino])))
+                        avanzo = True
+                        break
+                    if vecino in en_pila:
+                        bajos[nodo] = min(bajos[nodo], indices[vecino])
+                if avanzo:
+                    continue
+                recorrido.pop()
+                if recorrido:
+                    padre = recorrido[-1][0]
+                    bajos[padre] = min(bajos[padre], bajos[nodo])
+                if bajos[nodo] == indices[nodo]:
+                    nodos_componente = []
+                    while True:
+                        miembro = pila.pop()
+                        en_pila.discard(miembro)
+                        nodos_componente.append(miembro)
+                        if miembro == nodo:
+                            break
+                    if len(nodos_componente) > 1:
+                        componentes.append(nodos_componente)
+        return componentes
+
+# Indica si agregar la arista curso -> prerequisito cerraría un ciclo. Es O(1): basta ver si el
+# curso ya es prerequisito (directo o indirecto) del que se quiere poner como prerequisito.
+    def forma_ciclo(self, curso_id, prerequisito_id):
+        if curso_id == prerequisito_id:
+            return True
+        if prerequisito_id not in self.cierre or curso_id not in self.bits:
+            return False
+        return bool(self.cierre[prerequisito_id] & self.bit(curso_id))
+
+# Retorna el ciclo que cerraría la arista curso -> prerequisito, como lista de ids que empieza y
+# termina en el curso, o una lista vacía si no hay ciclo. Solo recorre cursos del camino.
+    def buscar_ciclo(self, curso_id, prerequisito_id):
+        if not self.forma_ciclo(curso_id, prerequisito_id):
+            return []
+        ciclo = [curso_id]
+        actual = prerequisito_id
+        bit_curso = self.bit(curso_id)
+        while actual != curso_id:
+            ciclo.append(actual)
+            for siguiente in self.aristas[actual]:
+                if siguiente == curso_id or self.cierre[siguiente] & bit_curso:
+                    actual = siguiente
+                    break
+        ciclo.append(curso_id)
+        return ciclo
+
+# Retorna los ids de los cursos que tienen a este como prerequisito directo, en O(k) con el índice
+# inverso que se mantiene junto con las aristas.
+    def dependientes(self, curso_id):
+        return list(self._dependientes.get(curso_id, ()))
+
+# Quita una relación de prerequisito y recalcula el cierre de los cursos afectados.
+    def eliminar_arista(self, curso_id, prerequisito_id):
+        if prerequisito_id in self.aristas.get(curso_id, []):
+            self.aristas[curso_id].remove(prerequisito_id)
+            self._dependientes.get(prerequisito_id, set()).discard(curso_id)
+            self._recalcular([curso_id])
+            return True
+        return False
+
+# Quita un curso del grafo junto con sus aristas de entrada y salida.
+    def eliminar_vertice(self, curso_id):
+        if curso_id not in self.vertices:
+            return False
+        for prerequisito_id in self.aristas.pop(curso_id, []):
+            self._dependientes.get(prerequisito_id, set()).discard(curso_id)
+        dependientes = self._dependientes.pop(curso_id, set())
+        for dependiente_id in dependientes:
+            self.aristas[dependiente_id].remove(curso_id)
+        del self.vertices[curso_id]
+        del self.cierre[curso_id]
+        self._recalcular(dependientes)
+        return True
+
+# Suma una máscara al cierre de un curso y de todo lo que depende de él.
+# Se detiene en los cursos cuyo cierre ya la contenía, porque sus dependientes también la tienen.
+    def _propagar(self, curso_id, mascara):
+        pendientes = [curso_id]
+        while pendientes:
+            actual = pendientes.pop()
+            nuevo = self.cierre[actual] | mascara
+            if nuevo != self.cierre[actual]:
+                self.cierre[actual] = nuevo
+                pendientes.extend(self._dependientes.get(actual, ()))
+
+# Recalcula desde cero el cierre de unos cursos y de sus dependientes, en orden topológico.
+# Retorna los cursos que no se pudieron ordenar porque quedaron dentro de un ciclo.
+    def _recalcular(self, cursos_ids):
+        afectados = set()
+        pendientes = list(cursos_ids)
+        while pendientes:
+            actual = pendientes.pop()
+            if actual not in afectados and actual in self.vertices:
+                afectados.add(actual)
+                pendientes.extend(self._dependientes.get(actual, ()))
+
+        grados = {c: sum(1 for p in self.aristas[c] if p in afectados) for c in afectados}
+        listos = [c for c, grado in grados.items() if grado == 0]
+        while listos:
+            actual = listos.pop()
+            mascara = 0
+            for prerequisito_id in self.aristas[actual]:
+                mascara |= self.cierre[prerequisito_id] | self.bit(prerequisito_id)
+            self.cierre[actual] = mascara
+            for dependiente_id in self._dependientes.get(actual, ()):
+                if dependiente_id in grados:
+                    grados[dependiente_id] -= 1
+                    if grados[dependiente_id] == 0:
+                        listos.append(dependiente_id)
+        return {c for c, grado in grados.items() if grado > 0}
+
+# Verifica si un estudiante cumple con todos los prerequisitos (directos e indirectos) de un curso.
+    def verificar_cumple_prerequisitos(self, estudiante, curso_id):
+        if curso_id not in self.vertices:
+            return False
+
+        faltantes = self.cierre[curso_id] & ~estudiante.mascara_cursos
+        if faltantes:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Curso %s: faltan prerequisitos %s", curso_id, self.ids_de_mascara(faltantes))
+            return False
+
+        return True
+
+# Retorna los ids de los prerequisitos, directos o indirectos, que le faltan a un estudiante.
+    def prerequisitos_faltantes(self, estudiante, curso_id):
+        if curso_id not in self.vertices:
+            return []
+        return self.ids_de_mascara(self.cierre[curso_id] & ~estudiante.mascara_cursos)
+
+# Planifica la ruta para uno o varios cursos objetivo con el algoritmo de Kahn, en O(V + E).
+# Los cursos necesarios salen del cierre ya calculado de cada objetivo, se omiten los que el
+# estudiante ya tomó y el resultado se agrupa en semestres de cursos que pueden tomarse a la vez.
+    def planificar_ruta(self, objetivos_ids, mascara_completados=0):
+        necesarios = 0
+        for objetivo_id in objetivos_ids:
+            if objetivo_id in self.vertices:
+                necesarios |= self.cierre[objetivo_id] | self.bit(objetivo_id)
+        pendientes = self.ids_de_mascara(necesarios & ~mascara_completados)
+
+        incluidos = set(pendientes)
+        grados = {c: sum(1 for p in self.aristas[c] if p in incluidos) for c in pendientes}
+        capa = [curso_id for curso_id in pendientes if grados[curso_id] == 0]
+        semestres = []
+        while capa:
+            semestres.append([self.vertices[curso_id] for curso_id in capa])
+            siguiente = []
+            for curso_id in capa:
+                for dependiente_id in self._dependientes.get(curso_id, ()):
+                    if dependiente_id in grados:
+                        grados[dependiente_id] -= 1
+                        if grados[dependiente_id] == 0:
+                            siguiente.append(dependiente_id)
+            siguiente.sort(key=self.bits.__getitem__)
+            capa = siguiente
+        return semestres
+
+# Recomienda una ruta de cursos necesarios para alcanzar un curso objetivo.
+    def recomendar_ruta_aprendizaje(self, curso_objetivo_id):
+        return [curso for semestre in self.planificar_ruta([curso_objetivo_id]) for curso in semestre]
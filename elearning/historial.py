@@ -0,0 +1,108 @@
+# Historial de deshacer/rehacer del sistema e-learning.
+
+import json
+import logging
+import os
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+# Historial de deshacer/rehacer acotado: un buffer circular de tuplas (tipo, a, b) que descarta
+# las acciones más antiguas al llenarse y se guarda en un archivo pequeño para sobrevivir reinicios.
+class HistorialCambios:
+    INVERSAS = {
+        "inscripcion": "cancelacion",
+        "cancelacion": "inscripcion",
+        "establecer_prerequisito": "eliminar_prerequisito",
+        "eliminar_prerequisito": "establecer_prerequisito",
+        "eliminar_curso": "restaurar_curso",
+        "restaurar_curso": "eliminar_curso"
+    }
+
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, limite=100, ruta=None):
+        self.limite = limite
+        self.ruta = ruta
+        self.deshacer = deque(maxlen=limite)
+        self.rehacer = deque(maxlen=limite)
+        self.modificado = False
+        self.asincrono = None
+        if ruta is not None and os.path.exists(ruta):
+            self._leer()
+
+# Retorna la acción que anula a la indicada.
+    @classmethod
+    def inversa(cls, accion):
+        tipo, a, b = accion
+        return (cls.INVERSAS[tipo], a, b)
+
+# Anota una acción nueva. Si anula a la última (inscribir y cancelar lo mismo) ambas se compactan.
+    def registrar(self, tipo, a, b=None):
+        accion = (tipo, a, b)
+        if self.deshacer and self.deshacer[-1] == self.inversa(accion):
+            self.deshacer.pop()
+        else:
+            self.deshacer.append(accion)
+        self.rehacer.clear()
+        self.modificado = True
+
+# Saca la última acción y aplica su inversa con `aplicar`; si se pudo, queda disponible para rehacer.
+    def deshacer_con(self, aplicar):
+        if not self.deshacer:
+            return False
+        accion = self.deshacer.pop()
+        hecho = aplicar(self.inversa(accion))
+        if hecho:
+            self.rehacer.append(accion)
+        self.modificado = True
+        return hecho
+
+# Vuelve a aplicar la última acción deshecha.
+    def rehacer_con(self, aplicar):
+        if not self.rehacer:
+            return False
+        accion = self.rehacer.pop()
+        hecho = aplicar(accion)
+        if hecho:
+            self.deshacer.append(accion)
+        self.modificado = True
+        return hecho
+
+    def puede_deshacer(self):
+        return len(self.deshacer) > 0
+
+    def puede_rehacer(self):
+        return len(self.rehacer) > 0
+
+    def estado(self):
+        return (list(self.deshacer), list(self.rehacer))
+
+    def restaurar(self, estado):
+        self.deshacer = deque(estado[0], maxlen=self.limite)
+        self.rehacer = deque(estado[1], maxlen=self.limite)
+        self.modificado = True
+
+    def _leer(self):
+        try:
+            with open(self.ruta, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+        except (OSError, ValueError):
+            logger.warning("Historial ilegible en %s, se empieza vacío", self.ruta)
+            return
+        self.deshacer.extend(tuple(accion) for accion in datos.get("deshacer", []))
+        self.rehacer.extend(tuple(accion) for accion in datos.get("rehacer", []))
+
+# Escribe el historial si cambió. Se escribe a un temporal y se reemplaza para no dejarlo a medias.
+    def guardar(self):
+        if self.ruta is None or not self.modificado:
+            return
+        datos = {"deshacer": list(self.deshacer), "rehacer": list(self.rehacer)}
+        self.modificado = False
+        if self.asincrono is not None:
+            self.asincrono.archivo(self.ruta, datos)
+            return
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(datos, f, ensure_ascii=False)
+        os.replace(temporal, self.ruta)
@@ -0,0 +1,233 @@
+# Importación y exportación masiva en CSV de estudiantes, cursos, materiales, prerequisitos e
+# inscripciones. Los archivos se recorren fila por fila, así que la memoria no crece con su tamaño:
+# las filas se validan en lotes contra los índices en memoria y cada lote se persiste una sola vez,
+# como una transacción. Las filas inválidas no detienen la importación: se informan con su número
+# de línea en el resultado y, si se pide, en un CSV de errores con la fila original.
+#
+#   resultado = importar_csv(sistema, "estudiantes", "alumnos.csv", reporte="errores.csv")
+#   exportar_csv(sistema, "inscripciones", "inscripciones.csv")
+
+import csv
+import itertools
+from contextlib import nullcontext
+
+from .entidades import Material
+
+# Columnas de cada tipo, en el orden en que se exportan. Al importar se buscan por nombre en el
+# encabezado, así que pueden venir en otro orden o con columnas extra.
+COLUMNAS = {
+    "estudiantes": ("id", "nombre", "email"),
+    "cursos": ("id", "nombre", "descripcion", "nivel"),
+    "materiales": ("id", "curso_id", "nombre", "tipo", "url"),
+    "prerequisitos": ("curso_id", "prerequisito_id"),
+    "inscripciones": ("estudiante_id", "curso_id")
+}
+TAMANO_LOTE = 5000
+MAXIMO_ERRORES_GUARDADOS = 100
+
+
+# Error de una fila: se informa y la importación sigue con la siguiente.
+class ErrorFila(ValueError):
+    pass
+
+
+# Resultado de una importación. Guarda solo los primeros errores para no crecer con el archivo;
+# el detalle completo va al reporte.
+class ResultadoImportacion:
+    def __init__(self, tipo):
+        self.tipo = tipo
+        self.filas = 0
+        self.importadas = 0
+        self.errores = 0
+        self.primeros_errores = []
+
+    def agregar_error(self, linea, mensaje):
+        self.errores += 1
+        if len(self.primeros_errores) < MAXIMO_ERRORES_GUARDADOS:
+            self.primeros_errores.append((linea, mensaje))
+
+    def __str__(self):
+        return f"{self.tipo}: {self.filas} filas, {self.importadas} importadas, {self.errores} con errores"
+
+
+# Abre una ruta, o usa tal cual un archivo ya abierto (que entonces no se cierra).
+def _abrir(archivo, modo):
+    if hasattr(archivo, "read") or hasattr(archivo, "write"):
+        return nullcontext(archivo)
+    return open(archivo, modo, encoding="utf-8-sig" if modo == "r" else "utf-8", newline="")
+
+
+def _entero(texto, columna):
+    try:
+        return int(texto)
+    except ValueError:
+        raise ErrorFila(f"{columna} no es un número entero: {texto!r}") from None
+
+
+def _requeridos(campos, columnas):
+    faltantes = [columna for columna, valor in zip(columnas, campos) if not valor]
+    if faltantes:
+        raise ErrorFila("faltan datos: " + ", ".join(faltantes))
+
+
+# Cada función recibe los campos de una fila, ya en el orden de COLUMNAS, la valida contra el estado
+# en memoria y la aplica; lanza ErrorFila si no se puede.
+def _importar_estudiante(sistema, campos):
+    _requeridos(campos, COLUMNAS["estudiantes"])
+    id, nombre, email = campos
+    id = _entero(id, "id")
+    if id in sistema.estudiantes:
+        raise ErrorFila(f"ya existe un estudiante con id {id}")
+    sistema.registrar_estudiante(id, nombre, email)
+
+
+def _importar_curso(sistema, campos):
+    _requeridos(campos, COLUMNAS["cursos"])
+    id, nombre, descripcion, nivel = campos
+    id = _entero(id, "id")
+    if id in sistema.cursos:
+        raise ErrorFila(f"ya existe un curso con id {id}")
+    if id in sistema.cursos_eliminados:
+        raise ErrorFila(f"el id {id} es de un curso eliminado")
+    sistema.crear_curso(id, nombre, descripcion, nivel)
+
+
+def _importar_material(sistema, campos):
+    _requeridos(campos, COLUMNAS["materiales"])
+    id, curso_id, nombre, tipo, url = campos
+    id = _entero(id, "id")
+    curso_id = _entero(curso_id, "curso_id")
+    if curso_id not in sistema.cursos:
+        raise ErrorFila(f"el curso {curso_id} no existe")
+    if id in sistema.indice_materiales:
+        raise ErrorFila(f"ya existe un material con id {id} (curso {sistema.curso_de_material(id)})")
+    sistema.agregar_material(curso_id, Material(id, nombre, tipo, url))
+
+
+RESULTADOS_INSCRIPCION = {
+    "ya_inscrito": "el estudiante ya estaba inscrito",
+    "prerequisitos_faltantes": "el estudiante no cumple los prerequisitos"
+}
+
+
+# Las inscripciones importadas no tienen cupo: el archivo manda, como una lista de clase ya armada.
+# Los prerequisitos sí se exigen, contando las inscripciones de las filas anteriores.
+def _importar_inscripcion(sistema, campos):
+    _requeridos(campos, COLUMNAS["inscripciones"])
+    estudiante_id = _entero(campos[0], "estudiante_id")
+    curso_id = _entero(campos[1], "curso_id")
+    if estudiante_id not in sistema.estudiantes:
+        raise ErrorFila(f"el estudiante {estudiante_id} no existe")
+    if curso_id not in sistema.cursos:
+        raise ErrorFila(f"el curso {curso_id} no existe")
+    resultado = sistema.inscribir_estudiante(estudiante_id, curso_id, capacidad_maxima=float("inf"))
+    if resultado is not True:
+        raise ErrorFila(RESULTADOS_INSCRIPCION[resultado])
+
+
+IMPORTADORES = {
+    "estudiantes": _importar_estudiante,
+    "cursos": _importar_curso,
+    "materiales": _importar_material,
+    "inscripciones": _importar_inscripcion
+}
+
+
+# Aplica un lote de filas (linea, fila, campos) y retorna los errores como (linea, fila, mensaje).
+def _aplicar_lote(sistema, tipo, lote):
+    errores = []
+    if tipo == "prerequisitos":
+        # Los prerequisitos válidos del lote se agregan juntos, con un solo recálculo del cierre del grafo.
+        lineas = {}
+        for linea, fila, campos in lote:
+            try:
+                _requeridos(campos, COLUMNAS["prerequisitos"])
+                par = (_entero(campos[0], "curso_id"), _entero(campos[1], "prerequisito_id"))
+                curso_id, prerequisito_id = par
+                for id in par:
+                    if id not in sistema.cursos:
+                        raise ErrorFila(f"el curso {id} no existe")
+                if curso_id == prerequisito_id:
+                    raise ErrorFila("un curso no puede ser prerequisito de sí mismo")
+                if par in lineas or prerequisito_id in sistema.cursos[curso_id].prerequisitos:
+                    raise ErrorFila("el prerequisito ya está establecido")
+                lineas[par] = (linea, fila)
+            except ErrorFila as e:
+                errores.append((linea, fila, str(e)))
+        for par in sistema.establecer_prerequisitos(lineas):
+            errores.append(lineas[par] + ("formaría un ciclo de prerequisitos",))
+        errores.sort(key=lambda error: error[0])
+        return errores
+
+    importar = IMPORTADORES[tipo]
+    for linea, fila, campos in lote:
+        try:
+            importar(sistema, campos)
+        except ErrorFila as e:
+            errores.append((linea, fila, str(e)))
+    return errores
+
+
+# Importa un CSV con encabezado. `archivo` y `reporte` pueden ser rutas o archivos abiertos; el
+# reporte recibe una fila por error: línea, motivo y la fila original, para corregirla y reimportarla.
+# Retorna un ResultadoImportacion. Lanza ValueError si el tipo o el encabezado no son válidos.
+def importar_csv(sistema, tipo, archivo, reporte=None, tamano_lote=TAMANO_LOTE):
+    if tipo not in COLUMNAS:
+        raise ValueError(f"Tipo desconocido: {tipo} (se esperaba uno de {', '.join(COLUMNAS)})")
+    resultado = ResultadoImportacion(tipo)
+    with _abrir(archivo, "r") as entrada, (_abrir(reporte, "w") if reporte is not None else nullcontext()) as salida:
+        lector = csv.reader(entrada)
+        encabezado = [columna.strip().lower() for columna in next(lector, [])]
+        faltantes = [columna for columna in COLUMNAS[tipo] if columna not in encabezado]
+        if faltantes:
+            raise ValueError(f"Faltan columnas en el encabezado: {', '.join(faltantes)}")
+        posiciones = [encabezado.index(columna) for columna in COLUMNAS[tipo]]
+        escritor = csv.writer(salida) if salida is not None else None
+        if escritor:
+            escritor.writerow(["linea", "error"] + encabezado)
+
+        filas = (
+            (lector.line_num, fila, [fila[i].strip() if i < len(fila) else "" for i in posiciones])
+            for fila in lector if any(campo.strip() for campo in fila)
+        )
+        with sistema.importacion_masiva():
+            while True:
+                lote = list(itertools.islice(filas, tamano_lote))
+                if not lote:
+                    break
+                with sistema.transaccion(reversible=False):
+                    errores = _aplicar_lote(sistema, tipo, lote)
+                resultado.filas += len(lote)
+                resultado.importadas += len(lote) - len(errores)
+                for linea, fila, mensaje in errores:
+                    resultado.agregar_error(linea, mensaje)
+                    if escritor:
+                        escritor.writerow([linea, mensaje] + fila)
+    return resultado
+
+
+# Filas de cada tipo en el orden de COLUMNAS, generadas a medida que se escriben.
+def _filas(sistema, tipo):
+    if tipo == "estudiantes":
+        return ((e.id, e.nombre, e.email) for e in sistema.estudiantes.values())
+    if tipo == "cursos":
+        return ((c.id, c.nombre, c.descripcion, c.nivel) for c in sistema.cursos.values())
+    if tipo == "materiales":
+        return ((m.id, c.id, m.nombre, m.tipo, m.url) for c in sistema.cursos.values() for m in c.materiales)
+    if tipo == "prerequisitos":
+        return ((c.id, p) for c in sistema.cursos.values() for p in c.prerequisitos)
+    return ((e.id, c.id) for c in sistema.cursos.values() for e in c.estudiantes)
+
+
+# Exporta un tipo a CSV con encabezado, en el formato que lee importar_csv. Retorna las filas escritas.
+def exportar_csv(sistema, tipo, archivo):
+    if tipo not in COLUMNAS:
+        raise ValueError(f"Tipo desconocido: {tipo} (se esperaba uno de {', '.join(COLUMNAS)})")
+    escritas = 0
+    with _abrir(archivo, "w") as salida:
+        escritor = csv.writer(salida)
+        escritor.writerow(COLUMNAS[tipo])
+        for fila in _filas(sistema, tipo):
+            escritor.writerow(fila)
+            escritas += 1
+    return escritas
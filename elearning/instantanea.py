@@ -0,0 +1,354 @@
+# Instantánea binaria del estado del sistema, alternativa al JSON para arrancar rápido.
+#
+# El archivo es una cabecera seguida de secciones con prefijo de largo (etiqueta de 4 bytes y largo
+# en 8 bytes, alineadas a 8). Todos los textos van una sola vez en una tabla de cadenas y las demás
+# secciones son columnas de enteros de 64 bits que los referencian por posición:
+#
+#   STRS  cantidad, desplazamientos (cantidad + 1) y los textos UTF-8, cada uno terminado en \0
+#   ESTU  id, nombre, email                                     (una fila de 3 enteros por estudiante)
+#   CURS  id, nombre, descripcion, nivel, eliminado
+#   MATE  id, curso_id, nombre, tipo, url, estado               (0 activo, 1 eliminado, 2 eliminado sin curso)
+#   INSC  estudiante_id, curso_id                               (en el orden de inscripción de cada curso)
+#   PREQ  curso_id, prerequisito_id
+#   ESPE  curso_id, estudiante_id, prioridad                    (en orden de atención)
+#   META  JSON con la secuencia del diario y los prerequisitos eliminados
+#
+# LectorInstantanea mapea el archivo con mmap y no decodifica nada al abrirlo: una fila suelta se arma
+# recién cuando se pide, decodificando solo sus textos; al recorrer una sección completa, la tabla de
+# cadenas se decodifica de una vez. Tanto el lector como FilasJSON (que adapta el diccionario del JSON)
+# entregan las mismas filas, que es lo que consume el sistema al cargar.
+#
+# El sistema no aprovecha esa lectura por demanda: al cargar recorre todas las secciones y arma todas
+# las entidades, índices y el grafo (ver SistemaELearning._reconstruir). La instantánea ahorra el
+# parseo del JSON, no la reconstrucción, así que el arranque sigue creciendo con el catálogo.
+
+import json
+import mmap
+import os
+import struct
+from array import array
+
+from .persistencia import escribir_json_atomico
+
+MAGIA = b"ELSNAP\x00\x01"
+CABECERA_SECCION = struct.Struct("<4s4xQ")
+ANCHOS = {"ESTU": 3, "CURS": 5, "MATE": 6, "INSC": 2, "PREQ": 2, "ESPE": 3}
+ACTIVO, ELIMINADO, ELIMINADO_SIN_CURSO = 0, 1, 2
+FILAS_POR_BLOQUE = 4096
+
+
+# Filas del diccionario de datos en el formato del archivo JSON (el de _exportar_datos). Las filas solo
+# llevan el id del curso, así que un curso eliminado con el mismo id que uno activo (posible en archivos
+# anteriores a que crear_curso lo impidiera) se omite: si no, sus filas se mezclarían con las del activo.
+class FilasJSON:
+    def __init__(self, datos):
+        self.datos = datos
+
+    def _todos_los_cursos(self):
+        activos = set()
+        for c in self.datos.get("cursos", []):
+            activos.add(c["id"])
+            yield 0, c
+        for c in self.datos.get("cursos_eliminados", []):
+            if c["id"] not in activos:
+                yield 1, c
+
+    def estudiantes(self):
+        return ((e["id"], e["nombre"], e["email"]) for e in self.datos.get("estudiantes", []))
+
+    def cursos(self):
+        return ((c["id"], c["nombre"], c["descripcion"], c["nivel"], eliminado) for eliminado, c in self._todos_los_cursos())
+
+    def materiales(self):
+        for _, c in self._todos_los_cursos():
+            for m in c.get("materiales", []):
+                yield m["id"], c["id"], m["nombre"], m["tipo"], m["url"], ACTIVO
+        for m in self.datos.get("materiales_eliminados", []):
+            curso_id = m.get("curso_id")
+            yield m["id"], curso_id, m["nombre"], m["tipo"], m["url"], ELIMINADO if curso_id is not None else ELIMINADO_SIN_CURSO
+
+    def prerequisitos(self):
+        return ((c["id"], p) for _, c in self._todos_los_cursos() for p in c.get("prerequisitos", []))
+
+    def inscripciones(self):
+        return ((e, c["id"]) for _, c in self._todos_los_cursos() for e in c.get("estudiantes", []))
+
+    def listas_espera(self):
+        return (
+            (int(curso_id), estudiante_id, prioridad)
+            for curso_id, entradas in self.datos.get("listas_espera", {}).items()
+            for estudiante_id, prioridad in entradas
+        )
+
+    def prerequisitos_eliminados(self):
+        return dict(self.datos.get("prerequisitos_eliminados", {}))
+
+    def secuencia_diario(self):
+        return self.datos.get("secuencia_diario", 0)
+
+
+# Lee una instantánea binaria mapeada en memoria. Se usa como `with LectorInstantanea(ruta) as filas:`;
+# las filas ya entregadas siguen siendo válidas después de cerrarlo, porque son objetos de Python.
+class LectorInstantanea:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, ruta):
+        self.ruta = ruta
+        with open(ruta, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._vistas = []
+        self._columnas = {}
+        self._meta = None
+        self.secciones = {}
+        try:
+            if self._mapa[:len(MAGIA)] != MAGIA:
+                raise ValueError(f"{ruta} no es una instantánea del sistema (o es de otra versión)")
+            posicion = len(MAGIA)
+            while posicion < len(self._mapa):
+                etiqueta, largo = CABECERA_SECCION.unpack_from(self._mapa, posicion)
+                posicion += CABECERA_SECCION.size
+                if posicion + largo > len(self._mapa):
+                    seccion = etiqueta.decode("ascii", "replace")
+                    raise ValueError(f"{ruta} está truncada: la sección {seccion} pasa del final del archivo")
+                self.secciones[etiqueta.decode("ascii")] = (posicion, largo)
+                posicion += largo + (-largo % 8)
+            faltantes = {"STRS", "META", *ANCHOS} - set(self.secciones)
+            if faltantes:
+                raise ValueError(f"{ruta} está incompleta: faltan las secciones {sorted(faltantes)}")
+            inicio, _ = self.secciones["STRS"]
+            cantidad = struct.unpack_from("<q", self._mapa, inicio)[0]
+            self._desplazamientos = self._enteros(inicio + 8, cantidad + 1)
+            self._textos = inicio + 8 * (cantidad + 2)
+            self._cadenas = [None] * cantidad
+            self._todas_decodificadas = False
+        except Exception:
+            self.cerrar()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        for vista in self._vistas:
+            vista.release()
+        self._vistas = []
+        self._columnas = {}
+        if not self._mapa.closed:
+            self._mapa.close()
+
+    def _enteros(self, inicio, cantidad):
+        bruta = memoryview(self._mapa)[inicio:inicio + 8 * cantidad]
+        vista = bruta.cast("q")
+        self._vistas.extend((vista, bruta))
+        return vista
+
+# Retorna la columna de enteros de una sección (vacía si el archivo no la trae).
+    def columna(self, etiqueta):
+        if etiqueta not in self._columnas:
+            if etiqueta not in self.secciones:
+                return ()
+            inicio, largo = self.secciones[etiqueta]
+            self._columnas[etiqueta] = self._enteros(inicio, largo // 8)
+        return self._columnas[etiqueta]
+
+# Retorna el texto en la posición dada de la tabla de cadenas, decodificándolo la primera vez.
+    def cadena(self, indice):
+        texto = self._cadenas[indice]
+        if texto is None:
+            desde = self._textos + self._desplazamientos[indice]
+            hasta = self._textos + self._desplazamientos[indice + 1] - 1
+            texto = self._cadenas[indice] = self._mapa[desde:hasta].decode("utf-8")
+        return texto
+
+# Decodifica toda la tabla de cadenas con un solo decode y un split, para recorridos completos.
+# Si algún texto contiene \0 la partición no cuadra y se decodifican uno por uno.
+    def cadenas(self):
+        if not self._todas_decodificadas:
+            cantidad = len(self._cadenas)
+            fin = self._textos + self._desplazamientos[cantidad]
+            partes = self._mapa[self._textos:fin].decode("utf-8").split("\0")
+            if len(partes) == cantidad + 1:
+                self._cadenas = partes[:cantidad]
+            else:
+                self._cadenas = [self.cadena(i) for i in range(cantidad)]
+            self._todas_decodificadas = True
+        return self._cadenas
+
+    def cantidad(self, etiqueta):
+        return len(self.columna(etiqueta)) // ANCHOS[etiqueta]
+
+# Retorna la fila `indice` de una sección como tupla, con los textos ya decodificados.
+    def fila(self, etiqueta, indice):
+        ancho = ANCHOS[etiqueta]
+        valores = self.columna(etiqueta)[indice * ancho:(indice + 1) * ancho].tolist()
+        return self._decodificar(etiqueta, valores)
+
+    def _decodificar(self, etiqueta, v):
+        cadena = self.cadena
+        if etiqueta == "ESTU":
+            return v[0], cadena(v[1]), cadena(v[2])
+        if etiqueta == "CURS":
+            return v[0], cadena(v[1]), cadena(v[2]), cadena(v[3]), v[4]
+        if etiqueta == "MATE":
+            return v[0], v[1] if v[5] != ELIMINADO_SIN_CURSO else None, cadena(v[2]), cadena(v[3]), cadena(v[4]), v[5]
+        return tuple(v)
+
+# Recorre una sección por bloques: cada bloque se copia a una lista de una vez y se parte en tuplas.
+    def _tuplas(self, etiqueta):
+        columna = self.columna(etiqueta)
+        ancho = ANCHOS[etiqueta]
+        paso = ancho * FILAS_POR_BLOQUE
+        for inicio in range(0, len(columna), paso):
+            valores = columna[inicio:inicio + paso].tolist()
+            yield from zip(*(valores[k::ancho] for k in range(ancho)))
+
+    def estudiantes(self):
+        cadenas = self.cadenas()
+        return ((id, cadenas[nombre], cadenas[email]) for id, nombre, email in self._tuplas("ESTU"))
+
+    def cursos(self):
+        cadenas = self.cadenas()
+        return (
+            (id, cadenas[nombre], cadenas[descripcion], cadenas[nivel], eliminado)
+            for id, nombre, descripcion, nivel, eliminado in self._tuplas("CURS")
+        )
+
+    def materiales(self):
+        cadenas = self.cadenas()
+        return (
+            (id, curso_id if estado != ELIMINADO_SIN_CURSO else None, cadenas[nombre], cadenas[tipo], cadenas[url], estado)
+            for id, curso_id, nombre, tipo, url, estado in self._tuplas("MATE")
+        )
+
+    def prerequisitos(self):
+        return self._tuplas("PREQ")
+
+    def inscripciones(self):
+        return self._tuplas("INSC")
+
+    def listas_espera(self):
+        return self._tuplas("ESPE")
+
+    def meta(self):
+        if self._meta is None:
+            self._meta = {}
+            if "META" in self.secciones:
+                inicio, largo = self.secciones["META"]
+                self._meta = json.loads(self._mapa[inicio:inicio + largo].decode("utf-8"))
+        return self._meta
+
+    def prerequisitos_eliminados(self):
+        return dict(self.meta().get("prerequisitos_eliminados", {}))
+
+    def secuencia_diario(self):
+        return self.meta().get("secuencia_diario", 0)
+
+
+# Escribe una instantánea a partir de filas (FilasJSON o LectorInstantanea), en un temporal que se
+# renombra encima del destino como escribir_json_atomico.
+def escribir_instantanea(ruta, filas):
+    indices = {}
+    textos = []
+
+    def cadena(texto):
+        indice = indices.get(texto)
+        if indice is None:
+            indice = indices[texto] = len(textos)
+            textos.append(texto.encode("utf-8"))
+        return indice
+
+    columnas = {etiqueta: array("q") for etiqueta in ANCHOS}
+    for id, nombre, email in filas.estudiantes():
+        columnas["ESTU"].extend((id, cadena(nombre), cadena(email)))
+    for id, nombre, descripcion, nivel, eliminado in filas.cursos():
+        columnas["CURS"].extend((id, cadena(nombre), cadena(descripcion), cadena(nivel), int(eliminado)))
+    for id, curso_id, nombre, tipo, url, estado in filas.materiales():
+        columnas["MATE"].extend((id, curso_id if curso_id is not None else 0, cadena(nombre), cadena(tipo), cadena(url), estado))
+    for etiqueta, generador in (("PREQ", filas.prerequisitos), ("INSC", filas.inscripciones), ("ESPE", filas.listas_espera)):
+        for fila in generador():
+            columnas[etiqueta].extend(fila)
+
+    desplazamientos = array("q", [0])
+    for texto in textos:
+        desplazamientos.append(desplazamientos[-1] + len(texto) + 1)
+    meta = {"secuencia_diario": filas.secuencia_diario(), "prerequisitos_eliminados": filas.prerequisitos_eliminados()}
+
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as f:
+        def seccion(etiqueta, *partes):
+            largo = sum(len(parte) for parte in partes)
+            f.write(CABECERA_SECCION.pack(etiqueta.encode("ascii"), largo))
+            for parte in partes:
+                f.write(parte)
+            f.write(b"\0" * (-largo % 8))
+
+        f.write(MAGIA)
+        seccion("STRS", struct.pack("<q", len(textos)), desplazamientos.tobytes(), b"".join(t + b"\0" for t in textos))
+        for etiqueta, columna in columnas.items():
+            seccion(etiqueta, columna.tobytes())
+        seccion("META", json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+# Arma el diccionario del formato JSON a partir de filas, para convertir una instantánea a JSON.
+def datos_desde_filas(filas):
+    cursos = {}
+    eliminados = {}
+    for id, nombre, descripcion, nivel, eliminado in filas.cursos():
+        destino = eliminados if eliminado else cursos
+        destino[id] = {"id": id, "nombre": nombre, "descripcion": descripcion, "nivel": nivel,
+                       "materiales": [], "estudiantes": [], "prerequisitos": []}
+    materiales_eliminados = []
+    for id, curso_id, nombre, tipo, url, estado in filas.materiales():
+        material = {"id": id, "nombre": nombre, "tipo": tipo, "url": url}
+        if estado == ACTIVO:
+            curso = cursos.get(curso_id) or eliminados.get(curso_id)
+            if curso:
+                curso["materiales"].append(material)
+        else:
+            material["curso_id"] = curso_id
+            materiales_eliminados.append(material)
+    for curso_id, prerequisito_id in filas.prerequisitos():
+        curso = cursos.get(curso_id) or eliminados.get(curso_id)
+        if curso:
+            curso["prerequisitos"].append(prerequisito_id)
+    for estudiante_id, curso_id in filas.inscripciones():
+        curso = cursos.get(curso_id) or eliminados.get(curso_id)
+        if curso:
+            curso["estudiantes"].append(estudiante_id)
+    cursos_de_estudiante = {}
+    for curso in cursos.values():
+        for estudiante_id in curso["estudiantes"]:
+            cursos_de_estudiante.setdefault(estudiante_id, []).append(curso["id"])
+    listas_espera = {}
+    for curso_id, estudiante_id, prioridad in filas.listas_espera():
+        listas_espera.setdefault(str(curso_id), []).append([estudiante_id, prioridad])
+    return {
+        "estudiantes": [
+            {"id": id, "nombre": nombre, "email": email, "cursos": cursos_de_estudiante.get(id, [])}
+            for id, nombre, email in filas.estudiantes()
+        ],
+        "cursos": list(cursos.values()),
+        "cursos_eliminados": list(eliminados.values()),
+        "materiales_eliminados": materiales_eliminados,
+        "prerequisitos_eliminados": filas.prerequisitos_eliminados(),
+        "listas_espera": listas_espera,
+        "secuencia_diario": filas.secuencia_diario()
+    }
+
+
+# Convierte el JSON del sistema en una instantánea binaria.
+def json_a_instantanea(ruta_json, ruta_instantanea):
+    with open(ruta_json, "r", encoding="utf-8") as f:
+        escribir_instantanea(ruta_instantanea, FilasJSON(json.load(f)))
+
+
+# Convierte una instantánea binaria en el JSON del sistema (con sangría, como guardar_en_json).
+def instantanea_a_json(ruta_instantanea, ruta_json):
+    with LectorInstantanea(ruta_instantanea) as filas:
+        datos = datos_desde_filas(filas)
+    escribir_json_atomico(ruta_json, datos, indent=2)
@@ -0,0 +1,81 @@
+# Métricas de uso: conteo de llamadas e histogramas de latencia por operación.
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+# Histograma de latencias con cubetas logarítmicas (cuatro por cada potencia de dos): la memoria es
+# fija sin importar cuántas llamadas se midan y los percentiles salen con un error menor al 20 %.
+class HistogramaLatencias:
+    CUBETAS_POR_OCTAVA = 4
+
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.cubetas = {}
+        self.llamadas = 0
+        self.total = 0.0
+        self.maximo = 0.0
+
+    def registrar(self, segundos):
+        nanos = max(segundos * 1e9, 1.0)
+        cubeta = int(math.log2(nanos) * self.CUBETAS_POR_OCTAVA)
+        self.cubetas[cubeta] = self.cubetas.get(cubeta, 0) + 1
+        self.llamadas += 1
+        self.total += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+# Retorna el percentil (0-100) en segundos, usando el límite superior de la cubeta.
+    def percentil(self, p):
+        if not self.llamadas:
+            return 0.0
+        objetivo = math.ceil(self.llamadas * p / 100)
+        acumulado = 0
+        for cubeta in sorted(self.cubetas):
+            acumulado += self.cubetas[cubeta]
+            if acumulado >= objetivo:
+                limite = 2 ** ((cubeta + 1) / self.CUBETAS_POR_OCTAVA) / 1e9
+                return min(limite, self.maximo)
+        return self.maximo
+
+    def resumen(self):
+        return {
+            "llamadas": self.llamadas,
+            "total_ms": self.total * 1e3,
+            "p50_ms": self.percentil(50) * 1e3,
+            "p95_ms": self.percentil(95) * 1e3,
+            "p99_ms": self.percentil(99) * 1e3,
+            "max_ms": self.maximo * 1e3
+        }
+
+
+# Conteos y latencias por nombre de operación (métodos públicos y fases de persistencia).
+class Metricas:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self.histogramas = {}
+        self._candado = threading.Lock()
+
+# El hilo de guardado en segundo plano también registra aquí, por eso el candado.
+    def registrar(self, nombre, segundos):
+        with self._candado:
+            histograma = self.histogramas.get(nombre)
+            if histograma is None:
+                histograma = self.histogramas[nombre] = HistogramaLatencias()
+            histograma.registrar(segundos)
+
+    @contextmanager
+    def medir(self, nombre):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(nombre, time.perf_counter() - inicio)
+
+    def resumen(self):
+        with self._candado:
+            return {nombre: h.resumen() for nombre, h in sorted(self.histogramas.items())}
+
+    def reiniciar(self):
+        self.histogramas.clear()
@@ -0,0 +1,682 @@
+# Persistencia del sistema e-learning: rutas de los archivos de datos, diario de cambios y almacén SQLite.
+# Importar este módulo no toca el disco; la carpeta de datos se crea al construir el sistema.
+
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: los datos compartidos entre procesos no están disponibles.
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+data_folder = "data"
+ARCHIVO_JSON = "elearning_datos.json"
+ARCHIVO_DIARIO = "elearning_datos_diario.jsonl"
+ARCHIVO_SQLITE = "elearning_datos.sqlite3"
+ARCHIVO_HISTORIAL = "elearning_datos_historial.json"
+ARCHIVO_INSTANTANEA = "elearning_datos.snap"
+ARCHIVO_FRAGMENTOS = "elearning_fragmentos"
+ARCHIVO_CERROJO = "elearning_datos.lock"
+
+ruta_json = os.path.join(data_folder, ARCHIVO_JSON)
+ruta_diario = os.path.join(data_folder, ARCHIVO_DIARIO)
+ruta_sqlite = os.path.join(data_folder, ARCHIVO_SQLITE)
+ruta_historial = os.path.join(data_folder, ARCHIVO_HISTORIAL)
+ruta_instantanea = os.path.join(data_folder, ARCHIVO_INSTANTANEA)
+ruta_fragmentos = os.path.join(data_folder, ARCHIVO_FRAGMENTOS)
+
+
+# Crea la carpeta que contiene a `ruta` si todavía no existe.
+def asegurar_directorio(ruta):
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+
+
+# Escribe un JSON en un temporal y lo renombra encima del destino: quien lee ve el archivo viejo o el
+# nuevo completo, nunca uno a medio escribir.
+def escribir_json_atomico(ruta, datos, indent=None):
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(datos, f, indent=indent, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+# Cerrojo consultivo entre procesos sobre un archivo (fcntl.flock): varios lectores o un solo escritor.
+# Es reentrante dentro del proceso: si ya está tomado, volver a tomarlo solo cuenta la profundidad. No
+# se puede pasar de compartido a exclusivo sin soltarlo, porque otro lector podría estar esperando lo mismo.
+class CerrojoArchivo:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, ruta):
+        if fcntl is None:
+            raise RuntimeError("Los datos compartidos entre procesos requieren fcntl (Linux o macOS)")
+        self.ruta = ruta
+        self.archivo = None
+        self.modo = None
+        self.profundidad = 0
+
+    @property
+    def tomado(self):
+        return self.profundidad > 0
+
+    def compartido(self):
+        return self._tomar(fcntl.LOCK_SH)
+
+    def exclusivo(self):
+        return self._tomar(fcntl.LOCK_EX)
+
+    @contextmanager
+    def _tomar(self, modo):
+        if self.profundidad == 0:
+            if self.archivo is None:
+                asegurar_directorio(self.ruta)
+                self.archivo = open(self.ruta, "a")
+            fcntl.flock(self.archivo.fileno(), modo)
+            self.modo = modo
+        elif modo == fcntl.LOCK_EX and self.modo == fcntl.LOCK_SH:
+            raise RuntimeError("El cerrojo está tomado como compartido; no se puede volver a tomar como exclusivo")
+        self.profundidad += 1
+        try:
+            yield
+        finally:
+            self.profundidad -= 1
+            if self.profundidad == 0:
+                fcntl.flock(self.archivo.fileno(), fcntl.LOCK_UN)
+                self.modo = None
+
+    def cerrar(self):
+        if self.archivo is not None:
+            self.archivo.close()
+            self.archivo = None
+
+
+# Clase que implementa un diario de cambios de solo anexado, guardado junto al archivo JSON.
+# Cada mutación se escribe como un registro pequeño (una línea JSON) y cada cierto número de
+# registros se hace un checkpoint que vuelca el estado completo y vacía el diario.
+# Con `compartido` varios procesos escriben en el mismo diario (siempre con el cerrojo tomado): cada uno
+# recuerda hasta qué byte leyó, y un checkpoint reemplaza el archivo por uno nuevo que empieza con un
+# registro "checkpoint" con su secuencia, para que los demás noten que se reescribió y desde dónde. El
+# diario reemplazado queda como .anterior para que quien venía atrasado termine de leerlo sin recargar.
+class DiarioCambios:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, ruta, intervalo_checkpoint=500, compartido=False):
+        self.ruta = ruta
+        self.intervalo_checkpoint = intervalo_checkpoint
+        self.secuencia = 0
+        self.pendientes = 0
+        self.asincrono = None
+        self.compartido = compartido
+        self._inodo = None
+        self._posicion = 0
+        self._firma = None
+
+# Agrega un registro al final del diario. Retorna True si ya toca hacer un checkpoint.
+    def anexar(self, operacion, argumentos):
+        self.secuencia += 1
+        registro = {"seq": self.secuencia, "op": operacion, "args": argumentos}
+        self._escribir([json.dumps(registro, ensure_ascii=False) + "\n"])
+        self.pendientes += 1
+        return self.pendientes >= self.intervalo_checkpoint
+
+# Agrega varios registros con una sola escritura. Retorna True si ya toca hacer un checkpoint.
+    def anexar_lote(self, operaciones):
+        lineas = []
+        for operacion, argumentos in operaciones:
+            self.secuencia += 1
+            registro = {"seq": self.secuencia, "op": operacion, "args": argumentos}
+            lineas.append(json.dumps(registro, ensure_ascii=False) + "\n")
+        self._escribir(lineas)
+        self.pendientes += len(lineas)
+        return self.pendientes >= self.intervalo_checkpoint
+
+# Lee los registros posteriores a una secuencia dada, ignorando una última línea incompleta.
+    def leer(self, desde_secuencia=0):
+        if not os.path.exists(self.ruta):
+            return []
+        registros = []
+        with open(self.ruta, "r", encoding="utf-8") as f:
+            for linea in f:
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    break
+                if registro["seq"] > desde_secuencia and registro["op"] != "checkpoint":
+                    registros.append(registro)
+        return registros
+
+# Lee los registros que otros procesos anexaron desde la última lectura o escritura de este. Si el
+# archivo no cambió cuesta un stat. Retorna None si un checkpoint reescribió el diario con registros
+# que este proceso no llegó a ver: entonces hay que recargar todo.
+    def leer_nuevos(self):
+        try:
+            estado = os.stat(self.ruta)
+        except FileNotFoundError:
+            return []
+        if self._firma == (estado.st_ino, estado.st_size, estado.st_mtime_ns):
+            return []
+        with open(self.ruta, "rb") as f:
+            estado = os.fstat(f.fileno())
+            if estado.st_ino == self._inodo and estado.st_size > self._posicion:
+                f.seek(self._posicion)
+                registros, leidos = self._analizar(f.read())
+                # Los inodos se reutilizan: solo se sigue leyendo desde la posición si la secuencia continúa.
+                if registros and registros[0]["seq"] == self.secuencia + 1:
+                    self._posicion += leidos
+                    self._recordar(estado)
+                    return registros
+                f.seek(0)
+            nuevos, leidos = self._analizar(f.read())
+        anteriores = self._resto_anterior()
+        self._inodo, self._posicion = estado.st_ino, leidos
+        self._recordar(estado)
+        # Archivo nuevo: sirve si empieza justo después de lo que este proceso ya tiene.
+        secuencia = anteriores[-1]["seq"] if anteriores else self.secuencia
+        if not nuevos:
+            return None
+        primero = nuevos[0]
+        inicio = primero["seq"] if primero["op"] == "checkpoint" else primero["seq"] - 1
+        if inicio > secuencia:
+            return None
+        return anteriores + [r for r in nuevos if r["seq"] > secuencia and r["op"] != "checkpoint"]
+
+# Lo que faltaba leer del diario que reemplazó el último checkpoint, si es el que este proceso venía leyendo.
+    def _resto_anterior(self):
+        try:
+            with open(self.ruta + ".anterior", "rb") as f:
+                if os.fstat(f.fileno()).st_ino != self._inodo:
+                    return []
+                f.seek(self._posicion)
+                registros, _ = self._analizar(f.read())
+        except FileNotFoundError:
+            return []
+        if not registros or registros[0]["seq"] != self.secuencia + 1:
+            return []
+        return [r for r in registros if r["op"] != "checkpoint"]
+
+# Registros completos de un bloque de bytes y cuántos bytes ocupan; una última línea incompleta queda para después.
+# Retorna None (y 0) si hay una línea que no es JSON.
+    def _analizar(self, bloque):
+        fin = bloque.rfind(b"\n") + 1
+        registros = []
+        try:
+            for linea in bloque[:fin].splitlines():
+                if linea:
+                    registros.append(json.loads(linea))
+        except ValueError:
+            return None, 0
+        return registros, fin
+
+# Toma el archivo actual como leído hasta el final (después de cargarlo con el cerrojo tomado).
+    def sincronizar(self):
+        try:
+            estado = os.stat(self.ruta)
+        except FileNotFoundError:
+            self._inodo, self._posicion, self._firma = None, 0, None
+            return
+        self._inodo, self._posicion = estado.st_ino, estado.st_size
+        self._recordar(estado)
+
+# Guarda inodo, tamaño y fecha de modificación del archivo leído hasta el final: mientras no cambien,
+# no hay nada nuevo. Solo el inodo y el tamaño no alcanzan, porque un checkpoint puede dejar un archivo
+# nuevo con el inodo de uno borrado y justo el mismo tamaño.
+    def _recordar(self, estado):
+        if estado.st_size == self._posicion:
+            self._firma = (estado.st_ino, estado.st_size, estado.st_mtime_ns)
+        else:
+            self._firma = None
+
+# Escribe las líneas al final del archivo, o se las pasa al guardado en segundo plano si lo hay.
+    def _escribir(self, lineas):
+        if self.asincrono is not None:
+            self.asincrono.anexar(lineas)
+            return
+        with open(self.ruta, "a", encoding="utf-8") as f:
+            f.writelines(lineas)
+            if self.compartido:
+                f.flush()
+                estado = os.fstat(f.fileno())
+                self._inodo, self._posicion = estado.st_ino, estado.st_size
+                self._recordar(estado)
+
+# Aparta el archivo del diario (queda como .descartado) y vuelve a empezar desde la secuencia 0.
+# Se usa cuando el diario quedó sin el checkpoint al que pertenecen sus registros.
+    def descartar(self):
+        if os.path.exists(self.ruta):
+            logger.warning("Diario %s sin datos a los que aplicarlo; se aparta como .descartado", self.ruta)
+            os.replace(self.ruta, self.ruta + ".descartado")
+        self.secuencia = 0
+        self.pendientes = 0
+        self.sincronizar()
+
+# Vacía el diario después de un checkpoint. Con guardado en segundo plano el archivo lo vacía el
+# hilo de guardado, justo después de escribir el checkpoint.
+    def truncar(self):
+        if self.compartido:
+            temporal = self.ruta + ".tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"seq": self.secuencia, "op": "checkpoint", "args": []}) + "\n")
+            if os.path.exists(self.ruta):
+                os.replace(self.ruta, self.ruta + ".anterior")
+            os.replace(temporal, self.ruta)
+            self.sincronizar()
+        elif self.asincrono is None:
+            with open(self.ruta, "w", encoding="utf-8"):
+                pass
+        self.pendientes = 0
+
+
+# Hilo de guardado en segundo plano para que la interfaz no espere al disco. Recibe líneas del diario,
+# checkpoints completos y archivos pequeños (el historial); junta todo lo que llegue en una ventana
+# corta y lo escribe de una vez: del checkpoint y de cada archivo solo se escribe la última versión, y
+# las líneas del diario anteriores a ese checkpoint se descartan porque ya están incluidas en él.
+# Los errores no se lanzan en el hilo: quedan en `errores` para que la interfaz los muestre, y lo que no
+# se pudo escribir se conserva y se vuelve a intentar junto con el lote siguiente.
+class GuardadoAsincrono:
+# Método constructor que inicializa los atributos de la clase.
+# `escribir(ruta, datos)` escribe el checkpoint; por defecto es el JSON con sangría de guardar_en_json.
+# Si cada checkpoint trae solo una parte del estado, `combinar(anterior, nuevo)` junta dos seguidos en
+# vez de quedarse con el último.
+    def __init__(self, ruta_instantanea, ruta_diario=None, ventana=0.05, metricas=None, escribir=None, combinar=None):
+        self.ruta_instantanea = ruta_instantanea
+        self.escribir = escribir
+        self.combinar = combinar
+        self.ruta_diario = ruta_diario
+        self.ventana = ventana
+        self.metricas = metricas
+        self.cola = queue.Queue()
+        self.errores = queue.Queue()
+        self._reintentar = []
+        self.hilo = threading.Thread(target=self._trabajar, name="guardado-elearning", daemon=True)
+        self.hilo.start()
+
+    def anexar(self, lineas):
+        self.cola.put(("diario", lineas))
+
+    def instantanea(self, datos):
+        self.cola.put(("instantanea", datos))
+
+    def archivo(self, ruta, datos):
+        self.cola.put(("archivo", ruta, datos))
+
+# Bloquea hasta que todo lo encolado hasta ahora esté en disco. Retorna el error del lote en el que se
+# escribió, o None si se escribió bien: cada espera recibe el de su propio lote, no el de otro anterior.
+    def esperar(self):
+        if not self.hilo.is_alive():
+            return None
+        listo = threading.Event()
+        resultado = []
+        self.cola.put(("aviso", listo, resultado))
+        listo.wait()
+        return resultado[0] if resultado else None
+
+# Escribe lo pendiente y detiene el hilo.
+    def cerrar(self):
+        if self.hilo.is_alive():
+            self.cola.put(None)
+            self.hilo.join()
+
+    def _trabajar(self):
+        while True:
+            tareas = [self.cola.get()]
+            if tareas[0] is not None:
+                time.sleep(self.ventana)
+            while True:
+                try:
+                    tareas.append(self.cola.get_nowait())
+                except queue.Empty:
+                    break
+            terminar = None in tareas
+            tareas = [t for t in tareas if t is not None]
+            error = None
+            try:
+                self._escribir_lote(self._reintentar + tareas)
+                self._reintentar = []
+            except Exception as e:
+                logger.exception("Error en el guardado en segundo plano")
+                self.errores.put(e)
+                self._reintentar = [t for t in self._reintentar + tareas if t[0] != "aviso"]
+                error = e
+            for tarea in tareas:
+                if tarea[0] == "aviso":
+                    if error is not None:
+                        tarea[2].append(error)
+                    tarea[1].set()
+            if terminar:
+                return
+
+    def _escribir_lote(self, tareas):
+        instantanea = None
+        lineas = []
+        archivos = {}
+        for tarea in tareas:
+            if tarea[0] == "instantanea":
+                if instantanea is not None and self.combinar is not None:
+                    instantanea = self.combinar(instantanea, tarea[1])
+                else:
+                    instantanea = tarea[1]
+                lineas = []
+            elif tarea[0] == "diario":
+                lineas.extend(tarea[1])
+            elif tarea[0] == "archivo":
+                archivos[tarea[1]] = tarea[2]
+        inicio = time.perf_counter()
+        if instantanea is not None and self.escribir is not None:
+            self.escribir(self.ruta_instantanea, instantanea)
+        elif instantanea is not None:
+            escribir_json_atomico(self.ruta_instantanea, instantanea, indent=2)
+        if self.ruta_diario is not None and (instantanea is not None or lineas):
+            with open(self.ruta_diario, "w" if instantanea is not None else "a", encoding="utf-8") as f:
+                f.writelines(lineas)
+        for ruta, datos in archivos.items():
+            escribir_json_atomico(ruta, datos)
+        if self.metricas is not None and (instantanea is not None or lineas or archivos):
+            self.metricas.registrar("persistencia.segundo_plano", time.perf_counter() - inicio)
+
+
+# Clase que guarda el estado del sistema en una base SQLite. Cada mutación se confirma como una
+# transacción pequeña sobre las filas afectadas.
+# Es solo el almacenamiento durable: al arrancar, SistemaELearning lee todas las filas con cargar() y
+# trabaja en memoria como con el JSON, así que el arranque sigue creciendo con el catálogo y los datos
+# tienen que caber en RAM. Lo que ahorra es reescribir el archivo completo en cada cambio. Los índices
+# son los que usan esas transacciones y buscar_estudiante_por_email; las demás búsquedas son en memoria.
+class AlmacenSQLite:
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS estudiantes (
+            id INTEGER PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            email TEXT
+        );
+        CREATE TABLE IF NOT EXISTS cursos (
+            id INTEGER PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            descripcion TEXT,
+            nivel TEXT,
+            eliminado INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS materiales (
+            fila INTEGER PRIMARY KEY,
+            id INTEGER NOT NULL,
+            curso_id INTEGER,
+            nombre TEXT,
+            tipo TEXT,
+            url TEXT,
+            eliminado INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS inscripciones (
+            orden INTEGER PRIMARY KEY,
+            estudiante_id INTEGER NOT NULL,
+            curso_id INTEGER NOT NULL,
+            UNIQUE (estudiante_id, curso_id)
+        );
+        CREATE TABLE IF NOT EXISTS prerequisitos (
+            orden INTEGER PRIMARY KEY,
+            curso_id INTEGER NOT NULL,
+            prerequisito_id INTEGER NOT NULL,
+            UNIQUE (curso_id, prerequisito_id)
+        );
+        CREATE TABLE IF NOT EXISTS listas_espera (
+            orden INTEGER PRIMARY KEY,
+            curso_id INTEGER NOT NULL,
+            estudiante_id INTEGER NOT NULL,
+            prioridad INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS prerequisitos_eliminados (
+            clave TEXT PRIMARY KEY,
+            valor TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_estudiantes_email ON estudiantes (email);
+        CREATE INDEX IF NOT EXISTS idx_materiales_id ON materiales (id);
+        CREATE INDEX IF NOT EXISTS idx_materiales_curso ON materiales (curso_id);
+        CREATE INDEX IF NOT EXISTS idx_prerequisitos_prerequisito ON prerequisitos (prerequisito_id);
+        CREATE INDEX IF NOT EXISTS idx_listas_espera_curso ON listas_espera (curso_id, prioridad, orden);
+        DROP INDEX IF EXISTS idx_cursos_nombre;
+        DROP INDEX IF EXISTS idx_inscripciones_curso;
+    """
+
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, ruta):
+        self.ruta = ruta
+        asegurar_directorio(ruta)
+        self.conexion = sqlite3.connect(ruta, isolation_level=None, check_same_thread=False)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        self.conexion.execute("PRAGMA synchronous=NORMAL")
+        self.conexion.executescript(self.ESQUEMA)
+
+    def esta_vacio(self):
+        cursor = self.conexion.execute("SELECT NOT EXISTS (SELECT 1 FROM cursos) AND NOT EXISTS (SELECT 1 FROM estudiantes)")
+        return bool(cursor.fetchone()[0])
+
+# Aplica una mutación del sistema como una transacción propia.
+    def aplicar(self, operacion, argumentos):
+        self.aplicar_lote([(operacion, argumentos)])
+
+# Aplica varias mutaciones dentro de una sola transacción.
+    def aplicar_lote(self, operaciones):
+        with self.conexion:
+            self.conexion.execute("BEGIN")
+            for operacion, argumentos in operaciones:
+                self._ejecutar(operacion, argumentos)
+
+    def _ejecutar(self, operacion, args):
+        sql = self.conexion.execute
+        if operacion == "registrar_estudiante":
+            sql("INSERT OR IGNORE INTO estudiantes (id, nombre, email) VALUES (?, ?, ?)", args)
+        elif operacion == "crear_curso":
+            sql("INSERT OR IGNORE INTO cursos (id, nombre, descripcion, nivel) VALUES (?, ?, ?, ?)", args)
+        elif operacion == "inscripcion":
+            sql("INSERT OR IGNORE INTO inscripciones (estudiante_id, curso_id) VALUES (?, ?)", args)
+        elif operacion == "cancelacion":
+            sql("DELETE FROM inscripciones WHERE estudiante_id = ? AND curso_id = ?", args)
+        elif operacion == "encolar_espera":
+            sql("INSERT INTO listas_espera (curso_id, estudiante_id, prioridad) VALUES (?, ?, ?)", args)
+        elif operacion == "desencolar_espera":
+            sql("DELETE FROM listas_espera WHERE orden = (SELECT orden FROM listas_espera "
+                "WHERE curso_id = ? ORDER BY prioridad, orden LIMIT 1)", args)
+        elif operacion == "establecer_prerequisito":
+            sql("INSERT OR IGNORE INTO prerequisitos (curso_id, prerequisito_id) VALUES (?, ?)", args)
+        elif operacion == "eliminar_prerequisito":
+            sql("DELETE FROM prerequisitos WHERE curso_id = ? AND prerequisito_id = ?", args)
+        elif operacion == "agregar_material":
+            curso_id, m = args
+            sql("INSERT INTO materiales (id, curso_id, nombre, tipo, url) VALUES (?, ?, ?, ?, ?)",
+                (m["id"], curso_id, m["nombre"], m["tipo"], m["url"]))
+        elif operacion == "eliminar_material":
+            curso_id, material_id = args
+            sql("DELETE FROM materiales WHERE id = ? AND eliminado = 1", (material_id,))
+            sql("UPDATE materiales SET eliminado = 1 WHERE fila = (SELECT MIN(fila) FROM materiales "
+                "WHERE curso_id = ? AND id = ? AND eliminado = 0)", (curso_id, material_id))
+        elif operacion == "eliminar_curso":
+            curso_id = args[0]
+            dependientes = [fila[0] for fila in sql(
+                "SELECT p.curso_id FROM prerequisitos p JOIN cursos c ON c.id = p.curso_id "
+                "WHERE p.prerequisito_id = ? AND c.eliminado = 0 ORDER BY p.curso_id", (curso_id,))]
+            sql("UPDATE cursos SET eliminado = 1 WHERE id = ?", (curso_id,))
+            self.conexion.executemany("DELETE FROM prerequisitos WHERE curso_id = ? AND prerequisito_id = ?",
+                                      ((dependiente_id, curso_id) for dependiente_id in dependientes))
+            if dependientes:
+                self._anotar_dependientes(curso_id, dependientes)
+        elif operacion == "eliminar_estudiante":
+            sql("DELETE FROM estudiantes WHERE id = ?", args)
+            sql("DELETE FROM inscripciones WHERE estudiante_id = ?", args)
+            sql("DELETE FROM listas_espera WHERE estudiante_id = ?", args)
+        elif operacion == "restaurar_curso":
+            curso_id = args[0]
+            sql("UPDATE cursos SET eliminado = 0 WHERE id = ?", (curso_id,))
+            prerequisitos = [fila[0] for fila in sql(
+                "SELECT prerequisito_id FROM prerequisitos WHERE curso_id = ? ORDER BY orden", (curso_id,))]
+            sql("DELETE FROM prerequisitos WHERE curso_id = ?", (curso_id,))
+            for prerequisito_id in prerequisitos:
+                fila = sql("SELECT eliminado FROM cursos WHERE id = ?", (prerequisito_id,)).fetchone()
+                if fila is None:
+                    continue
+                if not fila[0]:
+                    self._enlazar(curso_id, prerequisito_id)
+                else:
+                    pendientes = self._dependientes_anotados(prerequisito_id)
+                    if curso_id not in pendientes:
+                        self._anotar_dependientes(prerequisito_id, pendientes + [curso_id])
+            self._reenlazar_dependientes(curso_id)
+        elif operacion == "restaurar_material":
+            sql("UPDATE materiales SET eliminado = 0 WHERE id = ? AND eliminado = 1", args)
+        elif operacion == "actualizar_material":
+            material_id, nombre, tipo, url = args
+            sql("UPDATE materiales SET nombre = ?, tipo = ?, url = ? WHERE id = ?", (nombre, tipo, url, material_id))
+        elif operacion == "restaurar_prerequisito":
+            self._reenlazar_dependientes(int(args[0]))
+        else:
+            logger.warning("Operación desconocida para SQLite: %s", operacion)
+
+# Las filas de prerequisitos_eliminados siguen a las de SistemaELearning: al eliminar un curso se
+# anotan los cursos activos que dependían de él y al restaurarlo se vuelven a enlazar, descartando
+# los enlaces que formarían un ciclo, con el mismo orden y las mismas reglas que en memoria.
+    def _dependientes_anotados(self, curso_id):
+        fila = self.conexion.execute(
+            "SELECT valor FROM prerequisitos_eliminados WHERE clave = ?", (str(curso_id),)).fetchone()
+        return json.loads(fila[0]) if fila else []
+
+    def _anotar_dependientes(self, curso_id, dependientes):
+        self.conexion.execute("INSERT OR REPLACE INTO prerequisitos_eliminados (clave, valor) VALUES (?, ?)",
+                              (str(curso_id), json.dumps(dependientes)))
+
+    def _reenlazar_dependientes(self, curso_id):
+        dependientes = self._dependientes_anotados(curso_id)
+        self.conexion.execute("DELETE FROM prerequisitos_eliminados WHERE clave = ?", (str(curso_id),))
+        for dependiente_id in dependientes:
+            self._enlazar(dependiente_id, curso_id)
+
+# Agrega la arista curso -> prerequisito si ambos cursos están activos y no cierra un ciclo, es decir,
+# si el curso no es alcanzable desde el prerequisito siguiendo las aristas de cursos activos.
+    def _enlazar(self, curso_id, prerequisito_id):
+        sql = self.conexion.execute
+        activos = sql("SELECT COUNT(*) FROM cursos WHERE id IN (?, ?) AND eliminado = 0",
+                      (curso_id, prerequisito_id)).fetchone()[0]
+        if curso_id == prerequisito_id or activos < 2:
+            return False
+        ciclo = sql("""
+            WITH RECURSIVE alcanzados (id) AS (
+                SELECT ?
+                UNION
+                SELECT p.prerequisito_id FROM prerequisitos p
+                JOIN alcanzados a ON p.curso_id = a.id
+                JOIN cursos c ON c.id = p.curso_id AND c.eliminado = 0
+            )
+            SELECT EXISTS (SELECT 1 FROM alcanzados WHERE id = ?)
+        """, (prerequisito_id, curso_id)).fetchone()[0]
+        if ciclo:
+            return False
+        sql("INSERT OR IGNORE INTO prerequisitos (curso_id, prerequisito_id) VALUES (?, ?)", (curso_id, prerequisito_id))
+        return True
+
+# Reemplaza todo el contenido de la base con un diccionario de datos (importación desde JSON).
+    def guardar(self, datos):
+        with self.conexion:
+            self.conexion.execute("BEGIN")
+            for tabla in ("estudiantes", "cursos", "materiales", "inscripciones", "prerequisitos",
+                          "listas_espera", "prerequisitos_eliminados"):
+                self.conexion.execute(f"DELETE FROM {tabla}")
+            self.conexion.executemany(
+                "INSERT INTO estudiantes (id, nombre, email) VALUES (?, ?, ?)",
+                ((e["id"], e["nombre"], e["email"]) for e in datos.get("estudiantes", []))
+            )
+            activos = {c["id"] for c in datos.get("cursos", [])}
+            for eliminado, clave in ((0, "cursos"), (1, "cursos_eliminados")):
+                for c in datos.get(clave, []):
+                    # Como en FilasJSON: un curso eliminado con el id de uno activo se descarta.
+                    if eliminado and c["id"] in activos:
+                        logger.warning("Curso eliminado %s descartado porque su id volvió a usarse en un curso activo",
+                                       c["id"])
+                        continue
+                    self.conexion.execute(
+                        "INSERT OR REPLACE INTO cursos (id, nombre, descripcion, nivel, eliminado) VALUES (?, ?, ?, ?, ?)",
+                        (c["id"], c["nombre"], c["descripcion"], c["nivel"], eliminado)
+                    )
+                    self.conexion.executemany(
+                        "INSERT INTO materiales (id, curso_id, nombre, tipo, url) VALUES (?, ?, ?, ?, ?)",
+                        ((m["id"], c["id"], m["nombre"], m["tipo"], m["url"]) for m in c.get("materiales", []))
+                    )
+                    self.conexion.executemany(
+                        "INSERT OR IGNORE INTO prerequisitos (curso_id, prerequisito_id) VALUES (?, ?)",
+                        ((c["id"], p) for p in c.get("prerequisitos", []))
+                    )
+                    self.conexion.executemany(
+                        "INSERT OR IGNORE INTO inscripciones (estudiante_id, curso_id) VALUES (?, ?)",
+                        ((e, c["id"]) for e in c.get("estudiantes", []))
+                    )
+            self.conexion.executemany(
+                "INSERT INTO materiales (id, curso_id, nombre, tipo, url, eliminado) VALUES (?, ?, ?, ?, ?, 1)",
+                ((m["id"], m.get("curso_id"), m["nombre"], m["tipo"], m["url"])
+                 for m in datos.get("materiales_eliminados", []))
+            )
+            self.conexion.executemany(
+                "INSERT INTO listas_espera (curso_id, estudiante_id, prioridad) VALUES (?, ?, ?)",
+                ((int(curso_id), e, p) for curso_id, entradas in datos.get("listas_espera", {}).items() for e, p in entradas)
+            )
+            self.conexion.executemany(
+                "INSERT INTO prerequisitos_eliminados (clave, valor) VALUES (?, ?)",
+                ((str(k), json.dumps(v)) for k, v in datos.get("prerequisitos_eliminados", {}).items())
+            )
+
+# Lee la base y arma el diccionario de datos en el mismo formato del archivo JSON.
+    def cargar(self):
+        sql = self.conexion.execute
+        cursos = {}
+        eliminados = {}
+        for id, nombre, descripcion, nivel, eliminado in sql(
+                "SELECT id, nombre, descripcion, nivel, eliminado FROM cursos ORDER BY rowid"):
+            destino = eliminados if eliminado else cursos
+            destino[id] = {"id": id, "nombre": nombre, "descripcion": descripcion, "nivel": nivel,
+                           "materiales": [], "estudiantes": [], "prerequisitos": []}
+        materiales_eliminados = []
+        for id, curso_id, nombre, tipo, url, eliminado in sql(
+                "SELECT id, curso_id, nombre, tipo, url, eliminado FROM materiales ORDER BY fila"):
+            material = {"id": id, "nombre": nombre, "tipo": tipo, "url": url}
+            if eliminado:
+                material["curso_id"] = curso_id
+                materiales_eliminados.append(material)
+            else:
+                curso = cursos.get(curso_id) or eliminados.get(curso_id)
+                if curso:
+                    curso["materiales"].append(material)
+        for curso_id, prerequisito_id in sql("SELECT curso_id, prerequisito_id FROM prerequisitos ORDER BY orden"):
+            curso = cursos.get(curso_id) or eliminados.get(curso_id)
+            if curso:
+                curso["prerequisitos"].append(prerequisito_id)
+        for estudiante_id, curso_id in sql("SELECT estudiante_id, curso_id FROM inscripciones ORDER BY orden"):
+            curso = cursos.get(curso_id) or eliminados.get(curso_id)
+            if curso:
+                curso["estudiantes"].append(estudiante_id)
+        listas_espera = {}
+        for curso_id, estudiante_id, prioridad in sql(
+                "SELECT curso_id, estudiante_id, prioridad FROM listas_espera ORDER BY curso_id, prioridad, orden"):
+            listas_espera.setdefault(str(curso_id), []).append([estudiante_id, prioridad])
+        return {
+            "estudiantes": [
+                {"id": id, "nombre": nombre, "email": email, "cursos": []}
+                for id, nombre, email in sql("SELECT id, nombre, email FROM estudiantes ORDER BY rowid")
+            ],
+            "cursos": list(cursos.values()),
+            "cursos_eliminados": list(eliminados.values()),
+            "materiales_eliminados": materiales_eliminados,
+            "prerequisitos_eliminados": {
+                clave: json.loads(valor) for clave, valor in sql("SELECT clave, valor FROM prerequisitos_eliminados")
+            },
+            "listas_espera": listas_espera
+        }
+
+# Busca el id de un estudiante por su email usando el índice de la tabla.
+    def buscar_estudiante_por_email(self, email):
+        fila = self.conexion.execute("SELECT id FROM estudiantes WHERE email = ? LIMIT 1", (email,)).fetchone()
+        return fila[0] if fila else None
+
+    def cerrar(self):
+        self.conexion.close()
@@ -0,0 +1,520 @@
+# API HTTP con JSON sobre SistemaELearning, solo con la biblioteca estándar (http.server).
+# Cada conexión se atiende en su propio hilo (ThreadingHTTPServer, con keep-alive de HTTP/1.1). Las
+# consultas corren a la vez bajo el cerrojo de lectura y las operaciones que modifican el estado toman
+# el de escritura, de a una. El guardado lo hace el hilo de segundo plano del sistema, que junta en una
+# sola escritura todo lo que llega dentro de su ventana; con confirmar=True cada escritura espera, ya
+# fuera del cerrojo, a que su lote esté en disco antes de responder.
+#
+#   GET    /estudiantes                 ?orden=id|nombre &filtro= &descendente=1 &desde= &cantidad= (o ?email=)
+#   POST   /estudiantes                 {"id", "nombre", "email"}
+#   GET    /estudiantes/<id>
+#   DELETE /estudiantes/<id>
+#   GET    /cursos                      ?orden=nombre|id &filtro= &nivel= &descendente=1 &desde= &cantidad=
+#   POST   /cursos                      {"id", "nombre", "descripcion", "nivel"}
+#   GET    /cursos/<id>
+#   DELETE /cursos/<id>
+#   POST   /cursos/<id>/restaurar
+#   GET    /cursos/<id>/materiales      ?desde= &cantidad=
+#   POST   /cursos/<id>/materiales      {"id", "nombre", "tipo", "url"}
+#   PATCH  /materiales/<id>             {"nombre", "tipo", "url"} (los que no vienen quedan igual)
+#   DELETE /materiales/<id>
+#   POST   /materiales/<id>/restaurar
+#   GET    /cursos/<id>/prerequisitos
+#   POST   /cursos/<id>/prerequisitos   {"prerequisito"}
+#   DELETE /cursos/<id>/prerequisitos/<prerequisito>
+#   GET    /cursos/<id>/desbloquea
+#   GET    /cursos/<id>/espera/<estudiante>
+#   POST   /cursos/<id>/cohorte         {"estudiantes": [...], "capacidad", "prioridad"}
+#   POST   /inscripciones               {"estudiante", "curso", "capacidad", "prioridad"}
+#   DELETE /inscripciones/<estudiante>/<curso>
+#   GET    /buscar                      ?tema= &nivel= &desde= &cantidad=
+#   GET    /ruta                        ?objetivos=301,302 &estudiante=
+#   GET    /metricas
+#
+# Los errores responden {"error": mensaje}: 400 si la petición es inválida, 404 si falta lo pedido y
+# 409 si la operación choca con el estado (id repetido, ciclo de prerequisitos, ya inscrito...).
+
+import json
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .entidades import Material
+
+logger = logging.getLogger(__name__)
+
+CANTIDAD_POR_DEFECTO = 50
+CANTIDAD_MAXIMA = 1000
+
+
+class ErrorAPI(Exception):
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+# Cerrojo de lectores y escritor: muchas lecturas a la vez o una sola escritura. Mientras un escritor
+# espera, las lecturas nuevas quedan detrás de él, así un flujo constante de consultas no lo deja sin turno.
+class CerrojoLecturaEscritura:
+# Método constructor que inicializa los atributos de la clase.
+    def __init__(self):
+        self._condicion = threading.Condition()
+        self._lectores = 0
+        self._escribiendo = False
+        self._escritores_esperando = 0
+
+    @contextmanager
+    def lectura(self):
+        with self._condicion:
+            while self._escribiendo or self._escritores_esperando:
+                self._condicion.wait()
+            self._lectores += 1
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self._lectores -= 1
+                if not self._lectores:
+                    self._condicion.notify_all()
+
+    @contextmanager
+    def escritura(self):
+        with self._condicion:
+            self._escritores_esperando += 1
+            while self._escribiendo or self._lectores:
+                self._condicion.wait()
+            self._escritores_esperando -= 1
+            self._escribiendo = True
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self._escribiendo = False
+                self._condicion.notify_all()
+
+
+def estudiante_a_dict(estudiante):
+    return {
+        "id": estudiante.id,
+        "nombre": estudiante.nombre,
+        "email": estudiante.email,
+        "cursos": [curso.id for curso in estudiante.cursos]
+    }
+
+
+def curso_a_dict(curso):
+    return {
+        "id": curso.id,
+        "nombre": curso.nombre,
+        "descripcion": curso.descripcion,
+        "nivel": curso.nivel,
+        "prerequisitos": list(curso.prerequisitos),
+        "inscritos": len(curso.estudiantes),
+        "materiales": len(curso.materiales)
+    }
+
+
+def material_a_dict(material):
+    return {"id": material.id, "nombre": material.nombre, "tipo": material.tipo, "url": material.url}
+
+
+def _entero(valor, nombre):
+    if isinstance(valor, bool):
+        raise ErrorAPI(400, f"{nombre} debe ser un entero")
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        raise ErrorAPI(400, f"{nombre} debe ser un entero")
+
+
+# Lee un campo del cuerpo; si falta y no tiene valor por defecto, la petición es inválida.
+def _campo(cuerpo, nombre, tipo=str, defecto=None):
+    if nombre not in cuerpo or cuerpo[nombre] is None:
+        if defecto is None:
+            raise ErrorAPI(400, f"falta el campo {nombre}")
+        return defecto
+    if tipo is int:
+        return _entero(cuerpo[nombre], nombre)
+    if not isinstance(cuerpo[nombre], tipo):
+        raise ErrorAPI(400, f"el campo {nombre} tiene un tipo inválido")
+    return cuerpo[nombre]
+
+
+# Una página de cualquier secuencia con len() y rebanadas (los listados del sistema no copian el índice).
+def _pagina(secuencia, consulta, convertir):
+    desde = _entero(consulta.get("desde", 0), "desde")
+    cantidad = min(_entero(consulta.get("cantidad", CANTIDAD_POR_DEFECTO), "cantidad"), CANTIDAD_MAXIMA)
+    if desde < 0 or cantidad < 0:
+        raise ErrorAPI(400, "desde y cantidad no pueden ser negativos")
+    return 200, {
+        "total": len(secuencia),
+        "desde": desde,
+        "elementos": [convertir(elemento) for elemento in secuencia[desde:desde + cantidad]]
+    }
+
+
+def _curso(sistema, curso_id):
+    if curso_id not in sistema.cursos:
+        raise ErrorAPI(404, f"curso {curso_id} inexistente")
+    return sistema.cursos[curso_id]
+
+
+def _estudiante(sistema, estudiante_id):
+    if estudiante_id not in sistema.estudiantes:
+        raise ErrorAPI(404, f"estudiante {estudiante_id} inexistente")
+    return sistema.estudiantes[estudiante_id]
+
+
+# Tabla de rutas: (método, expresión, función). Cada función recibe el sistema, los ids de la ruta,
+# la consulta y el cuerpo, y retorna (estado HTTP, respuesta).
+RUTAS = []
+
+
+def ruta(metodo, patron):
+    def registrar(funcion):
+        RUTAS.append((metodo, re.compile(f"^{patron}$"), funcion))
+        return funcion
+    return registrar
+
+
+@ruta("GET", r"/estudiantes")
+def listar_estudiantes(sistema, ids, consulta, cuerpo):
+    if "email" in consulta:
+        estudiante = sistema.buscar_estudiante_por_email(consulta["email"])
+        return _pagina([estudiante] if estudiante else [], consulta, estudiante_a_dict)
+    orden = consulta.get("orden", "id")
+    if orden not in ("id", "nombre"):
+        raise ErrorAPI(400, "orden debe ser id o nombre")
+    estudiantes = sistema.listar_estudiantes(orden, consulta.get("filtro", ""), consulta.get("descendente") == "1")
+    return _pagina(estudiantes, consulta, estudiante_a_dict)
+
+
+@ruta("POST", r"/estudiantes")
+def registrar_estudiante(sistema, ids, consulta, cuerpo):
+    estudiante = sistema.registrar_estudiante(
+        _campo(cuerpo, "id", int), _campo(cuerpo, "nombre"), _campo(cuerpo, "email")
+    )
+    if estudiante is None:
+        raise ErrorAPI(409, "ya existe un estudiante con ese id")
+    return 201, estudiante_a_dict(estudiante)
+
+
+@ruta("GET", r"/estudiantes/(\d+)")
+def ver_estudiante(sistema, ids, consulta, cuerpo):
+    return 200, estudiante_a_dict(_estudiante(sistema, ids[0]))
+
+
+@ruta("DELETE", r"/estudiantes/(\d+)")
+def eliminar_estudiante(sistema, ids, consulta, cuerpo):
+    _estudiante(sistema, ids[0])
+    sistema.eliminar_estudiante(ids[0])
+    return 200, {"eliminado": ids[0]}
+
+
+@ruta("GET", r"/cursos")
+def listar_cursos(sistema, ids, consulta, cuerpo):
+    orden = consulta.get("orden", "nombre")
+    if orden not in ("id", "nombre"):
+        raise ErrorAPI(400, "orden debe ser id o nombre")
+    cursos = sistema.listar_cursos(
+        orden, consulta.get("filtro", ""), consulta.get("nivel", "Todos"), consulta.get("descendente") == "1"
+    )
+    return _pagina(cursos, consulta, curso_a_dict)
+
+
+@ruta("POST", r"/cursos")
+def crear_curso(sistema, ids, consulta, cuerpo):
+    curso = sistema.crear_curso(
+        _campo(cuerpo, "id", int), _campo(cuerpo, "nombre"), _campo(cuerpo, "descripcion", defecto=""),
+        _campo(cuerpo, "nivel")
+    )
+    if curso is None:
+        raise ErrorAPI(409, "ya existe un curso con ese id, activo o eliminado")
+    return 201, curso_a_dict(curso)
+
+
+# Un curso eliminado también se puede consultar (para restaurarlo), marcado como tal.
+@ruta("GET", r"/cursos/(\d+)")
+def ver_curso(sistema, ids, consulta, cuerpo):
+    if ids[0] in sistema.cursos_eliminados:
+        return 200, dict(curso_a_dict(sistema.cursos_eliminados[ids[0]]), eliminado=True)
+    return 200, curso_a_dict(_curso(sistema, ids[0]))
+
+
+@ruta("DELETE", r"/cursos/(\d+)")
+def eliminar_curso(sistema, ids, consulta, cuerpo):
+    _curso(sistema, ids[0])
+    sistema.eliminar_curso(ids[0])
+    return 200, {"eliminado": ids[0]}
+
+
+@ruta("POST", r"/cursos/(\d+)/restaurar")
+def restaurar_curso(sistema, ids, consulta, cuerpo):
+    if not sistema.restaurar_curso(ids[0]):
+        raise ErrorAPI(404, f"no hay un curso eliminado con id {ids[0]}")
+    return 200, curso_a_dict(sistema.cursos[ids[0]])
+
+
+@ruta("GET", r"/cursos/(\d+)/materiales")
+def listar_materiales(sistema, ids, consulta, cuerpo):
+    return _pagina(_curso(sistema, ids[0]).materiales, consulta, material_a_dict)
+
+
+@ruta("POST", r"/cursos/(\d+)/materiales")
+def agregar_material(sistema, ids, consulta, cuerpo):
+    _curso(sistema, ids[0])
+    material = Material(
+        _campo(cuerpo, "id", int), _campo(cuerpo, "nombre"), _campo(cuerpo, "tipo"), _campo(cuerpo, "url", defecto="")
+    )
+    if not sistema.agregar_material(ids[0], material):
+        raise ErrorAPI(409, "ya existe un material con ese id")
+    return 201, material_a_dict(material)
+
+
+@ruta("PATCH", r"/materiales/(\d+)")
+def actualizar_material(sistema, ids, consulta, cuerpo):
+    cambios = {nombre: cuerpo[nombre] for nombre in ("nombre", "tipo", "url") if cuerpo.get(nombre) is not None}
+    if any(not isinstance(valor, str) for valor in cambios.values()):
+        raise ErrorAPI(400, "nombre, tipo y url deben ser texto")
+    if not sistema.actualizar_material(ids[0], **cambios):
+        raise ErrorAPI(404, f"material {ids[0]} inexistente")
+    return 200, material_a_dict(sistema.indice_materiales[ids[0]][1])
+
+
+@ruta("DELETE", r"/materiales/(\d+)")
+def eliminar_material(sistema, ids, consulta, cuerpo):
+    if not sistema.eliminar_material(sistema.curso_de_material(ids[0]), ids[0]):
+        raise ErrorAPI(404, f"material {ids[0]} inexistente o ya eliminado")
+    return 200, {"eliminado": ids[0]}
+
+
+@ruta("POST", r"/materiales/(\d+)/restaurar")
+def restaurar_material(sistema, ids, consulta, cuerpo):
+    if not sistema.restaurar_material(ids[0]):
+        raise ErrorAPI(404, f"no hay un material eliminado con id {ids[0]} que se pueda restaurar")
+    return 200, material_a_dict(sistema.indice_materiales[ids[0]][1])
+
+
+@ruta("GET", r"/cursos/(\d+)/prerequisitos")
+def listar_prerequisitos(sistema, ids, consulta, cuerpo):
+    curso = _curso(sistema, ids[0])
+    return 200, [curso_a_dict(sistema.cursos[i]) for i in curso.prerequisitos if i in sistema.cursos]
+
+
+@ruta("POST", r"/cursos/(\d+)/prerequisitos")
+def establecer_prerequisito(sistema, ids, consulta, cuerpo):
+    curso = _curso(sistema, ids[0])
+    prerequisito_id = _campo(cuerpo, "prerequisito", int)
+    _curso(sistema, prerequisito_id)
+    if prerequisito_id in curso.prerequisitos:
+        raise ErrorAPI(409, f"{prerequisito_id} ya es prerequisito de {ids[0]}")
+    if not sistema.establecer_prerequisito(ids[0], prerequisito_id):
+        raise ErrorAPI(409, "el prerequisito formaría un ciclo")
+    return 200, curso_a_dict(sistema.cursos[ids[0]])
+
+
+@ruta("DELETE", r"/cursos/(\d+)/prerequisitos/(\d+)")
+def eliminar_prerequisito(sistema, ids, consulta, cuerpo):
+    if not sistema.eliminar_prerequisito(ids[0], ids[1]):
+        raise ErrorAPI(404, f"{ids[1]} no es prerequisito de {ids[0]}")
+    return 200, curso_a_dict(sistema.cursos[ids[0]])
+
+
+@ruta("GET", r"/cursos/(\d+)/desbloquea")
+def desbloquea(sistema, ids, consulta, cuerpo):
+    _curso(sistema, ids[0])
+    return 200, [curso_a_dict(curso) for curso in sistema.desbloquea(ids[0])]
+
+
+@ruta("GET", r"/cursos/(\d+)/espera/(\d+)")
+def posicion_en_espera(sistema, ids, consulta, cuerpo):
+    posicion = sistema.posicion_en_espera(ids[1], ids[0])
+    if posicion is None:
+        raise ErrorAPI(404, f"{ids[1]} no está en la lista de espera de {ids[0]}")
+    return 200, {"posicion": posicion}
+
+
+RESULTADOS_INSCRIPCION = {
+    True: (201, "inscrito"),
+    "lista_espera": (202, "lista_espera"),
+    "ya_inscrito": (409, "ya_inscrito"),
+    "prerequisitos_faltantes": (409, "prerequisitos_faltantes"),
+    False: (404, "inexistente")
+}
+
+
+@ruta("POST", r"/cursos/(\d+)/cohorte")
+def inscribir_cohorte(sistema, ids, consulta, cuerpo):
+    estudiante_ids = [_entero(i, "estudiantes") for i in _campo(cuerpo, "estudiantes", list)]
+    resultados = sistema.inscribir_cohorte(
+        _curso(sistema, ids[0]).id, estudiante_ids,
+        _campo(cuerpo, "capacidad", int, 30), _campo(cuerpo, "prioridad", int, 0)
+    )
+    return 200, [
+        {"estudiante": estudiante_id, "resultado": RESULTADOS_INSCRIPCION[resultado][1]}
+        for estudiante_id, resultado in resultados.items()
+    ]
+
+
+@ruta("POST", r"/inscripciones")
+def inscribir_estudiante(sistema, ids, consulta, cuerpo):
+    estudiante_id = _campo(cuerpo, "estudiante", int)
+    curso_id = _campo(cuerpo, "curso", int)
+    resultado = sistema.inscribir_estudiante(
+        estudiante_id, curso_id, _campo(cuerpo, "capacidad", int, 30), _campo(cuerpo, "prioridad", int, 0)
+    )
+    estado, nombre = RESULTADOS_INSCRIPCION[resultado]
+    respuesta = {"estudiante": estudiante_id, "curso": curso_id, "resultado": nombre}
+    if resultado == "lista_espera":
+        respuesta["posicion"] = sistema.posicion_en_espera(estudiante_id, curso_id)
+    return estado, respuesta
+
+
+@ruta("DELETE", r"/inscripciones/(\d+)/(\d+)")
+def cancelar_inscripcion(sistema, ids, consulta, cuerpo):
+    if not sistema.cancelar_inscripcion(ids[0], ids[1]):
+        raise ErrorAPI(404, f"{ids[0]} no estaba inscrito en {ids[1]}")
+    return 200, {"estudiante": ids[0], "curso": ids[1], "resultado": "cancelado"}
+
+
+@ruta("GET", r"/buscar")
+def buscar(sistema, ids, consulta, cuerpo):
+    if not consulta.get("tema"):
+        raise ErrorAPI(400, "falta el parámetro tema")
+    return _pagina(sistema.buscar_cursos(consulta["tema"], consulta.get("nivel", "Todos")), consulta, curso_a_dict)
+
+
+@ruta("GET", r"/ruta")
+def planificar_ruta(sistema, ids, consulta, cuerpo):
+    objetivos = [_entero(i, "objetivos") for i in consulta.get("objetivos", "").split(",") if i]
+    if not objetivos:
+        raise ErrorAPI(400, "falta el parámetro objetivos")
+    for objetivo in objetivos:
+        _curso(sistema, objetivo)
+    estudiante_id = _entero(consulta["estudiante"], "estudiante") if "estudiante" in consulta else None
+    return 200, [[curso_a_dict(curso) for curso in semestre] for semestre in sistema.planificar_ruta(objetivos, estudiante_id)]
+
+
+@ruta("GET", r"/metricas")
+def metricas(sistema, ids, consulta, cuerpo):
+    return 200, sistema.metricas()
+
+
+class ManejadorAPI(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Encabezados y cuerpo salen en dos escrituras; con Nagle, la segunda espera el ACK diferido (~40 ms).
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._atender("GET")
+
+    def do_POST(self):
+        self._atender("POST")
+
+    def do_PUT(self):
+        self._atender("PUT")
+
+    def do_PATCH(self):
+        self._atender("PATCH")
+
+    def do_DELETE(self):
+        self._atender("DELETE")
+
+    def _atender(self, metodo):
+        partes = urlsplit(self.path)
+        try:
+            cuerpo = self._leer_cuerpo()
+            funcion, ids = self._resolver(metodo, partes.path.rstrip("/") or "/")
+            consulta = {clave: valores[-1] for clave, valores in parse_qs(partes.query).items()}
+            estado, respuesta = self.server.ejecutar(metodo, funcion, ids, consulta, cuerpo)
+        except ErrorAPI as e:
+            estado, respuesta = e.estado, {"error": str(e)}
+        except Exception:
+            logger.exception("Error atendiendo %s %s", metodo, self.path)
+            estado, respuesta = 500, {"error": "error interno del servidor"}
+        self._responder(estado, respuesta)
+
+    def _leer_cuerpo(self):
+        try:
+            largo = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.close_connection = True
+            raise ErrorAPI(400, "Content-Length inválido")
+        if not largo:
+            return {}
+        try:
+            cuerpo = json.loads(self.rfile.read(largo))
+        except ValueError:
+            raise ErrorAPI(400, "el cuerpo no es JSON válido")
+        if not isinstance(cuerpo, dict):
+            raise ErrorAPI(400, "el cuerpo debe ser un objeto JSON")
+        return cuerpo
+
+    def _resolver(self, metodo, camino):
+        otros_metodos = False
+        for metodo_ruta, patron, funcion in RUTAS:
+            coincidencia = patron.match(camino)
+            if coincidencia:
+                if metodo_ruta == metodo:
+                    return funcion, [int(grupo) for grupo in coincidencia.groups()]
+                otros_metodos = True
+        if otros_metodos:
+            raise ErrorAPI(405, f"{metodo} no se admite en {camino}")
+        raise ErrorAPI(404, f"ruta desconocida: {camino}")
+
+    def _responder(self, estado, respuesta):
+        contenido = json.dumps(respuesta, ensure_ascii=False).encode("utf-8")
+        self.send_response(estado)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(contenido)))
+        self.end_headers()
+        self.wfile.write(contenido)
+
+# Las peticiones van al registro del módulo (nivel DEBUG) en vez de a stderr.
+    def log_message(self, formato, *args):
+        logger.debug("%s %s", self.address_string(), formato % args)
+
+
+class ServidorAPI(ThreadingHTTPServer):
+    daemon_threads = True
+
+# Método constructor que inicializa los atributos de la clase.
+# El sistema debería tener el guardado en segundo plano activo (ver activar_guardado_asincrono): si
+# no, cada escritura guarda dentro del cerrojo y no hay lotes.
+    def __init__(self, direccion, sistema, confirmar=True):
+        super().__init__(direccion, ManejadorAPI)
+        self.sistema = sistema
+        self.confirmar = confirmar
+        self.cerrojo = CerrojoLecturaEscritura()
+
+    def ejecutar(self, metodo, funcion, ids, consulta, cuerpo):
+        if metodo == "GET":
+            with self.cerrojo.lectura():
+                return funcion(self.sistema, ids, consulta, cuerpo)
+        with self.cerrojo.escritura():
+            resultado = funcion(self.sistema, ids, consulta, cuerpo)
+        if self.confirmar:
+            # Los escritores que esperan a la vez comparten el mismo lote del hilo de guardado, y cada
+            # uno recibe el error de ese lote.
+            error = self.sistema.esperar_guardado()
+            if error is not None:
+                raise ErrorAPI(500, f"el cambio se aplicó pero no se pudo guardar: {error}")
+        return resultado
+
+
+# Atiende peticiones hasta Ctrl+C; al salir escribe lo que quede pendiente.
+def servir(sistema, host="127.0.0.1", puerto=8000, confirmar=True):
+    sistema.activar_guardado_asincrono()
+    servidor = ServidorAPI((host, puerto), sistema, confirmar)
+    logger.info("Escuchando en http://%s:%d", *servidor.server_address[:2])
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        sistema.cerrar_guardado()
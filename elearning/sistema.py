@@ -0,0 +1,1452 @@
+# Lógica del sistema e-learning, sin dependencias de la interfaz gráfica.
+
+import atexit
+import functools
+import gc
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+from .entidades import Curso, Estudiante, Material
+from .estructuras import (
+    ArbolBusqueda, ConjuntoOrdenado, IndiceTrigramas, ListaEspera, TramoOrdenado, TramosConcatenados
+)
+from .fragmentos import (
+    ESTUDIANTES_POR_BLOQUE, CambiosPendientes, DirectorioFragmentado, bloque_de, combinar_cambios
+)
+from .grafo import Grafo
+from .historial import HistorialCambios
+from .instantanea import FilasJSON, LectorInstantanea, escribir_instantanea
+from .metricas import Metricas
+from .persistencia import (
+    ARCHIVO_CERROJO, ARCHIVO_DIARIO, ARCHIVO_FRAGMENTOS, ARCHIVO_HISTORIAL, ARCHIVO_INSTANTANEA, ARCHIVO_JSON,
+    AlmacenSQLite, CerrojoArchivo, DiarioCambios, GuardadoAsincrono, asegurar_directorio, data_folder,
+    escribir_json_atomico
+)
+
+logger = logging.getLogger(__name__)
+
+_AUSENTE = object()
+
+
+# Vuelve una clave de un diccionario a su valor anterior, o la quita si no estaba (_AUSENTE).
+def _reponer(diccionario, clave, anterior):
+    if anterior is _AUSENTE:
+        del diccionario[clave]
+    else:
+        diccionario[clave] = anterior
+
+
+# Pausa el recolector de ciclos mientras se cargan los datos: la carga crea cientos de miles de objetos
+# que sobreviven, y cada pasada del recolector recorre el montículo entero sin liberar nada.
+@contextmanager
+def _recolector_pausado():
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+
+# Clase principal que gestiona toda la lógica del sistema e-learning (estudiantes, cursos, materiales, etc.).
+class SistemaELearning:
+# Método constructor que inicializa los atributos de la clase.
+# Con un almacén (AlmacenSQLite) cada cambio se guarda en la base, pero el estado se carga completo en
+# memoria al arrancar igual que con el JSON (ver _cargar_desde_almacen).
+# Con formato="binario" los checkpoints se escriben como instantánea binaria (ver elearning.instantanea)
+# en vez de JSON; si todavía no hay instantánea, la primera carga lee el JSON existente. Al cargarla
+# igual se arman todas las entidades: solo se ahorra el parseo del JSON.
+# Con formato="fragmentado" se guarda un archivo por curso y por bloque de estudiantes (ver
+# elearning.fragmentos) y cada checkpoint escribe solo los que cambiaron, según `sucios`.
+# Con compartido=True varios procesos pueden trabajar sobre la misma carpeta de datos a la vez: cada
+# escritura toma el cerrojo, se pone al día con lo que los demás anexaron al diario y recién entonces
+# valida y aplica la operación (ver transaccion y refrescar). El historial de deshacer queda en memoria,
+# uno por proceso, y el guardado en segundo plano no se usa.
+    def __init__(self, usar_diario=True, almacen=None, limite_historial=100, ruta_metricas=None,
+                 directorio_datos=data_folder, guardado_asincrono=False, formato="json", compartido=False):
+        if formato not in ("json", "binario", "fragmentado"):
+            raise ValueError(f"Formato desconocido: {formato}")
+        if compartido and (not usar_diario or almacen is not None):
+            raise ValueError("Los datos compartidos entre procesos requieren el diario y no admiten un almacén externo")
+        self._metricas = Metricas()
+        if ruta_metricas is not None:
+            atexit.register(self.volcar_metricas, ruta_metricas)
+        self.estudiantes = {}
+        self.cursos = {}
+        self.cursos_eliminados = {}
+        self.materiales_eliminados = {}
+        self.indice_materiales = {}
+        self.prerequisitos_eliminados = {}
+        self.ruta_json = os.path.join(directorio_datos, ARCHIVO_JSON)
+        self.ruta_instantanea = os.path.join(directorio_datos, ARCHIVO_INSTANTANEA)
+        self.formato = formato
+        self.fragmentos = DirectorioFragmentado(os.path.join(directorio_datos, ARCHIVO_FRAGMENTOS))
+        self.sucios = CambiosPendientes()
+        asegurar_directorio(self.ruta_json)
+        self.historial_cambios = HistorialCambios(
+            limite_historial, None if compartido else os.path.join(directorio_datos, ARCHIVO_HISTORIAL)
+        )
+        self._anotar_historial = True
+        self.lista_espera = {}
+        self.esperas_estudiante = {}
+        self.arbol_cursos = ArbolBusqueda()
+        self.ids_cursos = ArbolBusqueda()
+        self.arbol_estudiantes = ArbolBusqueda()
+        self.ids_estudiantes = ArbolBusqueda()
+        self._sin_indexar = None
+        self.indice_cursos = IndiceTrigramas()
+        self.grafo_cursos = Grafo()
+        self.almacen = almacen
+        self.diario = None
+        if usar_diario and almacen is None:
+            self.diario = DiarioCambios(os.path.join(directorio_datos, ARCHIVO_DIARIO), compartido=compartido)
+        self.cerrojo = CerrojoArchivo(os.path.join(directorio_datos, ARCHIVO_CERROJO)) if compartido else None
+        self._transaccion = None
+        self._guardado = None
+        self._errores_guardado = []
+        self.cargar_desde_json()
+        if guardado_asincrono:
+            self.activar_guardado_asincrono()
+
+# Pasa las escrituras del JSON, del diario y del historial a un hilo de guardado. Las operaciones
+# solo encolan lo que hay que escribir; los errores se consultan con errores_guardado().
+# Con un almacén externo no aplica: cada cambio ya es una transacción pequeña de la base.
+    def activar_guardado_asincrono(self):
+        if self._guardado is not None or self.almacen is not None:
+            return
+        if self.cerrojo is not None:
+            logger.info("Con datos compartidos entre procesos el guardado es sincrónico, dentro del cerrojo")
+            return
+        ruta_diario = self.diario.ruta if self.diario else None
+        if self.formato == "binario":
+            self._guardado = GuardadoAsincrono(
+                self.ruta_instantanea, ruta_diario, metricas=self._metricas,
+                escribir=lambda ruta, datos: escribir_instantanea(ruta, FilasJSON(datos))
+            )
+        elif self.formato == "fragmentado":
+            self._guardado = GuardadoAsincrono(
+                self.fragmentos.ruta, ruta_diario, metricas=self._metricas,
+                escribir=lambda ruta, cambios: self.fragmentos.escribir(cambios), combinar=combinar_cambios
+            )
+        else:
+            self._guardado = GuardadoAsincrono(self.ruta_json, ruta_diario, metricas=self._metricas)
+        if self.diario:
+            self.diario.asincrono = self._guardado
+        self.historial_cambios.asincrono = self._guardado
+        atexit.register(self.cerrar_guardado)
+
+# Espera a que todo lo encolado esté escrito en disco. Retorna el error del lote que incluyó esta
+# espera, o None; el error también queda para errores_guardado().
+    def esperar_guardado(self):
+        if self._guardado is not None:
+            return self._guardado.esperar()
+        return None
+
+# Escribe lo pendiente y detiene el hilo; después se vuelve a guardar de forma sincrónica.
+    def cerrar_guardado(self):
+        if self._guardado is None:
+            return
+        self._guardado.cerrar()
+        self._errores_guardado.extend(self.errores_guardado())
+        if self.diario:
+            self.diario.asincrono = None
+        self.historial_cambios.asincrono = None
+        self._guardado = None
+
+# Retorna (y olvida) los errores del guardado en segundo plano ocurridos desde la última consulta.
+    def errores_guardado(self):
+        errores, self._errores_guardado = self._errores_guardado, []
+        while self._guardado is not None and not self._guardado.errores.empty():
+            errores.append(self._guardado.errores.get_nowait())
+        return errores
+
+# Retorna una foto de las métricas: llamadas y latencias (p50/p95/p99) por método y fase de persistencia.
+    def metricas(self):
+        return self._metricas.resumen()
+
+# Escribe las métricas en un archivo JSON; si se pasó ruta_metricas se llama al salir del programa.
+    def volcar_metricas(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.metricas(), f, indent=2, ensure_ascii=False)
+
+# Agrupa varias operaciones en un bloque `with`: la persistencia se suspende y se escribe una sola vez
+# al salir. Si se lanza una excepción dentro del bloque, el estado vuelve a como estaba al entrar: cada
+# mutación anota cómo deshacerse (ver _al_revertir) y al fallar se aplican esas anotaciones al revés,
+# así entrar no copia nada y revertir cuesta lo que se hizo dentro del bloque. Un bloque anidado es un
+# punto de guardado: si falla solo se revierte lo suyo.
+# Con datos compartidos el bloque entero tiene el cerrojo exclusivo: al entrar se aplican los cambios
+# de los otros procesos y al salir se anexan los propios, así nadie escribe sobre una versión vieja.
+    @contextmanager
+    def transaccion(self, guardar=True, reversible=True):
+        if self._transaccion is not None or self.cerrojo is None or self.cerrojo.tomado:
+            with self._transaccion_local(guardar, reversible):
+                yield self
+            return
+        with self.cerrojo.exclusivo():
+            self._ponerse_al_dia()
+            with self._transaccion_local(guardar, reversible):
+                yield self
+
+    @contextmanager
+    def _transaccion_local(self, guardar, reversible):
+        externa = self._transaccion is None
+        if externa:
+            self._transaccion = {"registros": [], "checkpoint": False, "deshacer": [], "reversibles": 0}
+        estado = self._transaccion
+        registros = estado["registros"]
+        inicio = len(registros)
+        if reversible:
+            desde = len(estado["deshacer"])
+            historial = self.historial_cambios.estado()
+            estado["reversibles"] += 1
+        try:
+            yield self
+        except BaseException:
+            if reversible:
+                self._revertir(desde)
+                self.historial_cambios.restaurar(historial)
+                del registros[inicio:]
+            if externa:
+                self._transaccion = None
+            raise
+        finally:
+            if reversible:
+                estado["reversibles"] -= 1
+                if not estado["reversibles"]:
+                    del estado["deshacer"][:]
+        if externa:
+            checkpoint = self._transaccion["checkpoint"]
+            self._transaccion = None
+            if guardar and checkpoint and self.almacen is None:
+                self.guardar_en_json()
+            elif guardar and registros:
+                self._persistir_lote(registros)
+            if guardar:
+                self.historial_cambios.guardar()
+
+# Escribe de una sola vez los registros acumulados por una transacción.
+    def _persistir_lote(self, registros):
+        if self.almacen is not None:
+            with self._metricas.medir("persistencia.almacen"):
+                self.almacen.aplicar_lote(registros)
+            self.sucios.limpiar()
+        elif self.diario is None:
+            self.guardar_en_json()
+        else:
+            with self._metricas.medir("persistencia.diario"):
+                checkpoint = self.diario.anexar_lote(registros)
+            if checkpoint:
+                self.guardar_en_json()
+
+# Anota cómo deshacer una mutación: funcion(*argumentos) se llama si el bloque reversible que la contiene
+# falla. Solo se anota mientras haya un bloque reversible abierto, aunque sea por fuera de uno que no lo es.
+# Las funciones anotadas modifican las estructuras directamente, sin volver a anotar nada.
+    def _al_revertir(self, funcion, *argumentos):
+        if self._transaccion is not None and self._transaccion["reversibles"]:
+            self._transaccion["deshacer"].append((funcion, argumentos))
+
+    def _reversible(self):
+        return self._transaccion is not None and self._transaccion["reversibles"] > 0
+
+# Deshace, de la última a la primera, las mutaciones anotadas desde la posición dada. Los elementos que
+# vuelven a un diccionario por id (estudiantes, cursos, eliminados) quedan al final de su orden de
+# iteración; en los conjuntos ordenados, los prerequisitos y las listas de espera vuelven a su lugar.
+    def _revertir(self, desde):
+        deshacer = self._transaccion["deshacer"]
+        pendientes = deshacer[desde:]
+        del deshacer[desde:]
+        for funcion, argumentos in reversed(pendientes):
+            funcion(*argumentos)
+
+# Asigna una clave de un diccionario, o la quita y retorna su valor, anotando cómo deshacerlo.
+    def _asignar(self, diccionario, clave, valor):
+        self._al_revertir(_reponer, diccionario, clave, diccionario.get(clave, _AUSENTE))
+        diccionario[clave] = valor
+
+    def _sacar(self, diccionario, clave):
+        valor = diccionario.pop(clave)
+        self._al_revertir(_reponer, diccionario, clave, valor)
+        return valor
+
+# Persiste una mutación: la anexa al diario (O(1)) o, sin diario, reescribe el JSON completo.
+# Dentro de una transacción solo se acumula y se escribe al cerrar el bloque.
+    def _registrar_cambio(self, operacion, *argumentos):
+        if self._transaccion is not None:
+            self._transaccion["registros"].append((operacion, list(argumentos)))
+            return
+        if self.almacen is not None:
+            with self._metricas.medir("persistencia.almacen"):
+                self.almacen.aplicar(operacion, list(argumentos))
+            self.sucios.limpiar()
+        elif self.diario is None:
+            self.guardar_en_json()
+        else:
+            with self._metricas.medir("persistencia.diario"):
+                checkpoint = self.diario.anexar(operacion, list(argumentos))
+            if checkpoint:
+                self.guardar_en_json()
+
+# Vuelve a aplicar un registro del diario sobre el estado cargado desde el JSON.
+    def _aplicar_registro(self, registro):
+        operacion = registro["op"]
+        args = registro["args"]
+        if operacion == "inscripcion":
+            self._vincular(*args)
+        elif operacion == "cancelacion":
+            self._desvincular(*args)
+        elif operacion == "encolar_espera":
+            self._encolar_espera(*args)
+        elif operacion == "desencolar_espera":
+            self._desencolar_espera(args[0])
+        elif operacion == "agregar_material":
+            curso_id, m = args
+            self.agregar_material(curso_id, Material(m["id"], m["nombre"], m["tipo"], m["url"]))
+        elif operacion in ("registrar_estudiante", "crear_curso", "establecer_prerequisito",
+                           "eliminar_prerequisito", "eliminar_material", "eliminar_curso",
+                           "eliminar_estudiante", "restaurar_curso", "restaurar_material",
+                           "restaurar_prerequisito", "actualizar_material"):
+            getattr(self, operacion)(*args)
+        else:
+            logger.warning("Operación desconocida en el diario: %s", operacion)
+
+# Vincula un estudiante y un curso en ambas direcciones.
+    def _vincular(self, estudiante_id, curso_id):
+        estudiante = self.estudiantes[estudiante_id]
+        curso = self.cursos[curso_id]
+        self._al_revertir(setattr, estudiante, "mascara_cursos", estudiante.mascara_cursos)
+        estudiante.cursos.agregar(curso)
+        self._al_revertir(estudiante.cursos.quitar, curso)
+        curso.estudiantes.agregar(estudiante)
+        self._al_revertir(curso.estudiantes.quitar, estudiante)
+        estudiante.mascara_cursos |= self.grafo_cursos.bit(curso_id)
+        self.sucios.curso(curso_id)
+
+# Desvincula un estudiante y un curso en ambas direcciones.
+    def _desvincular(self, estudiante_id, curso_id):
+        estudiante = self.estudiantes[estudiante_id]
+        curso = self.cursos[curso_id]
+        if self._reversible():
+            self._al_revertir(estudiante.cursos.insertar, estudiante.cursos.indice(curso), curso)
+            self._al_revertir(curso.estudiantes.insertar, curso.estudiantes.indice(estudiante), estudiante)
+            self._al_revertir(setattr, estudiante, "mascara_cursos", estudiante.mascara_cursos)
+        estudiante.cursos.quitar(curso)
+        curso.estudiantes.quitar(estudiante)
+        estudiante.mascara_cursos &= ~self.grafo_cursos.bit(curso_id)
+        self.sucios.curso(curso_id)
+
+# Las listas de espera se modifican solo con estos dos métodos, que mantienen esperas_estudiante: los
+# cursos en cuya lista está cada estudiante, para sacarlo de todas al eliminarlo sin recorrer los cursos.
+# Retorna False si el estudiante ya estaba esperando en ese curso.
+    def _encolar_espera(self, curso_id, estudiante_id, prioridad):
+        if curso_id not in self.lista_espera:
+            self._asignar(self.lista_espera, curso_id, ListaEspera())
+        espera = self.lista_espera[curso_id]
+        if not espera.encolar(estudiante_id, prioridad):
+            return False
+        self._al_revertir(espera.retirar, estudiante_id)
+        if estudiante_id not in self.esperas_estudiante:
+            self._asignar(self.esperas_estudiante, estudiante_id, set())
+        self.esperas_estudiante[estudiante_id].add(curso_id)
+        self._al_revertir(self.esperas_estudiante[estudiante_id].discard, curso_id)
+        self.sucios.curso(curso_id)
+        return True
+
+    def _desencolar_espera(self, curso_id):
+        espera = self.lista_espera[curso_id]
+        if not espera.esta_vacia():
+            prioridad, turno = espera.turnos[espera.ver_frente()]
+            self._al_revertir(espera.reponer, espera.ver_frente(), prioridad, turno, turno)
+        estudiante_id = espera.desencolar()
+        cursos = self.esperas_estudiante.get(estudiante_id)
+        if cursos is not None:
+            cursos.discard(curso_id)
+            self._al_revertir(cursos.add, curso_id)
+            if not cursos:
+                self._sacar(self.esperas_estudiante, estudiante_id)
+        self.sucios.curso(curso_id)
+        return estudiante_id
+
+# Crea un curso nuevo. Tampoco se reutiliza el id de un curso eliminado: la instantánea, los fragmentos
+# y SQLite guardan un solo curso por id, y el eliminado ya no se podría restaurar.
+    def crear_curso(self, id, nombre, descripcion, nivel):
+        if id not in self.cursos and id not in self.cursos_eliminados:
+            nuevo_curso = Curso(id, nombre, descripcion, nivel)
+            self._asignar(self.cursos, id, nuevo_curso)
+            self.grafo_cursos.agregar_vertice(nuevo_curso)
+            self._al_revertir(self.grafo_cursos.eliminar_vertice, id)
+            self._indexar_curso(nuevo_curso)
+            self._al_revertir(self._desindexar_curso, nuevo_curso)
+            self._asignar(self.lista_espera, id, ListaEspera())
+            self.sucios.curso(id)
+            self._registrar_cambio("crear_curso", id, nombre, descripcion, nivel)
+            return nuevo_curso
+        return None
+
+    def registrar_estudiante(self, id, nombre, email):
+        if id not in self.estudiantes:
+            nuevo_estudiante = Estudiante(id, nombre, email)
+            self._asignar(self.estudiantes, id, nuevo_estudiante)
+            self._indexar_estudiante(nuevo_estudiante)
+            self._al_revertir(self._desindexar_estudiante, nuevo_estudiante)
+            self.sucios.estudiante(id)
+            self._registrar_cambio("registrar_estudiante", id, nombre, email)
+            return nuevo_estudiante
+        return None
+
+# Agrega un estudiante a los índices por nombre y por id, o lo deja para el final si están diferidos.
+    def _indexar_estudiante(self, estudiante):
+        if self._sin_indexar is not None:
+            self._sin_indexar[0].append(estudiante)
+        else:
+            self.arbol_estudiantes.insertar(estudiante.nombre.lower(), estudiante)
+            self.ids_estudiantes.insertar(estudiante.id, estudiante)
+
+    def _desindexar_estudiante(self, estudiante):
+        self.arbol_estudiantes.eliminar(estudiante.nombre.lower(), estudiante)
+        self.ids_estudiantes.eliminar(estudiante.id, estudiante)
+
+# Agrega un curso a los índices por nombre, por id y de trigramas. Durante una carga completa o una
+# importación los índices ordenados se arman al final de una sola vez (ver _indexado_diferido).
+    def _indexar_curso(self, curso):
+        if self._sin_indexar is not None:
+            self._sin_indexar[1].append(curso)
+        else:
+            self.arbol_cursos.insertar(f"{curso.nombre.lower()}_{curso.nivel}", curso)
+            self.ids_cursos.insertar(curso.id, curso)
+        self.indice_cursos.agregar(curso)
+
+    def _desindexar_curso(self, curso):
+        self.arbol_cursos.eliminar(f"{curso.nombre.lower()}_{curso.nivel}", curso)
+        self.ids_cursos.eliminar(curso.id, curso)
+        self.indice_cursos.eliminar(curso.id)
+
+# Mientras dura el bloque, los estudiantes y cursos nuevos no se insertan uno a uno en los índices
+# ordenados (cada inserción desplaza la lista completa); al salir se agregan todos con cargar(),
+# que ordena una sola vez. Los que se eliminaron dentro del bloque se descartan, y los que una
+# transacción revertida quitó y volvió a agregar se cuentan una sola vez.
+    @contextmanager
+    def _indexado_diferido(self):
+        if self._sin_indexar is not None:
+            yield
+            return
+        self._sin_indexar = ([], [])
+        try:
+            yield
+        finally:
+            estudiantes, cursos = self._sin_indexar
+            self._sin_indexar = None
+            estudiantes = [e for e in dict.fromkeys(estudiantes) if self.estudiantes.get(e.id) is e]
+            cursos = [c for c in dict.fromkeys(cursos) if self.cursos.get(c.id) is c]
+            self.arbol_estudiantes.cargar((e.nombre.lower(), e) for e in estudiantes)
+            self.ids_estudiantes.cargar((e.id, e) for e in estudiantes)
+            self.arbol_cursos.cargar((f"{c.nombre.lower()}_{c.nivel}", c) for c in cursos)
+            self.ids_cursos.cargar((c.id, c) for c in cursos)
+
+# Prepara el sistema para cargar muchas filas seguidas (ver elearning.importacion): índices ordenados
+# diferidos, sin anotar en el historial de deshacer y sin checkpoints intermedios del diario, que
+# reescribirían el JSON completo cada pocos lotes. Al salir se guarda un checkpoint si hace falta.
+    @contextmanager
+    def importacion_masiva(self):
+        intervalo = self.diario.intervalo_checkpoint if self.diario else None
+        if self.diario:
+            self.diario.intervalo_checkpoint = float("inf")
+        anotar, self._anotar_historial = self._anotar_historial, False
+        try:
+            with self._indexado_diferido():
+                yield self
+        finally:
+            self._anotar_historial = anotar
+            if self.diario:
+                self.diario.intervalo_checkpoint = intervalo
+                if self.diario.pendientes >= intervalo:
+                    self.guardar_en_json()
+
+# Arma el diccionario con todo el estado del sistema, en el mismo formato del archivo JSON.
+    def _exportar_datos(self):
+        return {
+            "estudiantes": [
+                {
+                    "id": e.id,
+                    "nombre": e.nombre,
+                    "email": e.email,
+                    "cursos": [curso.id for curso in e.cursos]
+                }
+                for e in self.estudiantes.values()
+            ],
+            "cursos": [
+                {
+                    "id": c.id,
+                    "nombre": c.nombre,
+                    "descripcion": c.descripcion,
+                    "nivel": c.nivel,
+                    "materiales": [
+                        {
+                            "id": m.id,
+                            "nombre": m.nombre,
+                            "tipo": m.tipo,
+                            "url": m.url
+                        }
+                        for m in c.materiales
+                    ],
+                    "estudiantes": [estudiante.id for estudiante in c.estudiantes],
+                    "prerequisitos": list(c.prerequisitos)
+                }
+                for c in self.cursos.values()
+            ],
+            "cursos_eliminados": [
+                {
+                    "id": c.id,
+                    "nombre": c.nombre,
+                    "descripcion": c.descripcion,
+                    "nivel": c.nivel,
+                    "materiales": [
+                        {
+                            "id": m.id,
+                            "nombre": m.nombre,
+                            "tipo": m.tipo,
+                            "url": m.url
+                        }
+                        for m in c.materiales
+                    ],
+                    "estudiantes": [estudiante.id for estudiante in c.estudiantes],
+                    "prerequisitos": list(c.prerequisitos)
+                }
+                for c in self.cursos_eliminados.values()
+            ],
+            "materiales_eliminados": [
+                {
+                    "id": m.id,
+                    "curso_id": self.indice_materiales[m.id][0],
+                    "nombre": m.nombre,
+                    "tipo": m.tipo,
+                    "url": m.url
+                }
+                for m in self.materiales_eliminados.values()
+            ],
+            "prerequisitos_eliminados": dict(self.prerequisitos_eliminados),
+            "listas_espera": {
+                str(curso_id): espera.a_lista()
+                for curso_id, espera in self.lista_espera.items() if not espera.esta_vacia()
+            },
+            "secuencia_diario": self.diario.secuencia if self.diario else 0
+        }
+
+# Guarda el estado actual del sistema en un archivo JSON.
+    def guardar_en_json(self):
+        if self._transaccion is not None:
+            self._transaccion["checkpoint"] = True
+            return
+        if self.almacen is not None:
+            return
+        if self.formato == "fragmentado":
+            self._guardar_fragmentos()
+            return
+        with self._metricas.medir("persistencia.exportar"):
+            datos = self._exportar_datos()
+        self.sucios.limpiar()
+
+        logger.debug("Guardando datos en JSON (%d cursos)", len(datos["cursos"]))
+
+        if self._guardado is not None:
+            self._guardado.instantanea(datos)
+            if self.diario:
+                self.diario.truncar()
+            return
+
+        if self.formato == "binario":
+            with self._metricas.medir("persistencia.escribir_instantanea"):
+                escribir_instantanea(self.ruta_instantanea, FilasJSON(datos))
+        else:
+            with self._metricas.medir("persistencia.escribir_json"):
+                escribir_json_atomico(self.ruta_json, datos, indent=2)
+
+        if self.diario:
+            with self._metricas.medir("persistencia.truncar_diario"):
+                self.diario.truncar()
+
+# Escribe solo los fragmentos de las entidades que cambiaron desde el último guardado. Si la escritura
+# falla, las marcas vuelven a `sucios` y el próximo guardado reintenta esas entidades; en segundo plano
+# es el hilo de guardado el que conserva los cambios que no pudo escribir.
+    def _guardar_fragmentos(self):
+        marcas = self.sucios.tomar()
+        try:
+            with self._metricas.medir("persistencia.exportar"):
+                cambios = self._exportar_cambios(*marcas)
+
+            logger.debug("Guardando %d fragmentos de cursos y %d de estudiantes",
+                         len(cambios["cursos"]), len(cambios["estudiantes"]))
+
+            if self._guardado is not None:
+                self._guardado.instantanea(cambios)
+            else:
+                with self._metricas.medir("persistencia.escribir_fragmentos"):
+                    self.fragmentos.escribir(cambios)
+        except Exception:
+            self.sucios.devolver(*marcas)
+            raise
+        if self.diario:
+            with self._metricas.medir("persistencia.truncar_diario"):
+                self.diario.truncar()
+
+# Arma los fragmentos de los cursos y bloques de estudiantes con las marcas tomadas de `sucios` (todos
+# si está marcado todo). Un curso o bloque que ya no existe se manda como None, para
+# borrar su archivo. Los materiales eliminados se recorren una vez para repartirlos entre sus cursos.
+    def _exportar_cambios(self, todo, estudiantes, cursos):
+        if todo:
+            cursos = set(self.cursos) | set(self.cursos_eliminados)
+            bloques = {}
+            for estudiante in self.estudiantes.values():
+                bloques.setdefault(bloque_de(estudiante.id), []).append(estudiante)
+            for grupo in bloques.values():
+                grupo.sort(key=lambda e: e.id)
+        else:
+            bloques = {}
+            for bloque in {bloque_de(id) for id in estudiantes}:
+                inicio = bloque * ESTUDIANTES_POR_BLOQUE
+                bloques[bloque] = [
+                    self.estudiantes[id] for id in range(inicio, inicio + ESTUDIANTES_POR_BLOQUE) if id in self.estudiantes
+                ]
+
+        eliminados = {}
+        sin_curso = []
+        for material_id, material in self.materiales_eliminados.items():
+            curso_id = self.indice_materiales[material_id][0]
+            fila = {"id": material.id, "nombre": material.nombre, "tipo": material.tipo, "url": material.url}
+            if curso_id is None:
+                sin_curso.append(dict(fila, curso_id=None))
+            elif curso_id in cursos:
+                eliminados.setdefault(curso_id, []).append(fila)
+
+        fragmentos = {}
+        for curso_id in cursos:
+            curso = self.cursos.get(curso_id)
+            eliminado = curso is None
+            if eliminado:
+                curso = self.cursos_eliminados.get(curso_id)
+            if curso is None:
+                fragmentos[curso_id] = None
+                continue
+            espera = self.lista_espera.get(curso_id)
+            fragmentos[curso_id] = {
+                "id": curso.id,
+                "nombre": curso.nombre,
+                "descripcion": curso.descripcion,
+                "nivel": curso.nivel,
+                "eliminado": eliminado,
+                "materiales": [
+                    {"id": m.id, "nombre": m.nombre, "tipo": m.tipo, "url": m.url} for m in curso.materiales
+                ],
+                "materiales_eliminados": eliminados.get(curso_id, []),
+                "estudiantes": [estudiante.id for estudiante in curso.estudiantes],
+                "prerequisitos": list(curso.prerequisitos),
+                "lista_espera": espera.a_lista() if espera is not None else []
+            }
+
+        return {
+            "cursos": fragmentos,
+            "estudiantes": {
+                bloque: [{"id": e.id, "nombre": e.nombre, "email": e.email} for e in grupo] or None
+                for bloque, grupo in bloques.items()
+            },
+            "indice": {
+                "secuencia_diario": self.diario.secuencia if self.diario else 0,
+                "prerequisitos_eliminados": dict(self.prerequisitos_eliminados),
+                "materiales_sin_curso": sin_curso
+            },
+            "completo": todo
+        }
+
+# Carga los datos del sistema desde un archivo JSON, incluyendo estudiantes y cursos.
+    def cargar_desde_json(self):
+        cerrojo = self.cerrojo.exclusivo() if self.cerrojo is not None and not self.cerrojo.tomado else nullcontext()
+        with _recolector_pausado(), cerrojo:
+            self._cargar()
+            if self.cerrojo is not None:
+                self.diario.sincronizar()
+
+# Elige el origen: el almacén SQLite, la instantánea binaria o el JSON; sin ninguno, datos de ejemplo.
+# Si el JSON existe pero no se puede cargar (o falla la reaplicación del diario) se lanza RuntimeError
+# y los archivos quedan como están: reemplazarlos por datos de ejemplo perdería todo lo guardado.
+    def _cargar(self):
+        if self.almacen is not None:
+            self._cargar_desde_almacen()
+        elif self.formato == "binario" and os.path.exists(self.ruta_instantanea):
+            self._cargar_desde_instantanea()
+        elif self.formato == "fragmentado" and self.fragmentos.existe():
+            self._cargar_desde_fragmentos()
+        elif os.path.exists(self.ruta_json):
+            try:
+                with self._metricas.medir("carga.leer_json"):
+                    with open(self.ruta_json, "r", encoding="utf-8") as f:
+                        datos = json.load(f)
+
+                logger.debug("Cargando datos desde JSON...")
+
+                with self.transaccion(guardar=False, reversible=False):
+                    with self._metricas.medir("carga.reconstruir"):
+                        self._cargar_datos(datos)
+                    with self._metricas.medir("carga.diario"):
+                        self._reproducir_diario(datos.get("secuencia_diario", 0))
+                # Los fragmentos, si se usan, todavía no tienen nada de lo que vino del JSON.
+                self.sucios.marcar_todo()
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    for curso_id, prerequisitos in self.grafo_cursos.aristas.items():
+                        if prerequisitos:
+                            logger.debug("Curso %s: prerequisitos %s", curso_id, prerequisitos)
+
+            except Exception as e:
+                logger.error("Error cargando %s: %s", self.ruta_json, e)
+                raise RuntimeError(
+                    f"No se pudieron cargar los datos de {self.ruta_json} ({e!r}); el archivo y el diario quedan sin tocar"
+                ) from e
+        else:
+            logger.info("Archivo JSON no existe, creando datos de ejemplo...")
+            self._crear_datos_ejemplo()
+
+# Carga el estado desde la instantánea binaria, mapeada en memoria, armando todas las entidades con
+# _reconstruir como con el JSON. Si no se puede leer se lanza RuntimeError en vez de volver al JSON:
+# después de guardar en binario el JSON queda viejo, y cargarlo perdería todo lo guardado desde entonces.
+    def _cargar_desde_instantanea(self):
+        try:
+            with self._metricas.medir("carga.abrir_instantanea"):
+                lector = LectorInstantanea(self.ruta_instantanea)
+            with lector, self.transaccion(guardar=False, reversible=False):
+                with self._metricas.medir("carga.reconstruir"):
+                    self._reconstruir(lector)
+                with self._metricas.medir("carga.diario"):
+                    self._reproducir_diario(lector.secuencia_diario())
+        except Exception as e:
+            logger.error("Error cargando la instantánea %s: %s", self.ruta_instantanea, e)
+            raise RuntimeError(
+                f"No se pudo cargar la instantánea {self.ruta_instantanea} ({e!r}); el archivo y el diario quedan sin tocar"
+            ) from e
+
+# Carga el estado desde la carpeta de fragmentos. A diferencia de la instantánea no se vuelve al JSON
+# si falla: después de guardar en fragmentos el JSON queda viejo, y cargarlo perdería esos cambios.
+    def _cargar_desde_fragmentos(self):
+        with self._metricas.medir("carga.leer_fragmentos"):
+            datos = self.fragmentos.leer()
+        with self.transaccion(guardar=False, reversible=False):
+            with self._metricas.medir("carga.reconstruir"):
+                self._cargar_datos(datos)
+            with self._metricas.medir("carga.diario"):
+                self._reproducir_diario(datos["secuencia_diario"])
+
+# Carga el estado desde el almacén externo; si está vacío, primero importa el archivo JSON.
+# Lee todas las filas: el almacén no reemplaza a las estructuras en memoria, solo al archivo.
+    def _cargar_desde_almacen(self):
+        if self.almacen.esta_vacio():
+            if not os.path.exists(self.ruta_json):
+                self._crear_datos_ejemplo()
+                return
+            logger.info("Importando datos del JSON al almacén...")
+            with open(self.ruta_json, "r", encoding="utf-8") as f:
+                self.almacen.guardar(json.load(f))
+        with self.transaccion(guardar=False, reversible=False):
+            with self._metricas.medir("carga.leer_almacen"):
+                datos = self.almacen.cargar()
+            with self._metricas.medir("carga.reconstruir"):
+                self._cargar_datos(datos)
+
+# Reconstruye estudiantes, cursos, grafo y eliminados a partir de un diccionario de datos. Un JSON
+# anterior puede tener un curso eliminado con el mismo id que uno activo; FilasJSON descarta esa copia.
+    def _cargar_datos(self, datos):
+        repetidos = {c["id"] for c in datos.get("cursos", [])} & {c["id"] for c in datos.get("cursos_eliminados", [])}
+        if repetidos:
+            logger.warning("Cursos eliminados descartados porque su id volvió a usarse en un curso activo: %s",
+                           sorted(repetidos))
+        self._reconstruir(FilasJSON(datos))
+
+# Reconstruye todo el estado a partir de filas (FilasJSON o LectorInstantanea). Las entidades se
+# arman directamente, sin pasar por los métodos públicos, y los índices ordenados al final.
+# Una recarga dentro de una transacción reversible no se deshace: lo anotado antes se descarta.
+    def _reconstruir(self, filas):
+        if self._transaccion is not None:
+            del self._transaccion["deshacer"][:]
+        self.estudiantes.clear()
+        self.cursos.clear()
+        self.cursos_eliminados.clear()
+        self.materiales_eliminados.clear()
+        self.indice_materiales.clear()
+        self.grafo_cursos = Grafo()
+        self.arbol_cursos = ArbolBusqueda()
+        self.ids_cursos = ArbolBusqueda()
+        self.arbol_estudiantes = ArbolBusqueda()
+        self.ids_estudiantes = ArbolBusqueda()
+        self.indice_cursos = IndiceTrigramas()
+        self.lista_espera.clear()
+
+        with self._indexado_diferido():
+            for id, nombre, email in filas.estudiantes():
+                if id not in self.estudiantes:
+                    estudiante = self.estudiantes[id] = Estudiante(id, nombre, email)
+                    self._sin_indexar[0].append(estudiante)
+
+            for id, nombre, descripcion, nivel, eliminado in filas.cursos():
+                curso = Curso(id, nombre, descripcion, nivel)
+                if eliminado:
+                    self.cursos_eliminados[id] = curso
+                elif id not in self.cursos:
+                    self.cursos[id] = curso
+                    self.grafo_cursos.agregar_vertice(curso)
+                    self._indexar_curso(curso)
+                    self.lista_espera[id] = ListaEspera()
+
+        for id, curso_id, nombre, tipo, url, estado in filas.materiales():
+            if id in self.indice_materiales:
+                logger.warning("Material %s del curso %s descartado porque su id ya está en uso", id, curso_id)
+                continue
+            material = Material(id, nombre, tipo, url)
+            if estado:
+                self.materiales_eliminados[id] = material
+            else:
+                curso = self.cursos.get(curso_id) or self.cursos_eliminados.get(curso_id)
+                if curso is None:
+                    continue
+                curso.materiales.agregar(material)
+            self.indice_materiales[id] = (curso_id, material)
+
+        aristas = []
+        for curso_id, prerequisito_id in filas.prerequisitos():
+            if curso_id in self.cursos:
+                if prerequisito_id in self.cursos:
+                    self.cursos[curso_id].prerequisitos.append(prerequisito_id)
+                    aristas.append((curso_id, prerequisito_id))
+                else:
+                    logger.warning("Prerequisito %s no encontrado para curso %s", prerequisito_id, curso_id)
+            elif curso_id in self.cursos_eliminados:
+                self.cursos_eliminados[curso_id].prerequisitos.append(prerequisito_id)
+
+        for curso_id, prerequisito_id in self.grafo_cursos.agregar_aristas(aristas):
+            logger.warning("Prerequisito %s -> %s descartado porque forma un ciclo", curso_id, prerequisito_id)
+            self.cursos[curso_id].prerequisitos.remove(prerequisito_id)
+
+        # Es el ciclo más largo de la carga: hace lo mismo que _vincular, con el bit de cada curso a mano.
+        bits = {}
+        for estudiante_id, curso_id in filas.inscripciones():
+            estudiante = self.estudiantes.get(estudiante_id)
+            if estudiante is None:
+                continue
+            curso = self.cursos.get(curso_id)
+            if curso is not None:
+                estudiante.cursos.agregar(curso)
+                curso.estudiantes.agregar(estudiante)
+                if curso_id not in bits:
+                    bits[curso_id] = self.grafo_cursos.bit(curso_id)
+                estudiante.mascara_cursos |= bits[curso_id]
+            elif curso_id in self.cursos_eliminados:
+                self.cursos_eliminados[curso_id].estudiantes.agregar(estudiante)
+
+        self.prerequisitos_eliminados = filas.prerequisitos_eliminados()
+
+        self.esperas_estudiante.clear()
+        for curso_id, estudiante_id, prioridad in filas.listas_espera():
+            espera = self.lista_espera.setdefault(curso_id, ListaEspera())
+            if estudiante_id in self.estudiantes and espera.encolar(estudiante_id, prioridad):
+                self.esperas_estudiante.setdefault(estudiante_id, set()).add(curso_id)
+
+# Aplica los registros del diario posteriores al último checkpoint guardado en el JSON.
+    def _reproducir_diario(self, secuencia_checkpoint):
+        if self.diario is None:
+            return
+        self.diario.secuencia = secuencia_checkpoint
+        registros = self.diario.leer(secuencia_checkpoint)
+        self._aplicar_registros(registros)
+        self.diario.pendientes = len(registros)
+        if registros:
+            logger.info("%d registros del diario reaplicados", len(registros))
+
+    def _aplicar_registros(self, registros):
+        self._anotar_historial = False
+        try:
+            for registro in registros:
+                self._aplicar_registro(registro)
+                self.diario.secuencia = registro["seq"]
+        finally:
+            self._anotar_historial = True
+
+# Aplica lo que otros procesos anexaron al diario desde la última vez; si un checkpoint ya se llevó
+# registros que este proceso no vio, recarga todo. Se llama con el cerrojo tomado.
+    def _ponerse_al_dia(self):
+        registros = self.diario.leer_nuevos()
+        if registros is None:
+            logger.info("Otro proceso guardó un checkpoint con cambios que faltaban aquí; recargando los datos")
+            self.cargar_desde_json()
+            return 0
+        if registros:
+            with self._transaccion_local(guardar=False, reversible=False):
+                self._aplicar_registros(registros)
+            self.diario.pendientes += len(registros)
+        return len(registros)
+
+# Con datos compartidos, trae los cambios que hicieron otros procesos (solo los registros nuevos del
+# diario; sin cambios cuesta un stat). Las operaciones que escriben ya lo hacen solas; esto es para
+# mostrar datos al día sin escribir nada. Retorna cuántos registros se aplicaron.
+    def refrescar(self):
+        if self.cerrojo is None:
+            return 0
+        with self.cerrojo.compartido():
+            return self._ponerse_al_dia()
+
+# Versión de los datos que tiene este proceso: la secuencia del último registro del diario aplicado.
+# Los checkpoints guardan la misma secuencia, así que también sirve para comparar con lo que hay en disco.
+    def version(self):
+        return self.diario.secuencia if self.diario else 0
+
+# Escribe los datos de ejemplo y los carga. Un diario que haya quedado de datos anteriores no tiene
+# nada que ver con estos: se aparta (ver DiarioCambios.descartar) en vez de reaplicarlo encima.
+    def _crear_datos_ejemplo(self):
+        if self.diario is not None:
+            self.diario.descartar()
+        datos = {
+            "estudiantes": [
+                {"id": 1, "nombre": "Ana Gómez", "email": "ana@example.com", "cursos": []},
+                {"id": 2, "nombre": "Carlos López", "email": "carlos@example.com", "cursos": []},
+                {"id": 3, "nombre": "María Pérez", "email": "maria@example.com", "cursos": []}
+            ],
+            "cursos": [
+                {"id": 101, "nombre": "Python Básico", "descripcion": "Introducción a Python", "nivel": "Básico", "materiales": [], "estudiantes": [], "prerequisitos": []},
+                {"id": 102, "nombre": "Python Intermedio", "descripcion": "Conceptos avanzados de Python", "nivel": "Intermedio", "materiales": [], "estudiantes": [], "prerequisitos": [101]},
+                {"id": 103, "nombre": "Python Avanzado", "descripcion": "Programación avanzada con Python", "nivel": "Avanzado", "materiales": [], "estudiantes": [], "prerequisitos": [102]},
+                {"id": 201, "nombre": "Bases de Datos Básico", "descripcion": "Introducción a las bases de datos", "nivel": "Básico", "materiales": [], "estudiantes": [], "prerequisitos": []},
+                {"id": 202, "nombre": "Bases de Datos Avanzado", "descripcion": "Diseño avanzado de bases de datos", "nivel": "Avanzado", "materiales": [], "estudiantes": [], "prerequisitos": [201]},
+                {"id": 301, "nombre": "Web Development", "descripcion": "Desarrollo web completo", "nivel": "Avanzado", "materiales": [], "estudiantes": [], "prerequisitos": [102, 201]}
+            ],
+            "cursos_eliminados": [],
+            "materiales_eliminados": [],
+            "prerequisitos_eliminados": {}
+        }
+
+        with open(self.ruta_json, "w", encoding="utf-8") as f:
+            json.dump(datos, f, indent=2, ensure_ascii=False)
+        self.cargar_desde_json()
+
+# Inscribe a un estudiante en un curso si cumple con los prerequisitos y hay cupo.
+# Si el curso está lleno lo deja en la lista de espera con la prioridad indicada.
+    def inscribir_estudiante(self, estudiante_id, curso_id, capacidad_maxima=30, prioridad=0):
+        if estudiante_id in self.estudiantes and curso_id in self.cursos:
+            estudiante = self.estudiantes[estudiante_id]
+            curso = self.cursos[curso_id]
+
+            if curso in estudiante.cursos:
+                return "ya_inscrito"
+
+            if not self.grafo_cursos.verificar_cumple_prerequisitos(estudiante, curso_id):
+                return "prerequisitos_faltantes"
+
+            if len(curso.estudiantes) < capacidad_maxima:
+                self._vincular(estudiante_id, curso_id)
+                self._anotar("inscripcion", estudiante_id, curso_id)
+                self._registrar_cambio("inscripcion", estudiante_id, curso_id)
+                return True
+            else:
+                if self._encolar_espera(curso_id, estudiante_id, prioridad):
+                    self._registrar_cambio("encolar_espera", curso_id, estudiante_id, prioridad)
+                return "lista_espera"
+        return False
+
+# Inscribe a un grupo de estudiantes en un curso en una sola pasada: los prerequisitos se comparan
+# con la máscara del cierre del curso, los cupos se llenan en el orden dado y el resto pasa a la lista
+# de espera. Todo se persiste una sola vez. Retorna {estudiante_id: resultado}, con los mismos
+# resultados que inscribir_estudiante; un id repetido conserva el resultado de su primera aparición.
+    def inscribir_cohorte(self, curso_id, estudiante_ids, capacidad_maxima=30, prioridad=0):
+        if curso_id not in self.cursos:
+            return {estudiante_id: False for estudiante_id in estudiante_ids}
+        curso = self.cursos[curso_id]
+        requeridos = self.grafo_cursos.cierre[curso_id]
+        bit = self.grafo_cursos.bit(curso_id)
+        cupos = capacidad_maxima - len(curso.estudiantes)
+        resultados = {}
+        with self.transaccion(reversible=False):
+            for estudiante_id in estudiante_ids:
+                if estudiante_id in resultados:
+                    continue
+                estudiante = self.estudiantes.get(estudiante_id)
+                if estudiante is None:
+                    resultados[estudiante_id] = False
+                elif estudiante.mascara_cursos & bit:
+                    resultados[estudiante_id] = "ya_inscrito"
+                elif requeridos & ~estudiante.mascara_cursos:
+                    resultados[estudiante_id] = "prerequisitos_faltantes"
+                elif cupos > 0:
+                    cupos -= 1
+                    self._vincular(estudiante_id, curso_id)
+                    self._anotar("inscripcion", estudiante_id, curso_id)
+                    self._registrar_cambio("inscripcion", estudiante_id, curso_id)
+                    resultados[estudiante_id] = True
+                else:
+                    if self._encolar_espera(curso_id, estudiante_id, prioridad):
+                        self._registrar_cambio("encolar_espera", curso_id, estudiante_id, prioridad)
+                    resultados[estudiante_id] = "lista_espera"
+        return resultados
+
+# Cancela la inscripción de un estudiante en un curso y maneja la lista de espera.
+    def cancelar_inscripcion(self, estudiante_id, curso_id):
+        if estudiante_id in self.estudiantes and curso_id in self.cursos:
+            estudiante = self.estudiantes[estudiante_id]
+            curso = self.cursos[curso_id]
+            if curso in estudiante.cursos:
+                self._desvincular(estudiante_id, curso_id)
+                self._anotar("cancelacion", estudiante_id, curso_id)
+                self._registrar_cambio("cancelacion", estudiante_id, curso_id)
+                self._promover_lista_espera(curso_id)
+                return True
+        return False
+
+# Inscribe al primero de la lista de espera que pueda ocupar el cupo liberado. Los que ya no
+# existen o no cumplen los prerequisitos salen de la lista. El cupo liberado se respeta aunque el
+# curso tenga más inscritos que la capacidad por defecto; si no, el estudiante volvería a la cola.
+    def _promover_lista_espera(self, curso_id):
+        espera = self.lista_espera[curso_id]
+        curso = self.cursos[curso_id]
+        while not espera.esta_vacia():
+            estudiante_id = self._desencolar_espera(curso_id)
+            self._registrar_cambio("desencolar_espera", curso_id)
+            if self.inscribir_estudiante(estudiante_id, curso_id, len(curso.estudiantes) + 1) is True:
+                return estudiante_id
+        return None
+
+# Retorna la posición (desde 1) de un estudiante en la lista de espera de un curso, o None.
+    def posicion_en_espera(self, estudiante_id, curso_id):
+        if curso_id in self.lista_espera:
+            return self.lista_espera[curso_id].posicion(estudiante_id)
+        return None
+
+# Anota una acción en el historial de deshacer, salvo mientras se reaplica el diario o el propio historial.
+    def _anotar(self, tipo, a, b=None):
+        if self._anotar_historial:
+            self.historial_cambios.registrar(tipo, a, b)
+            if self._transaccion is None:
+                self.historial_cambios.guardar()
+
+# Aplica una acción del historial. Inscripciones y cancelaciones se aplican tal cual, sin cupo ni
+# lista de espera, para que deshacer sea exacto; el resto pasa por el método público.
+    def _aplicar_accion(self, accion):
+        tipo, a, b = accion
+        if tipo in ("inscripcion", "cancelacion"):
+            if a not in self.estudiantes or b not in self.cursos:
+                return False
+            inscrito = self.cursos[b] in self.estudiantes[a].cursos
+            if tipo == "inscripcion" and not inscrito:
+                self._vincular(a, b)
+            elif tipo == "cancelacion" and inscrito:
+                self._desvincular(a, b)
+            else:
+                return False
+            self._registrar_cambio(tipo, a, b)
+            return True
+        argumentos = (a,) if b is None else (a, b)
+        self._anotar_historial = False
+        try:
+            return getattr(self, tipo)(*argumentos) is True
+        finally:
+            self._anotar_historial = True
+
+# Deshace la última acción registrada (inscripción, cancelación, prerequisito o eliminación de curso).
+    def deshacer_ultima_accion(self):
+        hecho = self.historial_cambios.deshacer_con(self._aplicar_accion)
+        if self._transaccion is None:
+            self.historial_cambios.guardar()
+        return hecho
+
+# Vuelve a aplicar la última acción deshecha.
+    def rehacer_ultima_accion(self):
+        hecho = self.historial_cambios.rehacer_con(self._aplicar_accion)
+        if self._transaccion is None:
+            self.historial_cambios.guardar()
+        return hecho
+
+# Busca un estudiante por email; con SQLite se resuelve con el índice de la tabla.
+    def buscar_estudiante_por_email(self, email):
+        if isinstance(self.almacen, AlmacenSQLite):
+            return self.estudiantes.get(self.almacen.buscar_estudiante_por_email(email))
+        for estudiante in self.estudiantes.values():
+            if estudiante.email == email:
+                return estudiante
+        return None
+
+# Busca cursos por tema y opcionalmente por nivel.
+    def buscar_cursos(self, tema, nivel="Todos"):
+        return self.indice_cursos.buscar(tema, nivel)
+
+# Devuelve, en orden alfabético, los cursos cuyo nombre empieza con el prefijo dado.
+    def buscar_cursos_por_prefijo(self, prefijo, nivel="Todos"):
+        return [
+            curso for curso in self.arbol_cursos.buscar_prefijo(prefijo.lower())
+            if nivel == "Todos" or curso.nivel == nivel
+        ]
+
+# Devuelve, en orden alfabético, los cursos cuyo nombre está entre desde (incluido) y hasta (excluido).
+    def cursos_en_rango(self, desde=None, hasta=None):
+        return self.arbol_cursos.rango(
+            desde.lower() if desde is not None else None,
+            hasta.lower() if hasta is not None else None
+        )
+
+# Listados paginables para las vistas. Retornan secuencias con len() y rebanadas que no copian el
+# índice completo, así una página cuesta lo mismo con diez o con un millón de filas.
+# Estudiantes ordenados por "id" o "nombre"; el filtro es un prefijo del nombre.
+    def listar_estudiantes(self, orden="id", filtro="", descendente=False):
+        if filtro:
+            inicio, fin = self.arbol_estudiantes.posiciones_prefijo(filtro.lower())
+            if orden == "nombre":
+                return self.arbol_estudiantes.tramo(inicio, fin, descendente)
+            coincidencias = sorted(self.arbol_estudiantes.valores[inicio:fin], key=lambda e: e.id)
+            return TramoOrdenado(coincidencias, descendente=descendente)
+        indice = self.arbol_estudiantes if orden == "nombre" else self.ids_estudiantes
+        return indice.tramo(descendente=descendente)
+
+# Cursos ordenados por "id" o "nombre"; el filtro usa el índice de trigramas (subcadena del nombre).
+    def listar_cursos(self, orden="nombre", filtro="", nivel="Todos", descendente=False):
+        if filtro:
+            coincidencias = self.buscar_cursos(filtro, nivel)
+            if orden == "id":
+                coincidencias.sort(key=lambda c: c.id)
+            return TramoOrdenado(coincidencias, descendente=descendente)
+        indice = self.ids_cursos if orden == "id" else self.arbol_cursos
+        if nivel != "Todos":
+            return TramoOrdenado([c for c in indice.valores if c.nivel == nivel], descendente=descendente)
+        return indice.tramo(descendente=descendente)
+
+# Materiales como pares (curso, material), agrupados por curso en el orden de listar_cursos.
+    def listar_materiales(self, curso_id=None, orden="nombre", descendente=False):
+        if curso_id is not None:
+            cursos = [self.cursos[curso_id]] if curso_id in self.cursos else []
+        else:
+            cursos = self.listar_cursos(orden, descendente=descendente)
+        return TramosConcatenados((curso, curso.materiales) for curso in cursos)
+
+# Devuelve una lista de cursos recomendados en orden para alcanzar uno específico.
+    def recomendar_cursos(self, curso_objetivo_id):
+        return self.grafo_cursos.recomendar_ruta_aprendizaje(curso_objetivo_id)
+
+# Devuelve los cursos que tienen a este como prerequisito directo (lo que "desbloquea"), ordenados por id.
+    def desbloquea(self, curso_id):
+        return [self.cursos[i] for i in sorted(self.grafo_cursos.dependientes(curso_id)) if i in self.cursos]
+
+# Planifica la ruta hacia varios cursos objetivo, agrupada en semestres. Si se indica un
+# estudiante, se omiten los cursos que ya tomó.
+    def planificar_ruta(self, objetivos_ids, estudiante_id=None):
+        mascara = 0
+        if estudiante_id in self.estudiantes:
+            mascara = self.estudiantes[estudiante_id].mascara_cursos
+        return self.grafo_cursos.planificar_ruta(objetivos_ids, mascara)
+
+# Establece un curso como prerequisito de otro curso.
+    def establecer_prerequisito(self, curso_id, prerequisito_id):
+        if curso_id in self.cursos and prerequisito_id in self.cursos:
+            if curso_id == prerequisito_id:
+                return False
+
+            if prerequisito_id in self.cursos[curso_id].prerequisitos:
+                return False
+
+            ciclo = self.grafo_cursos.buscar_ciclo(curso_id, prerequisito_id)
+            if ciclo:
+                logger.info("Prerequisito rechazado, formaría el ciclo %s", " -> ".join(map(str, ciclo)))
+                return False
+
+            self.cursos[curso_id].prerequisitos.append(prerequisito_id)
+            self._al_revertir(self.cursos[curso_id].prerequisitos.pop)
+            self.grafo_cursos.agregar_arista(curso_id, prerequisito_id)
+            self._al_revertir(self.grafo_cursos.eliminar_arista, curso_id, prerequisito_id)
+            self.sucios.curso(curso_id)
+
+            logger.debug("Prerequisito establecido - Curso %s ahora requiere %s", curso_id, prerequisito_id)
+
+            self._registrar_cambio("establecer_prerequisito", curso_id, prerequisito_id)
+            self._anotar("establecer_prerequisito", curso_id, prerequisito_id)
+            return True
+        return False
+
+# Establece muchos prerequisitos de una vez: el cierre del grafo se recalcula en un solo recorrido
+# en vez de arista por arista. Retorna los pares rechazados (cursos inexistentes, repetidos o que
+# formarían un ciclo); el resto queda establecido como con establecer_prerequisito.
+    def establecer_prerequisitos(self, pares):
+        rechazados = []
+        nuevos = []
+        vistos = set()
+        for curso_id, prerequisito_id in pares:
+            if (curso_id in self.cursos and prerequisito_id in self.cursos and curso_id != prerequisito_id
+                    and (curso_id, prerequisito_id) not in vistos
+                    and prerequisito_id not in self.cursos[curso_id].prerequisitos):
+                vistos.add((curso_id, prerequisito_id))
+                nuevos.append((curso_id, prerequisito_id))
+            else:
+                rechazados.append((curso_id, prerequisito_id))
+        ciclos = set(self.grafo_cursos.agregar_aristas(nuevos))
+        for curso_id, prerequisito_id in nuevos:
+            if (curso_id, prerequisito_id) in ciclos:
+                rechazados.append((curso_id, prerequisito_id))
+                continue
+            self._al_revertir(self.grafo_cursos.eliminar_arista, curso_id, prerequisito_id)
+            self.cursos[curso_id].prerequisitos.append(prerequisito_id)
+            self._al_revertir(self.cursos[curso_id].prerequisitos.pop)
+            self.sucios.curso(curso_id)
+            self._registrar_cambio("establecer_prerequisito", curso_id, prerequisito_id)
+            self._anotar("establecer_prerequisito", curso_id, prerequisito_id)
+        return rechazados
+
+# Agrega material a un curso específico. Se rechaza si el id ya lo usa otro material, aunque esté eliminado.
+    def agregar_material(self, curso_id, material):
+        if curso_id in self.cursos and material.id not in self.indice_materiales:
+            curso = self.cursos[curso_id]
+            curso.agregar_material(material)
+            self._al_revertir(curso.materiales.quitar, material)
+            self._asignar(self.indice_materiales, material.id, (curso_id, material))
+            self.sucios.curso(curso_id)
+            self._registrar_cambio("agregar_material", curso_id, {
+                "id": material.id,
+                "nombre": material.nombre,
+                "tipo": material.tipo,
+                "url": material.url
+            })
+            return True
+        return False
+
+    def eliminar_prerequisito(self, curso_id, prerequisito_id):
+        if curso_id in self.cursos and prerequisito_id in self.cursos[curso_id].prerequisitos:
+            prerequisitos = self.cursos[curso_id].prerequisitos
+            posicion = prerequisitos.index(prerequisito_id)
+            del prerequisitos[posicion]
+            self._al_revertir(prerequisitos.insert, posicion, prerequisito_id)
+            self.grafo_cursos.eliminar_arista(curso_id, prerequisito_id)
+            self._al_revertir(self.grafo_cursos.agregar_aristas, [(curso_id, prerequisito_id)])
+            self.sucios.curso(curso_id)
+            self._registrar_cambio("eliminar_prerequisito", curso_id, prerequisito_id)
+            self._anotar("eliminar_prerequisito", curso_id, prerequisito_id)
+            return True
+        return False
+
+# Elimina un material de un curso y lo guarda como eliminado. El índice global conserva el curso
+# dueño, así que buscarlo, quitarlo y restaurarlo cuesta O(1).
+    def eliminar_material(self, curso_id, material_id):
+        dueno, material = self.indice_materiales.get(material_id, (None, None))
+        if dueno == curso_id and curso_id in self.cursos and material_id not in self.materiales_eliminados:
+            materiales = self.cursos[curso_id].materiales
+            if self._reversible():
+                self._al_revertir(materiales.insertar, materiales.indice(material), material)
+            materiales.quitar(material)
+            self._asignar(self.materiales_eliminados, material_id, material)
+            self.sucios.curso(curso_id)
+            self._registrar_cambio("eliminar_material", curso_id, material_id)
+            return True
+        return False
+
+# Retorna el id del curso dueño de un material (activo o eliminado), o None si no existe.
+    def curso_de_material(self, material_id):
+        if material_id in self.indice_materiales:
+            return self.indice_materiales[material_id][0]
+        return None
+
+# Elimina un curso del sistema y lo guarda como eliminado. Solo toca a sus vecinos: los cursos que lo
+# tenían como prerequisito se encuentran con el índice inverso del grafo y quedan anotados en
+# prerequisitos_eliminados, para volver a enlazarlos si el curso se restaura.
+    def eliminar_curso(self, curso_id):
+        if curso_id in self.cursos:
+            curso = self._sacar(self.cursos, curso_id)
+            self._asignar(self.cursos_eliminados, curso_id, curso)
+            self._desindexar_curso(curso)
+            self._al_revertir(self._indexar_curso, curso)
+            bit = self.grafo_cursos.bit(curso_id)
+            reversible = self._reversible()
+            for estudiante in curso.estudiantes:
+                if reversible:
+                    self._al_revertir(estudiante.cursos.insertar, estudiante.cursos.indice(curso), curso)
+                    self._al_revertir(setattr, estudiante, "mascara_cursos", estudiante.mascara_cursos)
+                estudiante.cursos.quitar(curso)
+                estudiante.mascara_cursos &= ~bit
+            dependientes = sorted(self.grafo_cursos.dependientes(curso_id))
+            for dependiente_id in dependientes:
+                prerequisitos = self.cursos[dependiente_id].prerequisitos
+                posicion = prerequisitos.index(curso_id)
+                del prerequisitos[posicion]
+                self._al_revertir(prerequisitos.insert, posicion, curso_id)
+                self.sucios.curso(dependiente_id)
+            if dependientes:
+                self._asignar(self.prerequisitos_eliminados, str(curso_id), dependientes)
+            if reversible:
+                aristas = [(curso_id, p) for p in self.grafo_cursos.aristas[curso_id]]
+                self._al_revertir(self.grafo_cursos.agregar_aristas, aristas + [(d, curso_id) for d in dependientes])
+                self._al_revertir(self.grafo_cursos.agregar_vertice, curso)
+            self.grafo_cursos.eliminar_vertice(curso_id)
+            self.sucios.curso(curso_id)
+            self._registrar_cambio("eliminar_curso", curso_id)
+            self._anotar("eliminar_curso", curso_id)
+            return True
+        return False
+
+# Elimina un estudiante del sistema.
+    def eliminar_estudiante(self, estudiante_id):
+        if estudiante_id in self.estudiantes:
+            estudiante = self._sacar(self.estudiantes, estudiante_id)
+            self._desindexar_estudiante(estudiante)
+            self._al_revertir(self._indexar_estudiante, estudiante)
+            reversible = self._reversible()
+            for curso in estudiante.cursos:
+                if reversible:
+                    self._al_revertir(curso.estudiantes.insertar, curso.estudiantes.indice(estudiante), estudiante)
+                curso.estudiantes.quitar(estudiante)
+                self.sucios.curso(curso.id)
+            esperas = self._sacar(self.esperas_estudiante, estudiante_id) if estudiante_id in self.esperas_estudiante else ()
+            for curso_id in esperas:
+                espera = self.lista_espera[curso_id]
+                if estudiante_id in espera:
+                    prioridad, turno = espera.turnos[estudiante_id]
+                    self._al_revertir(espera.reponer, estudiante_id, prioridad, turno, espera.atendidos[prioridad])
+                    espera.retirar(estudiante_id)
+                    self.sucios.curso(curso_id)
+            self.sucios.estudiante(estudiante_id)
+            self._registrar_cambio("eliminar_estudiante", estudiante_id)
+            return True
+        return False
+
+# Restaura un curso eliminado previamente, con sus prerequisitos y los cursos que dependían de él.
+# Un prerequisito que sigue eliminado se anota para enlazarlo cuando se restaure, y un enlace que
+# ahora formaría un ciclo se descarta.
+    def restaurar_curso(self, curso_id):
+        if curso_id in self.cursos_eliminados and curso_id not in self.cursos:
+            curso = self._sacar(self.cursos_eliminados, curso_id)
+            self._asignar(self.cursos, curso_id, curso)
+            if curso_id not in self.lista_espera:
+                self._asignar(self.lista_espera, curso_id, ListaEspera())
+            self._indexar_curso(curso)
+            self._al_revertir(self._desindexar_curso, curso)
+            self.grafo_cursos.agregar_vertice(curso)
+            self._al_revertir(self.grafo_cursos.eliminar_vertice, curso_id)
+            self._al_revertir(setattr, curso, "prerequisitos", curso.prerequisitos)
+            prerequisitos, curso.prerequisitos = curso.prerequisitos, []
+            for prereq_id in prerequisitos:
+                if prereq_id in self.cursos:
+                    if self.grafo_cursos.agregar_arista(curso_id, prereq_id):
+                        curso.prerequisitos.append(prereq_id)
+                elif prereq_id in self.cursos_eliminados:
+                    pendientes = self.prerequisitos_eliminados.get(str(prereq_id), [])
+                    if curso_id not in pendientes:
+                        self._asignar(self.prerequisitos_eliminados, str(prereq_id), pendientes + [curso_id])
+            self._reenlazar_dependientes(curso_id)
+            inscritos = [e for e in curso.estudiantes if self.estudiantes.get(e.id) is e]
+            self._al_revertir(setattr, curso, "estudiantes", curso.estudiantes)
+            curso.estudiantes = ConjuntoOrdenado()
+            for estudiante in inscritos:
+                self._vincular(estudiante.id, curso_id)
+            self.sucios.curso(curso_id)
+            self._registrar_cambio("restaurar_curso", curso_id)
+            self._anotar("restaurar_curso", curso_id)
+            return True
+        return False
+
+# Vuelve a enlazar los cursos anotados en prerequisitos_eliminados como dependientes de un curso activo.
+# Un enlace que ahora formaría un ciclo se descarta.
+    def _reenlazar_dependientes(self, curso_id):
+        if str(curso_id) not in self.prerequisitos_eliminados:
+            return
+        for dependiente_id in self._sacar(self.prerequisitos_eliminados, str(curso_id)):
+            dependiente = self.cursos.get(dependiente_id)
+            if dependiente is None or curso_id in dependiente.prerequisitos:
+                continue
+            if self.grafo_cursos.agregar_arista(dependiente_id, curso_id):
+                self._al_revertir(self.grafo_cursos.eliminar_arista, dependiente_id, curso_id)
+                dependiente.prerequisitos.append(curso_id)
+                self._al_revertir(dependiente.prerequisitos.pop)
+                self.sucios.curso(dependiente_id)
+            else:
+                logger.info("Prerequisito %s -> %s no restaurado porque forma un ciclo", dependiente_id, curso_id)
+
+# Restaura un material eliminado en su curso original. Si el curso también está eliminado, el material
+# vuelve a él y reaparece cuando se restaure el curso. Sin curso conocido no se puede restaurar.
+    def restaurar_material(self, material_id):
+        if material_id in self.materiales_eliminados:
+            curso_id, material = self.indice_materiales[material_id]
+            curso = self.cursos.get(curso_id) or self.cursos_eliminados.get(curso_id)
+            if curso is None:
+                return False
+            self._sacar(self.materiales_eliminados, material_id)
+            curso.agregar_material(material)
+            self._al_revertir(curso.materiales.quitar, material)
+            self.sucios.curso(curso_id)
+            self._registrar_cambio("restaurar_material", material_id)
+            return True
+        return False
+
+# Cambia el nombre, el tipo o la URL de un material, activo o eliminado; lo que se pase como None queda igual.
+    def actualizar_material(self, material_id, nombre=None, tipo=None, url=None):
+        if material_id not in self.indice_materiales:
+            return False
+        curso_id, material = self.indice_materiales[material_id]
+        self._al_revertir(setattr, material, "url", material.url)
+        self._al_revertir(setattr, material, "tipo", material.tipo)
+        self._al_revertir(setattr, material, "nombre", material.nombre)
+        if nombre is not None:
+            material.nombre = nombre
+        if tipo is not None:
+            material.tipo = sys.intern(tipo)
+        if url is not None:
+            material.url = url
+        if curso_id is not None:
+            self.sucios.curso(curso_id)
+        self._registrar_cambio("actualizar_material", material_id, material.nombre, material.tipo, material.url)
+        return True
+
+# Vuelve a enlazar los cursos que tenían como prerequisito a un curso eliminado. Si el curso sigue
+# eliminado se restaura completo, lo que también enlaza a sus dependientes; si ya no existe, la
+# anotación solo se descarta.
+    def restaurar_prerequisito(self, prerequisito):
+        if str(prerequisito) not in self.prerequisitos_eliminados:
+            return False
+        curso_id = int(prerequisito)
+        if curso_id in self.cursos_eliminados:
+            return self.restaurar_curso(curso_id)
+        if curso_id in self.cursos:
+            self._reenlazar_dependientes(curso_id)
+        else:
+            self._sacar(self.prerequisitos_eliminados, str(prerequisito))
+        self._registrar_cambio("restaurar_prerequisito", str(prerequisito))
+        return True
+
+
+# Envuelve un método público para contar sus llamadas y medir su latencia.
+def _medido(nombre, metodo):
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            self._metricas.registrar(nombre, time.perf_counter() - inicio)
+    return envoltura
+
+# Métodos que modifican el estado. Con datos compartidos entre procesos, cada llamada suelta corre como
+# una transacción, que toma el cerrojo y se pone al día con el diario antes de validar la operación.
+MUTADORES = (
+    "crear_curso", "registrar_estudiante", "inscribir_estudiante", "inscribir_cohorte", "cancelar_inscripcion",
+    "establecer_prerequisito", "establecer_prerequisitos", "agregar_material", "actualizar_material",
+    "eliminar_prerequisito", "eliminar_material", "eliminar_curso", "eliminar_estudiante", "restaurar_curso",
+    "restaurar_material", "restaurar_prerequisito", "deshacer_ultima_accion", "rehacer_ultima_accion",
+    "guardar_en_json"
+)
+
+
+def _coordinado(metodo):
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        if self.cerrojo is None or self.cerrojo.tomado:
+            return metodo(self, *args, **kwargs)
+        with self.transaccion(reversible=False):
+            return metodo(self, *args, **kwargs)
+    return envoltura
+
+for _nombre in MUTADORES:
+    setattr(SistemaELearning, _nombre, _coordinado(getattr(SistemaELearning, _nombre)))
+
+# Instrumenta todos los métodos públicos del sistema, salvo los que no son llamadas normales.
+for _nombre, _metodo in list(vars(SistemaELearning).items()):
+    if callable(_metodo) and not _nombre.startswith("_") and _nombre not in ("transaccion", "metricas", "volcar_metricas"):
+        setattr(SistemaELearning, _nombre, _medido(_nombre, _metodo))
+del _nombre, _metodo
@@ -0,0 +1,90 @@
+# Pruebas de recarga: lo que queda en memoria después de una secuencia de cambios tiene que ser lo mismo
+# que se lee al volver a abrir la carpeta de datos, en cada formato de guardado.
+#
+# Uso: python -m unittest discover -s tests
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from elearning import AlmacenSQLite, Material, SistemaELearning
+from elearning.persistencia import ARCHIVO_JSON, ARCHIVO_SQLITE
+
+FORMATOS = ("json", "binario", "fragmentado", "sqlite")
+
+
+# Foto comparable del estado: prerequisitos y materiales de cursos activos y eliminados.
+def estado(sistema):
+    def resumen(cursos):
+        return {
+            id: (sorted(c.prerequisitos), sorted(m.id for m in c.materiales), sorted(e.id for e in c.estudiantes))
+            for id, c in cursos.items()
+        }
+    return resumen(sistema.cursos), resumen(sistema.cursos_eliminados)
+
+
+class PruebaRecarga(unittest.TestCase):
+# Cada caso usa una carpeta de datos propia, que se borra al terminar la prueba.
+    def carpeta_nueva(self):
+        self.directorio = tempfile.mkdtemp(prefix="elearning_prueba_")
+        self.addCleanup(shutil.rmtree, self.directorio, ignore_errors=True)
+
+    def abrir(self, formato):
+        if formato == "sqlite":
+            almacen = AlmacenSQLite(os.path.join(self.directorio, ARCHIVO_SQLITE))
+            self.addCleanup(almacen.cerrar)
+            return SistemaELearning(almacen=almacen, directorio_datos=self.directorio)
+        return SistemaELearning(directorio_datos=self.directorio, formato=formato)
+
+# El id de un curso eliminado no se puede volver a usar: la copia eliminada, con sus prerequisitos y
+# materiales, tiene que sobrevivir a la recarga tanto desde el diario como desde el checkpoint.
+    def test_no_reutiliza_id_de_curso_eliminado(self):
+        for formato in FORMATOS:
+            for checkpoint in (False, True):
+                with self.subTest(formato=formato, checkpoint=checkpoint):
+                    self.carpeta_nueva()
+                    sistema = self.abrir(formato)
+                    sistema.agregar_material(202, Material(9, "Guía", "PDF", "https://example.com/guia"))
+                    self.assertTrue(sistema.eliminar_curso(202))
+                    self.assertIsNone(sistema.crear_curso(202, "Nuevo", "Otro curso", "Básico"))
+                    if checkpoint:
+                        sistema.guardar_en_json()
+                    antes = estado(sistema)
+                    self.assertNotIn(202, antes[0])
+                    self.assertEqual(antes[1][202][:2], ([201], [9]))
+                    self.assertEqual(estado(self.abrir(formato)), antes)
+
+# Un JSON anterior con un curso activo y uno eliminado del mismo id carga solo el activo, con sus
+# propias filas, y lo mismo después de pasarlo a cada formato.
+    def test_json_anterior_con_id_repetido(self):
+        for formato in FORMATOS:
+            with self.subTest(formato=formato):
+                self.carpeta_nueva()
+                datos = {
+                    "estudiantes": [{"id": 1, "nombre": "Ana", "email": "ana@example.com", "cursos": []}],
+                    "cursos": [
+                        {"id": 1, "nombre": "Base", "descripcion": "", "nivel": "Básico", "prerequisitos": [],
+                         "materiales": [], "estudiantes": []},
+                        {"id": 2, "nombre": "Nuevo", "descripcion": "", "nivel": "Básico", "prerequisitos": [],
+                         "materiales": [], "estudiantes": []},
+                    ],
+                    "cursos_eliminados": [
+                        {"id": 2, "nombre": "Viejo", "descripcion": "", "nivel": "Básico", "prerequisitos": [1],
+                         "materiales": [{"id": 9, "nombre": "Guía", "tipo": "PDF", "url": "u"}], "estudiantes": [1]},
+                    ],
+                }
+                with open(os.path.join(self.directorio, ARCHIVO_JSON), "w", encoding="utf-8") as f:
+                    json.dump(datos, f)
+                with self.assertLogs("elearning", "WARNING"):
+                    sistema = self.abrir(formato)
+                sistema.guardar_en_json()
+                esperado = ({1: ([], [], []), 2: ([], [], [])}, {})
+                self.assertEqual(estado(sistema), esperado)
+                self.assertEqual(sistema.cursos[2].nombre, "Nuevo")
+                self.assertEqual(estado(self.abrir(formato)), esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# Pruebas de transacciones: un bloque que falla deja el estado en memoria como estaba al entrar, también
+# cuando es un punto de guardado dentro de otra transacción, y lo que sí se confirmó llega al disco.
+#
+# Uso: python -m unittest discover -s tests
+
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from elearning import Material, SistemaELearning
+
+
+# Foto comparable del estado: los datos exportados (las tablas por id ordenadas por id, porque un elemento
+# que vuelve al revertir queda al final del diccionario, y sin la secuencia del diario, que avanza al
+# confirmar), el historial, el grafo, los índices y las esperas.
+def foto(sistema):
+    datos = sistema._exportar_datos()
+    del datos["secuencia_diario"]
+    for clave in ("estudiantes", "cursos", "cursos_eliminados", "materiales_eliminados"):
+        datos[clave] = sorted(datos[clave], key=lambda fila: fila["id"])
+    return {
+        "datos": datos,
+        "historial": sistema.historial_cambios.estado(),
+        "mascaras": {e.id: e.mascara_cursos for e in sistema.estudiantes.values()},
+        "cierre": dict(sistema.grafo_cursos.cierre),
+        "estudiantes_por_id": [e.id for e in sistema.listar_estudiantes()],
+        "cursos_por_id": [c.id for c in sistema.listar_cursos(orden="id")],
+        "busqueda": [c.id for c in sistema.buscar_cursos("python")],
+        "turnos": {c: dict(espera.turnos) for c, espera in sistema.lista_espera.items()},
+        "esperas": {e: set(cursos) for e, cursos in sistema.esperas_estudiante.items()},
+    }
+
+
+class PruebaTransacciones(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp(prefix="elearning_prueba_")
+        self.addCleanup(shutil.rmtree, self.directorio, ignore_errors=True)
+        self.sistema = SistemaELearning(directorio_datos=self.directorio)
+
+# Cambios que pasan por casi todas las mutaciones: altas, bajas, restauraciones, lista de espera,
+# prerequisitos, materiales y deshacer.
+    def cambios(self, sistema):
+        sistema.cancelar_inscripcion(3, 101)
+        sistema.eliminar_estudiante(1)
+        sistema.eliminar_material(101, 2)
+        sistema.actualizar_material(1, nombre="Guía nueva", url="https://example.com/nueva")
+        sistema.eliminar_material(101, 3)
+        sistema.restaurar_material(3)
+        sistema.eliminar_prerequisito(301, 102)
+        sistema.eliminar_curso(201)
+        sistema.restaurar_curso(201)
+        sistema.eliminar_curso(102)
+        sistema.crear_curso(402, "Python Científico", "NumPy y pandas", "Intermedio")
+        sistema.registrar_estudiante(5, "Elena Ruiz", "elena@example.com")
+        sistema.establecer_prerequisitos([(402, 101)])
+        sistema.inscribir_estudiante(5, 101)
+        sistema.deshacer_ultima_accion()
+
+    def test_punto_de_guardado_anidado(self):
+        sistema = self.sistema
+        with sistema.transaccion():
+            sistema.registrar_estudiante(4, "Diego Sanz", "diego@example.com")
+            for estudiante_id in (1, 3):
+                sistema.inscribir_estudiante(estudiante_id, 101, capacidad_maxima=2)
+            sistema.inscribir_estudiante(2, 101, capacidad_maxima=2)
+            sistema.inscribir_estudiante(4, 101, capacidad_maxima=2, prioridad=1)
+            sistema.inscribir_estudiante(1, 201)
+            for material_id in (1, 2, 3):
+                sistema.agregar_material(101, Material(material_id, f"Guía {material_id}", "PDF", "https://example.com"))
+            sistema.crear_curso(401, "Redes", "Redes de computadoras", "Básico")
+            sistema.establecer_prerequisito(401, 201)
+            antes = foto(sistema)
+
+            with self.assertRaises(ValueError):
+                with sistema.transaccion():
+                    self.cambios(sistema)
+                    # Un punto de guardado confirmado dentro del que falla también se revierte.
+                    with sistema.transaccion():
+                        sistema.eliminar_estudiante(2)
+                        sistema.eliminar_curso(401)
+                    raise ValueError("falla a propósito")
+            self.assertEqual(foto(sistema), antes)
+
+            sistema.crear_curso(403, "Seguridad", "Seguridad informática", "Avanzado")
+            antes = foto(sistema)
+
+        self.assertEqual(foto(sistema), antes)
+        recargado = foto(SistemaELearning(directorio_datos=self.directorio))
+        self.assertEqual(recargado["datos"], antes["datos"])
+
+# Una transacción externa que falla revierte también lo hecho en bloques no reversibles dentro de ella,
+# y entrar no exporta el estado completo.
+    def test_revierte_transaccion_externa(self):
+        sistema = self.sistema
+        sistema.agregar_material(101, Material(1, "Guía", "PDF", "https://example.com"))
+        sistema.inscribir_estudiante(3, 101)
+        antes = foto(sistema)
+        with mock.patch.object(SistemaELearning, "_exportar_datos", side_effect=AssertionError("copia completa")):
+            with self.assertRaises(ValueError):
+                with sistema.transaccion():
+                    with sistema.transaccion(reversible=False):
+                        sistema.registrar_estudiante(4, "Diego Sanz", "diego@example.com")
+                        sistema.inscribir_estudiante(4, 101)
+                    sistema.eliminar_curso(101)
+                    raise ValueError("falla a propósito")
+        self.assertIsNone(sistema._transaccion)
+        self.assertEqual(foto(sistema), antes)
+
+
+if __name__ == "__main__":
+    unittest.main()